@@ -5,6 +5,7 @@ Provides mock Supabase client and test fixtures.
 """
 
 import asyncio
+import hashlib
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 from unittest.mock import AsyncMock, MagicMock, Mock
@@ -44,6 +45,7 @@ def mock_supabase_client():
             query_builder.delete = Mock(return_value=query_builder)
             query_builder.eq = Mock(return_value=query_builder)
             query_builder.is_ = Mock(return_value=query_builder)
+            query_builder.in_ = Mock(return_value=query_builder)
             query_builder.limit = Mock(return_value=query_builder)
             query_builder.offset = Mock(return_value=query_builder)
             query_builder.order = Mock(return_value=query_builder)
@@ -205,7 +207,8 @@ def sample_invitation_data(sample_org_id, sample_role_id):
         "email": "invited@example.com",
         "role_id": str(sample_role_id),
         "invited_by": str(uuid4()),
-        "token": "test-token-123",
+        "token": None,
+        "token_hash": hashlib.sha256(b"test-token-123").hexdigest(),
         "expires_at": (datetime.utcnow() + timedelta(days=7)).isoformat(),
         "accepted_at": None,
         "accepted_by": None,
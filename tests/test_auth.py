@@ -3,6 +3,7 @@ Tests for vault.auth module.
 """
 
 import pytest
+import time
 from datetime import datetime
 from unittest.mock import AsyncMock, Mock
 from uuid import UUID, uuid4
@@ -328,6 +329,39 @@ class TestSessionManager:
         
         assert user is None
 
+    @pytest.mark.asyncio
+    async def test_get_user_from_token_local_jwt(self, vault, sample_user_data):
+        """Test tokens are verified locally when a JWT secret is configured."""
+        import jwt
+
+        secret = "test-jwt-secret-with-at-least-32-bytes"
+        vault.config = vault.config.model_copy(update={"jwt_secret": secret})
+        vault.client._client.auth.get_user = AsyncMock()
+
+        mock_result = Mock()
+        mock_result.data = [sample_user_data]
+        query_builder = vault.client.table("vault_users")
+        query_builder.execute = AsyncMock(return_value=mock_result)
+
+        token = jwt.encode(
+            {"sub": str(sample_user_data["supabase_auth_id"]), "exp": int(time.time()) + 3600},
+            secret,
+            algorithm="HS256",
+        )
+        user = await vault.sessions.get_user_from_token(token)
+
+        assert user.email == sample_user_data["email"]
+        query_builder.eq.assert_called_with("supabase_auth_id", str(sample_user_data["supabase_auth_id"]))
+        vault.client._client.auth.get_user.assert_not_called()
+
+        expired = jwt.encode(
+            {"sub": str(sample_user_data["supabase_auth_id"]), "exp": int(time.time()) - 60},
+            secret,
+            algorithm="HS256",
+        )
+        assert await vault.sessions.get_user_from_token(expired) is None
+        vault.client._client.auth.get_user.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_sign_out(self, vault):
         """Test signing out."""
@@ -36,6 +36,7 @@ class TestVault:
         with patch('vault.client.VaultSupabaseClient.create', return_value=mock_vault_supabase_client):
             with patch('vault.migrations.manager.MigrationManager') as mock_migration:
                 mock_manager = AsyncMock()
+                mock_manager.is_current = AsyncMock(return_value=False)
                 mock_migration.return_value = mock_manager
                 
                 vault = await Vault.create(
@@ -46,6 +47,23 @@ class TestVault:
                 
                 mock_manager.migrate.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_vault_create_auto_migrate_current(self, mock_vault_supabase_client):
+        """Test auto_migrate skips the migration run when the latest one is already applied."""
+        with patch('vault.client.VaultSupabaseClient.create', return_value=mock_vault_supabase_client):
+            with patch('vault.migrations.manager.MigrationManager') as mock_migration:
+                mock_manager = AsyncMock()
+                mock_manager.is_current = AsyncMock(return_value=True)
+                mock_migration.return_value = mock_manager
+
+                await Vault.create(
+                    supabase_url="https://test.supabase.co",
+                    supabase_key="test-key-12345678901234567890",
+                    auto_migrate=True
+                )
+
+                mock_manager.migrate.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_vault_initialization(self, vault):
         """Test Vault instance initialization."""
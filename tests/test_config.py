@@ -129,6 +129,31 @@ class TestVaultConfig:
         assert config.auto_migrate is True
         assert config.debug is True
 
+    def test_config_http_pool_defaults(self):
+        """Test HTTP connection pool defaults."""
+        config = VaultConfig(
+            supabase_url="https://test.supabase.co",
+            supabase_key="test-key-12345678901234567890"
+        )
+        assert config.http2 is True
+        assert config.http_max_connections == 40
+        assert config.http_max_keepalive_connections == 20
+        assert config.http_keepalive_expiry == 60
+
+    @patch.dict(os.environ, {
+        "VAULT_SUPABASE_URL": "https://env.supabase.co",
+        "VAULT_SUPABASE_KEY": "env-key-12345678901234567890",
+        "VAULT_HTTP2": "false",
+        "VAULT_HTTP_MAX_CONNECTIONS": "10",
+        "VAULT_HTTP_KEEPALIVE_EXPIRY": "5",
+    })
+    def test_config_http_pool_from_environment(self):
+        """Test loading HTTP connection pool settings from environment."""
+        config = VaultConfig()
+        assert config.http2 is False
+        assert config.http_max_connections == 10
+        assert config.http_keepalive_expiry == 5
+
     def test_config_kwargs_override_env(self):
         """Test that kwargs override environment variables."""
         with patch.dict(os.environ, {
@@ -181,3 +206,50 @@ class TestLoadConfig:
         # Should still use env for key
         assert config.supabase_key == "env-key-12345678901234567890"
 
+
+    @patch.dict(os.environ, {
+        "VAULT_SUPABASE_URL": "https://env.supabase.co",
+        "VAULT_SUPABASE_KEY": "env-key-12345678901234567890"
+    })
+    def test_load_config_cached(self):
+        """Test load_config reuses the config until arguments or environment change."""
+        load_config.cache_clear()
+        config = load_config()
+        assert load_config() is config
+        assert load_config(debug=True) is not config
+
+        os.environ["VAULT_SUPABASE_URL"] = "https://changed.supabase.co"
+        assert load_config().supabase_url == "https://changed.supabase.co"
+
+    def test_load_config_frozen(self):
+        """Test a shared config can't be mutated by one caller."""
+        config = load_config(
+            supabase_url="https://test.supabase.co",
+            supabase_key="test-key-12345678901234567890"
+        )
+        with pytest.raises(ValidationError):
+            config.auto_migrate = True
+
+        assert config.model_copy(update={"auto_migrate": True}).auto_migrate is True
+        assert config.auto_migrate is False
+
+    def test_load_config_reloads_changed_env_file(self, tmp_path, monkeypatch):
+        """Test load_config picks up edits to the .env file."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("VAULT_SUPABASE_URL", raising=False)
+        monkeypatch.delenv("VAULT_SUPABASE_KEY", raising=False)
+        load_config.cache_clear()
+
+        env_file = tmp_path / ".env"
+        env_file.write_text(
+            "VAULT_SUPABASE_URL=https://first.supabase.co\n"
+            "VAULT_SUPABASE_KEY=file-key-12345678901234567890\n"
+        )
+        assert load_config().supabase_url == "https://first.supabase.co"
+
+        env_file.write_text(
+            "VAULT_SUPABASE_URL=https://second.supabase.co\n"
+            "VAULT_SUPABASE_KEY=file-key-12345678901234567890\n"
+        )
+        os.utime(env_file, ns=(0, env_file.stat().st_mtime_ns + 1_000_000))
+        assert load_config().supabase_url == "https://second.supabase.co"
@@ -0,0 +1,153 @@
+"""
+Tests for vault.decorators module.
+"""
+
+import asyncio
+import base64
+import json
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+from vault.auth.models import VaultUser
+from vault.decorators import (
+    RequireAuth,
+    invalidate_token,
+    require_auth,
+    require_org_member,
+    require_permission,
+)
+
+
+def make_token(exp: float) -> str:
+    """Build an unsigned JWT-shaped token with an exp claim."""
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode()).rstrip(b"=")
+    return f"header.{payload.decode()}.signature"
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    invalidate_token()
+    yield
+    invalidate_token()
+
+
+class TestRequireAuth:
+    """Tests for require_auth token caching."""
+
+    @pytest.mark.asyncio
+    async def test_token_validated_once(self, vault, sample_user_data):
+        """Test repeat calls with the same token reuse the validated user."""
+        user = VaultUser(**sample_user_data)
+        vault.sessions.get_user_from_token = AsyncMock(return_value=user)
+
+        @require_auth(vault=vault)
+        async def route(authorization: str, user: VaultUser = None):
+            return user
+
+        token = make_token(time.time() + 3600)
+        assert await route(authorization=f"Bearer {token}") == user
+        assert await route(authorization=f"Bearer {token}") == user
+        vault.sessions.get_user_from_token.assert_awaited_once_with(token)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_validation_shared(self, vault, sample_user_data):
+        """Test concurrent calls with a cold token share one validation."""
+        user = VaultUser(**sample_user_data)
+
+        async def get_user_from_token(token):
+            await asyncio.sleep(0.01)
+            return user
+
+        vault.sessions.get_user_from_token = AsyncMock(side_effect=get_user_from_token)
+        require = RequireAuth(vault)
+
+        token = make_token(time.time() + 3600)
+        results = await asyncio.gather(*(require.dependency(token) for _ in range(5)))
+        assert results == [user] * 5
+        vault.sessions.get_user_from_token.assert_awaited_once_with(token)
+
+    @pytest.mark.asyncio
+    async def test_invalid_token_not_cached(self, vault):
+        """Test rejected tokens are checked again on the next call."""
+        vault.sessions.get_user_from_token = AsyncMock(return_value=None)
+        require = RequireAuth(vault)
+
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Invalid or expired token"):
+                await require.dependency("Bearer bad-token")
+        assert vault.sessions.get_user_from_token.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_token_not_cached(self, vault, sample_user_data):
+        """Test tokens past their exp claim are never served from cache."""
+        user = VaultUser(**sample_user_data)
+        vault.sessions.get_user_from_token = AsyncMock(return_value=user)
+        require = RequireAuth(vault)
+
+        token = make_token(time.time() - 1)
+        await require.dependency(token)
+        await require.dependency(token)
+        assert vault.sessions.get_user_from_token.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_token(self, vault, sample_user_data):
+        """Test invalidating a token forces it to be validated again."""
+        user = VaultUser(**sample_user_data)
+        vault.sessions.get_user_from_token = AsyncMock(return_value=user)
+        require = RequireAuth(vault)
+
+        token = make_token(time.time() + 3600)
+        await require.dependency(token)
+        invalidate_token(token, vault)
+        await require.dependency(token)
+        assert vault.sessions.get_user_from_token.await_count == 2
+
+
+class TestRequirePermission:
+    """Tests for the permission decorators."""
+
+    @pytest.mark.asyncio
+    async def test_string_org_id_parsed(self, vault, sample_user_data, sample_org_id):
+        """Test a string organization ID is converted to a UUID."""
+        vault.permissions.check_all = AsyncMock(return_value=True)
+
+        @require_permission("posts:write", vault=vault)
+        async def route(user=None, organization_id=None):
+            return "ok"
+
+        user = VaultUser(**sample_user_data)
+        assert await route(user=user, organization_id=str(sample_org_id)) == "ok"
+        vault.permissions.check_all.assert_awaited_once_with(
+            user_id=user.id,
+            organization_id=sample_org_id,
+            permissions=["posts:write"],
+        )
+
+    @pytest.mark.asyncio
+    async def test_permission_denied(self, vault, sample_user_data, sample_org_id):
+        """Test a failed check raises PermissionError."""
+        vault.permissions.check_any = AsyncMock(return_value=False)
+
+        @require_permission(["admin:*", "owner:*"], vault=vault, require_all=False)
+        async def route(user=None, organization_id=None):
+            return "ok"
+
+        with pytest.raises(PermissionError, match="admin:\\*, owner:\\*"):
+            await route(user=VaultUser(**sample_user_data), organization_id=sample_org_id)
+
+    @pytest.mark.asyncio
+    async def test_vault_from_kwargs(self, vault, sample_user_data, sample_org_id):
+        """Test the Vault instance can be passed to the call instead."""
+        vault.permissions.is_member = AsyncMock(return_value=True)
+
+        @require_org_member()
+        async def route(user=None, organization_id=None, vault=None):
+            return "ok"
+
+        user = VaultUser(**sample_user_data)
+        assert await route(user=user, organization_id=sample_org_id, vault=vault) == "ok"
+
+        with pytest.raises(ValueError, match="Vault instance not provided"):
+            await route(user=user, organization_id=sample_org_id)
@@ -0,0 +1,150 @@
+"""
+Tests for vault.integrations module.
+"""
+
+import time
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+fastapi = pytest.importorskip("fastapi")
+httpx = pytest.importorskip("httpx")
+
+from fastapi import Depends, FastAPI, Request
+
+from vault.auth.models import VaultUser
+from vault.decorators import invalidate_token
+from vault.integrations.fastapi import VaultFastAPI, get_current_user, get_vault
+
+from .test_decorators import make_token
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    invalidate_token()
+    yield
+    invalidate_token()
+
+
+@pytest.fixture
+async def integration(vault):
+    """VaultFastAPI set up with the mocked Vault."""
+    vault_integration = VaultFastAPI()
+    with patch("vault.integrations.fastapi.Vault.create", AsyncMock(return_value=vault)):
+        await vault_integration.setup()
+    return vault_integration
+
+
+def make_client(app: FastAPI) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+class TestVaultFastAPI:
+    """Tests for the FastAPI dependencies."""
+
+    @pytest.mark.asyncio
+    async def test_require_auth_caches_token(self, vault, integration, sample_user_data):
+        """Test the authenticated user is stored on the request and the token validated once."""
+        user = VaultUser(**sample_user_data)
+        vault.sessions.get_user_from_token = AsyncMock(return_value=user)
+
+        app = FastAPI()
+
+        @app.get("/me", dependencies=[Depends(integration.require_auth())])
+        async def me(request: Request, current=Depends(get_current_user)):
+            return {"email": current.email, "state": request.state.vault_user.email}
+
+        token = make_token(time.time() + 3600)
+        async with make_client(app) as client:
+            for _ in range(2):
+                response = await client.get("/me", headers={"Authorization": f"Bearer {token}"})
+                assert response.status_code == 200
+                assert response.json() == {"email": user.email, "state": user.email}
+
+        vault.sessions.get_user_from_token.assert_awaited_once_with(token)
+
+    @pytest.mark.asyncio
+    async def test_require_auth_rejects_missing_token(self, integration):
+        """Test requests without a bearer token get a 401."""
+        app = FastAPI()
+
+        @app.get("/me")
+        async def me(user=Depends(integration.require_auth())):
+            return {"email": user.email}
+
+        async with make_client(app) as client:
+            response = await client.get("/me")
+
+        assert response.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_get_current_user_unauthenticated(self):
+        """Test get_current_user returns None when no require_* dependency ran."""
+        app = FastAPI()
+
+        @app.get("/me")
+        async def me(user=Depends(get_current_user)):
+            return {"user": user}
+
+        async with make_client(app) as client:
+            response = await client.get("/me")
+
+        assert response.json() == {"user": None}
+
+    def test_dependencies_memoized(self):
+        """Test factories return the same dependency for the same arguments."""
+        vault_integration = VaultFastAPI()
+
+        assert vault_integration.require_auth() is vault_integration.require_auth()
+        assert vault_integration.require_permission("posts:write") is vault_integration.require_permission("posts:write")
+        assert vault_integration.require_permission("posts:write") is not vault_integration.require_permission("posts:read")
+        assert vault_integration.require_role("Admin") is not vault_integration.require_role("Admin", any_role=False)
+        assert vault_integration.require(roles=["Admin"]) is vault_integration.require(roles=["Admin"])
+
+    @pytest.mark.asyncio
+    async def test_require_role_all_roles(self, vault, integration, sample_user_data, sample_org_id):
+        """Test require_role(any_role=False) requires every role via check_access."""
+        user = VaultUser(**sample_user_data)
+        vault.sessions.get_user_from_token = AsyncMock(return_value=user)
+        vault.permissions.check_access = AsyncMock(return_value=False)
+
+        app = FastAPI()
+
+        @app.get("/orgs/{org_id}/settings")
+        async def settings(org_id: str, user=Depends(integration.require_role("Admin", "Owner", any_role=False))):
+            return {"ok": True}
+
+        token = make_token(time.time() + 3600)
+        async with make_client(app) as client:
+            response = await client.get(
+                f"/orgs/{sample_org_id}/settings", headers={"Authorization": f"Bearer {token}"}
+            )
+
+        assert response.status_code == 403
+        vault.permissions.check_access.assert_awaited_once_with(
+            user.id, sample_org_id, roles=["Admin", "Owner"], all_roles=True
+        )
+
+    @pytest.mark.asyncio
+    async def test_lifespan_wraps_app_lifespan(self, vault):
+        """Test the app's own lifespan still runs, with Vault ready, and Vault is closed on shutdown."""
+        vault.close = AsyncMock()
+        events = []
+
+        @asynccontextmanager
+        async def app_lifespan(app):
+            events.append(("startup", get_vault() is vault))
+            yield
+            events.append(("shutdown", vault.close.await_count))
+
+        app = FastAPI(lifespan=app_lifespan)
+        with patch("vault.integrations.fastapi.Vault.create", AsyncMock(return_value=vault)):
+            vault_integration = VaultFastAPI(app)
+            async with app.router.lifespan_context(app):
+                assert vault_integration.vault is vault
+
+        assert events == [("startup", True), ("shutdown", 0)]
+        vault.close.assert_awaited_once()
+        with pytest.raises(RuntimeError):
+            get_vault()
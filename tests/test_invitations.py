@@ -2,12 +2,18 @@
 Tests for vault.invitations module.
 """
 
+import hashlib
+
 import pytest
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, Mock
 from uuid import UUID, uuid4
 
+from postgrest.exceptions import APIError
+from postgrest.types import CountMethod, ReturnMethod
+
 from vault.invitations.invites import InvitationManager
+from vault.invitations.models import VaultInvitation
 
 
 class TestInvitationManager:
@@ -16,25 +22,6 @@ class TestInvitationManager:
     @pytest.mark.asyncio
     async def test_create_invitation(self, vault, sample_org_id, sample_role_id, sample_org_data):
         """Test creating an invitation."""
-        # Mock org get
-        mock_org_result = Mock()
-        mock_org_result.data = [sample_org_data]
-        
-        query_builder = vault.client.table("vault_organizations")
-        query_builder.select.return_value = query_builder
-        query_builder.eq.return_value = query_builder
-        query_builder.execute = AsyncMock(return_value=mock_org_result)
-        
-        # Mock user check (no existing user)
-        mock_user_result = Mock()
-        mock_user_result.data = []
-        
-        query_builder = vault.client.table("vault_users")
-        query_builder.select.return_value = query_builder
-        query_builder.eq.return_value = query_builder
-        query_builder.execute = AsyncMock(return_value=mock_user_result)
-        
-        # Mock invitation insert
         invitation_data = {
             "id": str(uuid4()),
             "organization_id": str(sample_org_id),
@@ -47,31 +34,53 @@ class TestInvitationManager:
             "accepted_by": None,
             "created_at": datetime.utcnow().isoformat(),
         }
-        
-        mock_invite_result = Mock()
-        mock_invite_result.data = [invitation_data]
-        
-        query_builder = vault.client.table("vault_invitations")
-        query_builder.select.return_value = query_builder
-        query_builder.eq.return_value = query_builder
-        query_builder.is_.return_value = query_builder
-        query_builder.execute = AsyncMock(return_value=Mock(data=[]))  # No existing invite
-        query_builder.insert.return_value = query_builder
-        query_builder.execute = AsyncMock(return_value=mock_invite_result)
-        
+
+        # Mock the vault_create_invitation function
+        rpc_builder = Mock()
+        rpc_builder.execute = AsyncMock(return_value=Mock(data={
+            "invitation": invitation_data,
+            "organization_name": sample_org_data["name"],
+        }))
+        vault.client._client.rpc = Mock(return_value=rpc_builder)
+
         # Mock email sending
         vault.client._client.auth.admin.invite_user_by_email = AsyncMock()
-        
+
         invite = await vault.invites.create(
             organization_id=sample_org_id,
             email="invited@example.com",
             role_id=sample_role_id
         )
-        
+
         assert invite.email == "invited@example.com"
         assert invite.organization_id == sample_org_id
         assert invite.role_id == sample_role_id
 
+        fn, params = vault.client._client.rpc.call_args.args
+        assert fn == "vault_create_invitation"
+        assert params["p_token_hash"] == hashlib.sha256(invite.token.encode()).hexdigest()
+        assert params["p_organization_id"] == str(sample_org_id)
+        assert params["p_role_id"] == str(sample_role_id)
+
+        options = vault.client._client.auth.admin.invite_user_by_email.call_args.args[1]
+        assert options["data"]["organization_name"] == sample_org_data["name"]
+
+    @pytest.mark.asyncio
+    async def test_create_invitation_existing_member(self, vault, sample_org_id):
+        """Test failed checks in the database function raise ValueError."""
+        rpc_builder = Mock()
+        rpc_builder.execute = AsyncMock(side_effect=APIError({
+            "message": "User member@example.com is already a member of this organization",
+            "code": "P0001",
+        }))
+        vault.client._client.rpc = Mock(return_value=rpc_builder)
+
+        with pytest.raises(ValueError, match="already a member"):
+            await vault.invites.create(
+                organization_id=sample_org_id,
+                email="member@example.com",
+            )
+
     @pytest.mark.asyncio
     async def test_get_invitation(self, vault, sample_invitation_data):
         """Test getting an invitation by ID."""
@@ -104,13 +113,43 @@ class TestInvitationManager:
         invite = await vault.invites.get_by_token("test-token-123")
         
         assert invite is not None
-        assert invite.token == "test-token-123"
+        assert invite.token_hash == hashlib.sha256(b"test-token-123").hexdigest()
+        query_builder.eq.assert_called_with("token_hash", invite.token_hash)
 
     @pytest.mark.asyncio
-    async def test_list_invitations_by_organization(self, vault, sample_invitation_data, sample_org_id):
+    async def test_get_invitation_cached(self, vault, sample_invitation_data):
+        """Test repeat lookups reuse the invitation until it changes."""
+        invitation_id = UUID(sample_invitation_data["id"])
+
+        query_builder = vault.client.table("vault_invitations")
+        query_builder.select.return_value = query_builder
+        query_builder.eq.return_value = query_builder
+        query_builder.delete.return_value = query_builder
+        query_builder.execute = AsyncMock(return_value=Mock(data=[sample_invitation_data]))
+
+        await vault.invites.get_by_token("test-token-123")
+        await vault.invites.get_by_token("test-token-123")
+        await vault.invites.get(invitation_id)
+        assert query_builder.execute.await_count == 1
+
+        await vault.invites.revoke(invitation_id)
+        await vault.invites.get_by_token("test-token-123")
+        assert query_builder.execute.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_list_invitations_by_organization(self, vault, sample_invitation_data, sample_org_id, sample_org_data, sample_user_data):
         """Test listing invitations by organization."""
+        invitation_data = {
+            **sample_invitation_data,
+            "inviter": {
+                "id": sample_user_data["id"],
+                "email": sample_user_data["email"],
+                "display_name": sample_user_data["display_name"],
+            },
+            "organization": {"id": sample_org_data["id"], "name": sample_org_data["name"]},
+        }
         mock_result = Mock()
-        mock_result.data = [sample_invitation_data]
+        mock_result.data = [invitation_data]
         
         query_builder = vault.client.table("vault_invitations")
         query_builder.select.return_value = query_builder
@@ -128,59 +167,27 @@ class TestInvitationManager:
         
         assert len(invites) == 1
         assert invites[0].organization_id == sample_org_id
+        assert invites[0].organization.name == sample_org_data["name"]
+        assert invites[0].inviter.email == sample_user_data["email"]
+        assert "inviter:invited_by" in query_builder.select.call_args.args[0]
 
     @pytest.mark.asyncio
-    async def test_accept_invitation(self, vault, sample_invitation_data, sample_user_id, sample_user_data):
+    async def test_accept_invitation(self, vault, sample_invitation_data, sample_user_id):
         """Test accepting an invitation."""
-        # Mock get_by_token (first execute call)
-        mock_token_result = Mock()
-        mock_token_result.data = [sample_invitation_data]
-
-        # Mock user get
-        mock_user_result = Mock()
-        mock_user_result.data = [sample_user_data]
-
-        # Mock membership check (not a member)
-        mock_membership_result = Mock()
-        mock_membership_result.data = []
+        # Mock get_by_token
+        invitations_query = vault.client.table("vault_invitations")
+        invitations_query.select.return_value = invitations_query
+        invitations_query.eq.return_value = invitations_query
+        invitations_query.execute = AsyncMock(return_value=Mock(data=[sample_invitation_data]))
 
-        # Mock invitation update (returns accepted invitation)
+        # Mock the vault_accept_invitation function (returns accepted invitation)
         updated_data = sample_invitation_data.copy()
         updated_data["accepted_at"] = datetime.utcnow().isoformat()
         updated_data["accepted_by"] = str(sample_user_id)
-        mock_update_result = Mock()
-        mock_update_result.data = [updated_data]
 
-        # Set up invitations table mock
-        invitations_query = vault.client.table("vault_invitations")
-        invitations_query.select.return_value = invitations_query
-        invitations_query.eq.return_value = invitations_query
-        invitations_query.update.return_value = invitations_query
-        invitations_query.execute = AsyncMock(side_effect=[mock_token_result, mock_update_result])
-
-        # Set up users table mock
-        users_query = vault.client.table("vault_users")
-        users_query.select.return_value = users_query
-        users_query.eq.return_value = users_query
-        users_query.execute = AsyncMock(return_value=mock_user_result)
-
-        # Set up memberships table mock
-        memberships_query = vault.client.table("vault_memberships")
-        memberships_query.select.return_value = memberships_query
-        memberships_query.eq.return_value = memberships_query
-        memberships_query.execute = AsyncMock(return_value=mock_membership_result)
-
-        # Mock membership create
-        vault.memberships.create = AsyncMock(return_value=Mock(
-            id=uuid4(),
-            user_id=sample_user_id,
-            organization_id=UUID(sample_invitation_data["organization_id"]),
-            role_id=UUID(sample_invitation_data["role_id"]),
-            status="active",
-            metadata={},
-            joined_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
-        ))
+        rpc_builder = Mock()
+        rpc_builder.execute = AsyncMock(return_value=Mock(data=updated_data))
+        vault.client._client.rpc = Mock(return_value=rpc_builder)
 
         invite = await vault.invites.accept(
             token="test-token-123",
@@ -189,6 +196,13 @@ class TestInvitationManager:
 
         assert invite.accepted_at is not None
         assert invite.accepted_by == sample_user_id
+        vault.client._client.rpc.assert_called_once_with(
+            "vault_accept_invitation",
+            {
+                "p_token_hash": hashlib.sha256(b"test-token-123").hexdigest(),
+                "p_user_id": str(sample_user_id),
+            },
+        )
 
     @pytest.mark.asyncio
     async def test_accept_invitation_already_accepted(self, vault, sample_invitation_data):
@@ -230,6 +244,26 @@ class TestInvitationManager:
                 user_id=uuid4()
             )
 
+    @pytest.mark.asyncio
+    async def test_accept_invitation_expired_with_offset(self, vault, sample_invitation_data):
+        """Test expiry is checked against timestamps with a UTC offset, as stored."""
+        expired_data = sample_invitation_data.copy()
+        expired_data["expires_at"] = (datetime.now(timezone.utc) - timedelta(days=1)).isoformat()
+        
+        mock_result = Mock()
+        mock_result.data = [expired_data]
+        
+        query_builder = vault.client.table("vault_invitations")
+        query_builder.select.return_value = query_builder
+        query_builder.eq.return_value = query_builder
+        query_builder.execute = AsyncMock(return_value=mock_result)
+        
+        with pytest.raises(ValueError, match="expired"):
+            await vault.invites.accept(
+                token="test-token-123",
+                user_id=uuid4()
+            )
+
     @pytest.mark.asyncio
     async def test_revoke_invitation(self, vault, sample_invitation_data):
         """Test revoking an invitation."""
@@ -242,17 +276,45 @@ class TestInvitationManager:
         # Mock delete result
         mock_delete_result = Mock()
         mock_delete_result.data = []
+        mock_delete_result.count = 1
 
         # Set up invitations table mock with side_effect for multiple execute calls
         query_builder = vault.client.table("vault_invitations")
         query_builder.select.return_value = query_builder
         query_builder.eq.return_value = query_builder
+        query_builder.is_.return_value = query_builder
         query_builder.delete.return_value = query_builder
         query_builder.execute = AsyncMock(side_effect=[mock_get_result, mock_delete_result])
 
         await vault.invites.revoke(invitation_id)
 
-        query_builder.delete.assert_called_once()
+        query_builder.delete.assert_called_once_with(
+            count=CountMethod.exact, returning=ReturnMethod.minimal
+        )
+        query_builder.is_.assert_called_once_with("accepted_at", "null")
+
+    @pytest.mark.asyncio
+    async def test_revoke_invitation_accepted_elsewhere(self, vault, sample_invitation_data):
+        """Test revoking fails if the invitation was accepted or deleted after it was cached."""
+        invitation_id = UUID(sample_invitation_data["id"])
+
+        mock_get_result = Mock()
+        mock_get_result.data = [sample_invitation_data]
+
+        # The pending-only delete matches nothing
+        mock_delete_result = Mock()
+        mock_delete_result.data = []
+        mock_delete_result.count = 0
+
+        query_builder = vault.client.table("vault_invitations")
+        query_builder.select.return_value = query_builder
+        query_builder.eq.return_value = query_builder
+        query_builder.is_.return_value = query_builder
+        query_builder.delete.return_value = query_builder
+        query_builder.execute = AsyncMock(side_effect=[mock_get_result, mock_delete_result])
+
+        with pytest.raises(ValueError, match="not found or already accepted"):
+            await vault.invites.revoke(invitation_id)
 
     @pytest.mark.asyncio
     async def test_revoke_accepted_invitation_fails(self, vault, sample_invitation_data):
@@ -290,14 +352,13 @@ class TestInvitationManager:
         mock_org_result = Mock()
         mock_org_result.data = [sample_org_data]
         
-        query_builder = vault.client.table("vault_organizations")
-        query_builder.select.return_value = query_builder
-        query_builder.eq.return_value = query_builder
-        query_builder.execute = AsyncMock(return_value=mock_org_result)
+        org_builder = vault.client.table("vault_organizations")
+        org_builder.select.return_value = org_builder
+        org_builder.eq.return_value = org_builder
+        org_builder.execute = AsyncMock(return_value=mock_org_result)
         
         # Mock update
         updated_data = sample_invitation_data.copy()
-        updated_data["token"] = "new-token-456"
         updated_data["expires_at"] = (datetime.utcnow() + timedelta(days=7)).isoformat()
         
         mock_update_result = Mock()
@@ -306,6 +367,7 @@ class TestInvitationManager:
         query_builder = vault.client.table("vault_invitations")
         query_builder.update.return_value = query_builder
         query_builder.eq.return_value = query_builder
+        query_builder.is_.return_value = query_builder
         query_builder.execute = AsyncMock(return_value=mock_update_result)
         
         # Mock email sending
@@ -313,7 +375,39 @@ class TestInvitationManager:
         
         invite = await vault.invites.resend(invitation_id)
         
-        assert invite.token == "new-token-456"
+        # Only the hash of the new token is stored; the token is returned
+        update = query_builder.update.call_args.args[0]
+        assert update["token_hash"] == hashlib.sha256(invite.token.encode()).hexdigest()
+        assert "token" not in update
+
+        # The organization name is reused for the next resend
+        await vault.invites.resend(invitation_id)
+        org_builder.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_resend_invitation_accepted_elsewhere(self, vault, sample_invitation_data):
+        """Test resending fails if the invitation was accepted after it was cached."""
+        invitation_id = UUID(sample_invitation_data["id"])
+
+        mock_get_result = Mock()
+        mock_get_result.data = [sample_invitation_data]
+
+        # The pending-only update matches nothing
+        mock_update_result = Mock()
+        mock_update_result.data = []
+
+        query_builder = vault.client.table("vault_invitations")
+        query_builder.select.return_value = query_builder
+        query_builder.update.return_value = query_builder
+        query_builder.eq.return_value = query_builder
+        query_builder.is_.return_value = query_builder
+        query_builder.execute = AsyncMock(side_effect=[mock_get_result, mock_update_result])
+        vault.client._client.auth.admin.invite_user_by_email = AsyncMock()
+
+        with pytest.raises(ValueError, match="not found or already accepted"):
+            await vault.invites.resend(invitation_id)
+
+        vault.client._client.auth.admin.invite_user_by_email.assert_not_awaited()
 
     @pytest.mark.asyncio
     async def test_count_invitations(self, vault, sample_org_id):
@@ -332,20 +426,29 @@ class TestInvitationManager:
 
     @pytest.mark.asyncio
     async def test_cleanup_expired_invitations(self, vault):
-        """Test cleaning up expired invitations."""
-        from tests.conftest import setup_table_mock
-        
-        # Mock count - first call returns count, second call is delete
-        mock_count_result = Mock()
-        mock_count_result.count = 3
-        
-        query_builder = vault.client._client.table("vault_invitations")
-        query_builder.execute = AsyncMock(side_effect=[
-            mock_count_result,  # Count query
-            Mock(data=[{}])  # Delete query
-        ])
-        
-        deleted = await vault.invites.cleanup_expired()
-        
-        assert deleted == 3
+        """Test expired invitations are deleted in batches until one comes back short."""
+        rpc_builder = Mock()
+        rpc_builder.execute = AsyncMock(side_effect=[Mock(data=2), Mock(data=2), Mock(data=1)])
+        vault.client._client.rpc = Mock(return_value=rpc_builder)
+
+        deleted = await vault.invites.cleanup_expired(batch_size=2)
+
+        assert deleted == 5
+        assert rpc_builder.execute.await_count == 3
+        vault.client._client.rpc.assert_called_with(
+            "vault_cleanup_expired_invitations", {"p_batch_size": 2}
+        )
+
+    def test_from_db_matches_validated_model(self, sample_invitation_data, sample_user_data):
+        """Test rows built without validation match the validating constructor."""
+        row = {
+            **sample_invitation_data,
+            "inviter": {"id": sample_user_data["id"], "email": sample_user_data["email"]},
+        }
+
+        invite = VaultInvitation.from_db(row)
 
+        assert invite == VaultInvitation(**row)
+        assert isinstance(invite.id, UUID)
+        assert invite.expires_at.tzinfo is not None
+        assert isinstance(invite.inviter.id, UUID)
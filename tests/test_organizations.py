@@ -5,10 +5,11 @@ Tests for vault.organizations module.
 import pytest
 from datetime import datetime
 from unittest.mock import AsyncMock, Mock
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from vault.organizations.orgs import OrganizationManager
 from vault.organizations.members import MembershipManager
+from vault.organizations.models import CreateMembershipRequest
 
 
 class TestOrganizationManager:
@@ -193,6 +194,66 @@ class TestMembershipManager:
         assert membership.organization_id == sample_org_id
         assert membership.role_id == sample_role_id
 
+    @pytest.mark.asyncio
+    async def test_create_many_memberships(self, vault, sample_membership_data, sample_org_id, sample_role_id):
+        """Test creating several memberships with one bulk insert."""
+        other_user_id = uuid4()
+        other_data = {**sample_membership_data, "id": str(uuid4()), "user_id": str(other_user_id), "role_id": None}
+        mock_result = Mock()
+        mock_result.data = [sample_membership_data, other_data]
+
+        query_builder = vault.client.table("vault_memberships")
+        query_builder.insert.return_value = query_builder
+        query_builder.execute = AsyncMock(return_value=mock_result)
+
+        memberships = await vault.memberships.create_many([
+            CreateMembershipRequest(
+                user_id=UUID(sample_membership_data["user_id"]),
+                organization_id=sample_org_id,
+                role_id=sample_role_id,
+            ),
+            CreateMembershipRequest(user_id=other_user_id, organization_id=sample_org_id),
+        ])
+
+        query_builder.insert.assert_called_once()
+        rows = query_builder.insert.call_args.args[0]
+        assert len(rows) == 2
+        assert "role_id" not in rows[1]
+        assert [m.user_id for m in memberships] == [UUID(sample_membership_data["user_id"]), other_user_id]
+        assert memberships[1].role_id is None
+
+    @pytest.mark.asyncio
+    async def test_create_many_memberships_empty(self, vault):
+        """Test creating no memberships makes no request."""
+        query_builder = vault.client.table("vault_memberships")
+
+        assert await vault.memberships.create_many([]) == []
+        query_builder.insert.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_create_membership_by_slug_and_email(self, vault, sample_membership_data, sample_user_id, sample_org_id, sample_role_id):
+        """Test adding a member by org slug and user email via RPC."""
+        rpc_builder = Mock()
+        rpc_builder.execute = AsyncMock(return_value=Mock(data=sample_membership_data))
+        vault.client._client.rpc = Mock(return_value=rpc_builder)
+        vault.permissions.invalidate_user = Mock()
+
+        membership = await vault.memberships.create_by_slug_and_email(
+            "test-org",
+            "test@example.com",
+            role_id=sample_role_id
+        )
+
+        assert membership.user_id == sample_user_id
+        assert membership.organization_id == sample_org_id
+        assert membership.role_id == sample_role_id
+        vault.client._client.rpc.assert_called_once_with(
+            "vault_add_member",
+            {"p_slug": "test-org", "p_email": "test@example.com", "p_role_id": str(sample_role_id)},
+        )
+        # A cached "not a member" result must not outlive the new membership
+        vault.permissions.invalidate_user.assert_called_once_with(sample_user_id)
+
     @pytest.mark.asyncio
     async def test_get_membership(self, vault, sample_membership_data):
         """Test getting a membership by ID."""
@@ -231,6 +292,43 @@ class TestMembershipManager:
         assert membership.user_id == sample_user_id
         assert membership.organization_id == sample_org_id
 
+    @pytest.mark.asyncio
+    async def test_get_membership_by_user_and_org_str_id(self, vault, sample_membership_data, sample_user_id, sample_org_id):
+        """Test getting membership with the user ID passed as a string."""
+        query_builder = vault.client.table("vault_memberships")
+        query_builder.execute = AsyncMock(return_value=Mock(data=[sample_membership_data]))
+
+        membership = await vault.memberships.get_by_user_and_org(
+            user_id=str(sample_user_id),
+            organization_id=sample_org_id
+        )
+
+        assert membership is not None
+        assert membership.user_id == sample_user_id
+
+    @pytest.mark.asyncio
+    async def test_get_many_memberships_by_users_and_org(self, vault, sample_membership_data, sample_user_id, sample_org_id):
+        """Test getting several users' memberships with one query."""
+        mock_result = Mock()
+        mock_result.data = [sample_membership_data]
+
+        query_builder = vault.client.table("vault_memberships")
+        query_builder.select.return_value = query_builder
+        query_builder.in_.return_value = query_builder
+        query_builder.eq.return_value = query_builder
+        query_builder.execute = AsyncMock(return_value=mock_result)
+
+        other_user_id = uuid4()
+        memberships = await vault.memberships.get_many_by_users_and_org(
+            [sample_user_id, other_user_id], sample_org_id
+        )
+
+        query_builder.in_.assert_called_once_with(
+            "user_id", [str(sample_user_id), str(other_user_id)]
+        )
+        assert list(memberships) == [sample_user_id]
+        assert memberships[sample_user_id].organization_id == sample_org_id
+
     @pytest.mark.asyncio
     async def test_list_memberships_by_organization(self, vault, sample_membership_data, sample_org_id):
         """Test listing memberships by organization."""
@@ -253,6 +351,26 @@ class TestMembershipManager:
         assert len(memberships) == 1
         assert memberships[0].organization_id == sample_org_id
 
+    @pytest.mark.asyncio
+    async def test_list_memberships_by_organization_slug(self, vault, sample_membership_data, sample_org_id):
+        """Test listing memberships by organization slug in a single query."""
+        row = {**sample_membership_data, "vault_organizations": {"slug": "test-org"}}
+        mock_result = Mock()
+        mock_result.data = [row]
+
+        query_builder = vault.client.table("vault_memberships")
+        query_builder.select.return_value = query_builder
+        query_builder.eq.return_value = query_builder
+        query_builder.range.return_value = query_builder
+        query_builder.order.return_value = query_builder
+        query_builder.execute = AsyncMock(return_value=mock_result)
+
+        memberships = await vault.memberships.list_by_organization_slug("test-org")
+
+        assert len(memberships) == 1
+        assert memberships[0].organization_id == sample_org_id
+        query_builder.eq.assert_any_call("vault_organizations.slug", "test-org")
+
     @pytest.mark.asyncio
     async def test_list_memberships_by_user(self, vault, sample_membership_data, sample_user_id):
         """Test listing memberships by user."""
@@ -348,4 +466,5 @@ class TestMembershipManager:
         count = await vault.memberships.count_by_organization(sample_org_id)
         
         assert count == 5
+        query_builder.select.assert_called_once_with("id", count="exact", head=True)
 
@@ -2,6 +2,8 @@
 Tests for vault.rbac module.
 """
 
+import asyncio
+
 import pytest
 from datetime import datetime
 from unittest.mock import AsyncMock, Mock
@@ -157,6 +159,49 @@ class TestRoleManager:
         assert len(roles) == 1
         assert roles[0].organization_id == sample_org_id
 
+    @pytest.mark.asyncio
+    async def test_list_system_roles_by_organization(self, vault, sample_role_data, sample_org_id):
+        """Test listing only system roles filters on is_system."""
+        mock_result = Mock()
+        mock_result.data = [{**sample_role_data, "is_system": True}]
+
+        query_builder = vault.client.table("vault_roles")
+        query_builder.select.return_value = query_builder
+        query_builder.eq.return_value = query_builder
+        query_builder.range.return_value = query_builder
+        query_builder.order.return_value = query_builder
+        query_builder.execute = AsyncMock(return_value=mock_result)
+
+        roles = await vault.roles.list_by_organization(sample_org_id, system_only=True)
+
+        assert len(roles) == 1
+        assert roles[0].is_system is True
+        query_builder.eq.assert_any_call("is_system", True)
+
+    @pytest.mark.asyncio
+    async def test_iter_roles_by_organization(self, vault, sample_role_data, sample_org_id):
+        """Test iterating roles fetches pages until a short page."""
+        full_page = Mock(data=[sample_role_data, sample_role_data])
+        short_page = Mock(data=[sample_role_data])
+
+        query_builder = vault.client.table("vault_roles")
+        query_builder.select.return_value = query_builder
+        query_builder.eq.return_value = query_builder
+        query_builder.range.return_value = query_builder
+        query_builder.order.return_value = query_builder
+        query_builder.execute = AsyncMock(side_effect=[full_page, short_page])
+
+        roles = [
+            role
+            async for role in vault.roles.iter_by_organization(
+                sample_org_id, limit=10, page_size=2
+            )
+        ]
+
+        assert len(roles) == 3
+        assert query_builder.execute.await_count == 2
+        query_builder.range.assert_any_call(2, 3)
+
     @pytest.mark.asyncio
     async def test_update_role(self, vault, sample_role_data):
         """Test updating a role."""
@@ -505,6 +550,75 @@ class TestPermissionManager:
         assert is_member is True
 
 
+    @pytest.mark.asyncio
+    async def test_permission_lookups_cached(self, vault, sample_user_id, sample_org_id, sample_role_id, sample_role_data, sample_membership_data):
+        """Test repeat checks reuse the cached membership and role until invalidated."""
+        membership_builder = vault.client.table("vault_memberships")
+        membership_builder.execute = AsyncMock(return_value=Mock(data=[sample_membership_data]))
+        role_builder = vault.client.table("vault_roles")
+        role_builder.execute = AsyncMock(return_value=Mock(data=[sample_role_data]))
+
+        assert await vault.permissions.check(sample_user_id, sample_org_id, "posts:write")
+        assert await vault.permissions.check_role(sample_user_id, sample_org_id, "Editor")
+        assert await vault.permissions.is_member(sample_user_id, sample_org_id)
+        assert membership_builder.execute.await_count == 1
+        assert role_builder.execute.await_count == 1
+
+        vault.permissions.invalidate_user(sample_user_id)
+        vault.permissions.invalidate_role(sample_role_id)
+        assert await vault.permissions.check(sample_user_id, sample_org_id, "posts:write")
+        assert membership_builder.execute.await_count == 2
+        assert role_builder.execute.await_count == 2
+
+
+    @pytest.mark.asyncio
+    async def test_check_access(self, vault, sample_user_id, sample_org_id, sample_role_data, sample_membership_data):
+        """Test checking membership, permissions and roles in one call."""
+        membership_builder = vault.client.table("vault_memberships")
+        membership_builder.execute = AsyncMock(return_value=Mock(data=[sample_membership_data]))
+        role_builder = vault.client.table("vault_roles")
+        role_builder.execute = AsyncMock(return_value=Mock(data=[sample_role_data]))
+
+        check = vault.permissions.check_access
+        assert await check(sample_user_id, sample_org_id)
+        assert await check(sample_user_id, sample_org_id, permissions=["posts:read", "posts:write"], roles=["Admin", "Editor"])
+        assert not await check(sample_user_id, sample_org_id, permissions=["posts:delete"])
+        assert await check(sample_user_id, sample_org_id, permissions=["posts:delete", "posts:read"], require_all=False)
+        assert not await check(sample_user_id, sample_org_id, roles=["Admin", "Editor"], all_roles=True)
+        assert membership_builder.execute.await_count == 1
+        assert role_builder.execute.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_shared(self, vault, sample_user_id, sample_org_id, sample_role_data, sample_membership_data):
+        """Test concurrent checks on a cold cache share one membership and role lookup."""
+        membership_builder = vault.client.table("vault_memberships")
+        membership_builder.execute = AsyncMock(return_value=Mock(data=[sample_membership_data]))
+        role_builder = vault.client.table("vault_roles")
+        role_builder.execute = AsyncMock(return_value=Mock(data=[sample_role_data]))
+
+        results = await asyncio.gather(
+            *(vault.permissions.check(sample_user_id, sample_org_id, "posts:write") for _ in range(5))
+        )
+        assert all(results)
+        assert membership_builder.execute.await_count == 1
+        assert role_builder.execute.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_missing_membership_cached(self, vault, sample_user_id, sample_org_id, sample_membership_data):
+        """Test a missing membership is cached until the user joins."""
+        membership_builder = vault.client.table("vault_memberships")
+        membership_builder.execute = AsyncMock(return_value=Mock(data=[]))
+
+        assert not await vault.permissions.is_member(sample_user_id, sample_org_id)
+        assert not await vault.permissions.check(sample_user_id, sample_org_id, "posts:read")
+        assert membership_builder.execute.await_count == 1
+
+        membership_builder.execute = AsyncMock(return_value=Mock(data=[sample_membership_data]))
+        await vault.memberships.create(user_id=sample_user_id, organization_id=sample_org_id)
+        assert await vault.permissions.is_member(sample_user_id, sample_org_id)
+        assert membership_builder.execute.await_count == 2
+
+
 class TestPermissionModels:
     """Tests for permission utility functions."""
 
@@ -5,6 +5,7 @@ Tests for vault.utils module.
 import pytest
 from unittest.mock import AsyncMock, Mock, patch
 
+from vault.utils.cache import TTLCache
 from vault.utils.supabase import VaultSupabaseClient
 from vault.config import VaultConfig
 
@@ -25,6 +26,19 @@ class TestVaultSupabaseClient:
             assert client._client == mock_client
             mock_create.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_create_client_reused(self, vault_config):
+        """Test identical configs on one event loop share a client."""
+        with patch('vault.utils.supabase.create_client') as mock_create:
+            client = await VaultSupabaseClient.create(vault_config)
+            assert await VaultSupabaseClient.create(vault_config) is client
+
+            other = await VaultSupabaseClient.create(
+                vault_config.model_copy(update={"db_schema": "vault"})
+            )
+            assert other is not client
+            assert mock_create.call_count == 2
+
     def test_auth_property(self, mock_vault_supabase_client):
         """Test accessing auth property."""
         auth = mock_vault_supabase_client.auth
@@ -46,3 +60,44 @@ class TestVaultSupabaseClient:
         # Should not raise
         await mock_vault_supabase_client.close()
 
+
+
+class TestTTLCache:
+    """Tests for TTLCache class."""
+
+    def test_get_and_set(self):
+        """Test cached values are returned until they expire."""
+        cache = TTLCache(ttl=30)
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        assert cache.get("missing", "default") == "default"
+
+        cache.set("b", 2, ttl=-1)
+        assert cache.get("b") is None
+
+    def test_zero_ttl_disables_cache(self):
+        """Test a TTL of 0 stores nothing."""
+        cache = TTLCache(ttl=0)
+        cache.set("a", 1)
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        """Test the oldest unused entry is evicted at maxsize."""
+        cache = TTLCache(ttl=30, maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_discard_where(self):
+        """Test removing entries by key predicate."""
+        cache = TTLCache(ttl=30)
+        cache.set(("u1", "o1"), 1)
+        cache.set(("u1", "o2"), 2)
+        cache.set(("u2", "o1"), 3)
+        cache.discard_where(lambda key: key[0] == "u1")
+        assert len(cache) == 1
+        assert cache.get(("u2", "o1")) == 3
@@ -40,13 +40,16 @@ Example:
     ```
 """
 
-from .apikeys import APIKeyManager, VaultAPIKey
-from .audit import AuditAction, AuditLogEntry, AuditLogger, ResourceType
-from .client import Vault
-from .config import VaultConfig, load_config
-from .invitations import InvitationManager, VaultInvitation
-from .rbac import VaultPermission, VaultRole, check_permission, check_permissions
-from .webhooks import VaultWebhook, WebhookEvent, WebhookManager
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .apikeys import APIKeyManager, VaultAPIKey
+    from .audit import AuditAction, AuditLogEntry, AuditLogger, ResourceType
+    from .client import Vault
+    from .config import VaultConfig, load_config
+    from .invitations import InvitationManager, VaultInvitation
+    from .rbac import VaultPermission, VaultRole, check_permission, check_permissions
+    from .webhooks import VaultWebhook, WebhookEvent, WebhookManager
 
 __version__ = "0.1.0"
 
@@ -76,3 +79,42 @@ __all__ = [
     "APIKeyManager",
     "VaultAPIKey",
 ]
+
+# Public names are imported on first access so that `vault.cli` (and any
+# other submodule) can be loaded without pulling in the Supabase client.
+_LAZY_EXPORTS = {
+    "Vault": ".client",
+    "VaultConfig": ".config",
+    "load_config": ".config",
+    "VaultRole": ".rbac",
+    "VaultPermission": ".rbac",
+    "check_permission": ".rbac",
+    "check_permissions": ".rbac",
+    "InvitationManager": ".invitations",
+    "VaultInvitation": ".invitations",
+    "AuditLogger": ".audit",
+    "AuditLogEntry": ".audit",
+    "AuditAction": ".audit",
+    "ResourceType": ".audit",
+    "WebhookManager": ".webhooks",
+    "VaultWebhook": ".webhooks",
+    "WebhookEvent": ".webhooks",
+    "APIKeyManager": ".apikeys",
+    "VaultAPIKey": ".apikeys",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
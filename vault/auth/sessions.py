@@ -13,6 +13,12 @@ from supabase_auth.types import SignInWithPasswordCredentials
 
 from .models import VaultSession, VaultUser
 
+# PyJWT comes with supabase-auth; without it tokens are always checked remotely
+try:
+    import jwt
+except ImportError:
+    jwt = None
+
 
 class SessionManager:
     """
@@ -159,14 +165,21 @@ class SessionManager:
             if user:
                 print(f"Token belongs to: {user.email}")
             ```
+
+        Note:
+            When config.jwt_secret is set, HS256 tokens are verified locally
+            instead of with a round trip to Supabase Auth. A signed-out
+            token then stays valid until it expires.
         """
         try:
-            auth_user_response = await self.client.auth.get_user(token)
-            auth_user = auth_user_response.user
+            auth_id = self._verify_token(token)
+            if auth_id is None:
+                auth_user_response = await self.client.auth.get_user(token)
+                auth_id = auth_user_response.user.id
 
             # Get vault user
             result = await self.client.table("vault_users").select("*").eq(
-                "supabase_auth_id", auth_user.id
+                "supabase_auth_id", auth_id
             ).execute()
 
             if not result.data:
@@ -177,6 +190,38 @@ class SessionManager:
         except Exception:
             return None
 
+    def _verify_token(self, token: str) -> Optional[str]:
+        """
+        Verify a token against the configured JWT secret.
+
+        Args:
+            token: JWT access token
+
+        Returns:
+            The token's subject (Supabase auth user ID), or None if the token
+            can't be verified locally and must be checked by Supabase Auth
+
+        Raises:
+            jwt.ExpiredSignatureError: If the token is expired
+        """
+        secret = self.vault.config.jwt_secret
+        if jwt is None or not secret:
+            return None
+
+        try:
+            # Projects using asymmetric signing keys can't be verified with the secret
+            if jwt.get_unverified_header(token).get("alg") != "HS256":
+                return None
+            claims = jwt.decode(
+                token, secret, algorithms=["HS256"], options={"verify_aud": False}
+            )
+        except jwt.ExpiredSignatureError:
+            raise
+        except jwt.InvalidTokenError:
+            return None
+
+        return claims.get("sub")
+
     async def sign_out(self, token: str) -> None:
         """
         Sign out a user session.
@@ -0,0 +1,96 @@
+"""
+On-disk cache for CLI lookups.
+
+Every CLI invocation is a fresh process, so an in-memory cache can't help
+scripts that call `vault orgs ...` in a loop. This keeps recently resolved
+organization IDs in a small JSON file, keyed by Supabase project and slug,
+with a short TTL. Only the ID is stored, and the file is readable by its
+owner alone.
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+CACHE_DIR = Path(os.environ.get("VAULT_CACHE_DIR", Path.home() / ".vault" / "cache"))
+ORGS_CACHE_FILE = CACHE_DIR / "orgs.json"
+
+DEFAULT_TTL = 60
+
+
+def _key(project: str, slug: str) -> str:
+    return f"{project}:{slug}"
+
+
+def _load() -> Dict[str, Any]:
+    try:
+        return json.loads(ORGS_CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _save(entries: Dict[str, Any]) -> None:
+    # The cache is best-effort: never fail a command because it can't be written
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = ORGS_CACHE_FILE.with_suffix(".tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            f.write(json.dumps(entries))
+        os.replace(tmp_path, ORGS_CACHE_FILE)
+    except OSError:
+        pass
+
+
+def get_cached_org_id(project: str, slug: str) -> Optional[UUID]:
+    """
+    Get a cached organization ID.
+
+    Args:
+        project: Supabase project URL the organization belongs to
+        slug: Organization slug
+
+    Returns:
+        Organization ID, or None if missing or expired
+    """
+    entry = _load().get(_key(project, slug))
+    if not entry or entry.get("expires_at", 0) < time.time():
+        return None
+    try:
+        return UUID(entry["id"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def put_cached_org_id(project: str, slug: str, org_id: UUID, ttl: int = DEFAULT_TTL) -> None:
+    """
+    Cache an organization ID.
+
+    Expired entries are dropped whenever the file is rewritten.
+
+    Args:
+        project: Supabase project URL the organization belongs to
+        slug: Organization slug
+        org_id: Organization ID
+        ttl: Seconds until the entry expires
+    """
+    now = time.time()
+    entries = {k: v for k, v in _load().items() if v.get("expires_at", 0) >= now}
+    entries[_key(project, slug)] = {"expires_at": now + ttl, "id": str(org_id)}
+    _save(entries)
+
+
+def invalidate_cached_org(project: str, slug: str) -> None:
+    """
+    Remove an organization from the cache.
+
+    Args:
+        project: Supabase project URL the organization belongs to
+        slug: Organization slug
+    """
+    entries = _load()
+    if entries.pop(_key(project, slug), None) is not None:
+        _save(entries)
@@ -0,0 +1,54 @@
+"""
+Error reporting shared by CLI commands.
+"""
+
+import functools
+import sys
+from json import JSONDecodeError  # orjson.JSONDecodeError subclasses this
+
+import typer
+from rich.console import Console
+
+# Errors go to stderr so piped --plain, TSV and JSON output stays parseable
+_ERR_TTY = sys.stderr.isatty()
+err_console = Console(stderr=True, force_terminal=_ERR_TTY, no_color=not _ERR_TTY, highlight=False)
+
+
+def cli_errors(console: Console = err_console):
+    """
+    Build a decorator that reports errors from an async command helper.
+
+    Any exception is printed to the console and turned into exit status 1.
+    A typer.Exit raised by the helper itself (e.g. after printing a
+    not-found message) passes through unchanged.
+
+    Args:
+        console: Console errors are printed to (stderr by default)
+
+    Example:
+        ```python
+        _cli_errors = cli_errors()
+
+        @_cli_errors
+        async def _get_role(org_slug: str, name: str) -> None:
+            ...
+        ```
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except typer.Exit:
+                raise
+            except JSONDecodeError as e:
+                console.print(f"[red]Error:[/red] Invalid JSON: {e}")
+                raise typer.Exit(1) from None
+            except Exception as e:
+                console.print(f"[red]Error:[/red] {e}")
+                raise typer.Exit(1) from None
+
+        return wrapper
+
+    return decorator
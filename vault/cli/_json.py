@@ -0,0 +1,63 @@
+"""
+JSON output for CLI commands (--output json).
+"""
+
+import sys
+from typing import Any
+
+import typer
+
+# orjson is an optional speedup; fall back to the stdlib encoder
+try:
+    import orjson
+except ImportError:
+    import json
+
+    orjson = None
+
+OUTPUT_FORMATS = ("table", "json")
+
+
+def check_output_format(output: str) -> str:
+    """
+    Validate an --output value.
+
+    Args:
+        output: Requested output format
+
+    Returns:
+        The lowercased format name
+
+    Raises:
+        typer.BadParameter: If the format is not supported
+    """
+    output = output.lower()
+    if output not in OUTPUT_FORMATS:
+        raise typer.BadParameter(
+            f"must be one of: {', '.join(OUTPUT_FORMATS)}", param_hint="--output"
+        )
+    return output
+
+
+def _default(obj: Any) -> str:
+    # Mirror orjson's native encoding of datetimes and UUIDs
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    return str(obj)
+
+
+def write_json(data: Any) -> None:
+    """
+    Write data to stdout as one line of JSON.
+
+    Args:
+        data: JSON-compatible data; datetimes and UUIDs are encoded as strings
+    """
+    if orjson is not None:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(
+            orjson.dumps(data, default=_default, option=orjson.OPT_APPEND_NEWLINE)
+        )
+        sys.stdout.buffer.flush()
+    else:
+        sys.stdout.write(json.dumps(data, default=_default) + "\n")
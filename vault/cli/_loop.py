@@ -0,0 +1,61 @@
+"""
+Event loop shared by CLI commands.
+
+asyncio.run() builds and tears down a new event loop on every call. Running
+commands on one loop per process keeps the shared Vault client (and its
+connection pool) alive between commands invoked in the same process. At
+exit the shared client is closed on the loop before the loop itself.
+
+When uvloop is installed the shared loop is a uvloop loop. Only this loop is
+affected; the process-wide event loop policy is left untouched.
+"""
+
+import asyncio
+import atexit
+import sys
+from typing import Any, Callable, Coroutine, Optional, TypeVar
+
+_new_event_loop: Callable[[], asyncio.AbstractEventLoop] = asyncio.new_event_loop
+
+if sys.platform != "win32":
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        _new_event_loop = uvloop.new_event_loop
+
+T = TypeVar("T")
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion on the shared event loop.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    global _loop
+
+    if _loop is None or _loop.is_closed():
+        _loop = _new_event_loop()
+        atexit.register(_shutdown, _loop)
+
+    return _loop.run_until_complete(coro)
+
+
+def _shutdown(loop: asyncio.AbstractEventLoop) -> None:
+    """Close the shared Vault client on its loop, then close the loop."""
+    from ._vault import close_vault
+
+    if loop.is_closed():
+        return
+    try:
+        loop.run_until_complete(close_vault())
+    finally:
+        loop.close()
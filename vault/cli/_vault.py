@@ -0,0 +1,49 @@
+"""
+Shared Vault client for CLI commands.
+
+Vault.create() re-reads configuration and opens fresh HTTP connections, so
+commands that run in the same process (scripted loops, the test runner)
+reuse one client instead of paying for that on every call.
+"""
+
+import asyncio
+from typing import Optional
+
+from ..client import Vault
+
+_vault: Optional[Vault] = None
+_vault_loop: Optional[asyncio.AbstractEventLoop] = None
+_vault_lock: Optional[asyncio.Lock] = None
+
+
+async def get_vault() -> Vault:
+    """
+    Get the shared Vault client, creating it on first use.
+
+    HTTP connections belong to the event loop that opened them, so a new
+    client is created whenever the running loop changes (e.g. each asyncio.run).
+
+    Returns:
+        Initialized Vault client
+    """
+    global _vault, _vault_loop, _vault_lock
+
+    loop = asyncio.get_running_loop()
+    if _vault_loop is not loop:
+        _vault, _vault_loop, _vault_lock = None, loop, asyncio.Lock()
+
+    if _vault is None:
+        async with _vault_lock:
+            if _vault is None:
+                _vault = await Vault.create()
+
+    return _vault
+
+
+async def close_vault() -> None:
+    """Close the shared Vault client, if one was created on the running loop."""
+    global _vault
+
+    if _vault is not None and _vault_loop is asyncio.get_running_loop():
+        vault, _vault = _vault, None
+        await vault.close()
@@ -2,26 +2,25 @@
 CLI commands for invitation management.
 """
 
-import asyncio
-from datetime import datetime
+import sys
+from datetime import datetime, timezone
 from typing import Optional
 from uuid import UUID
 
 import typer
 from rich.console import Console
-from rich.table import Table
 
-from ...client import Vault
+from .._errors import cli_errors
+from .._loop import run_async
+from .._vault import get_vault
 
-console = Console()
+# Skip rich's styling pipeline entirely when output is piped or redirected
+_TTY = sys.stdout.isatty()
+console = Console(force_terminal=_TTY, no_color=not _TTY, highlight=False)
+_cli_errors = cli_errors()
 app = typer.Typer(help="Manage organization invitations")
 
 
-def run_async(coro):
-    """Run async function in sync context."""
-    return asyncio.get_event_loop().run_until_complete(coro)
-
-
 @app.command("send")
 def invites_send_command(
     email: str = typer.Argument(..., help="Email address to invite"),
@@ -32,22 +31,20 @@ def invites_send_command(
 ) -> None:
     """Send an invitation to join an organization."""
 
+    @_cli_errors
     async def _send():
-        vault = await Vault.create()
-        try:
-            invite = await vault.invites.create(
-                organization_id=UUID(org_id),
-                email=email,
-                role_id=UUID(role_id) if role_id else None,
-                expires_in_days=expires,
-                send_email=not no_email,
-            )
-            console.print(f"[green]✓[/green] Invitation sent to {email}")
-            console.print(f"  ID: {invite.id}")
-            console.print(f"  Token: {invite.token}")
-            console.print(f"  Expires: {invite.expires_at}")
-        finally:
-            await vault.close()
+        vault = await get_vault()
+        invite = await vault.invites.create(
+            organization_id=UUID(org_id),
+            email=email,
+            role_id=UUID(role_id) if role_id else None,
+            expires_in_days=expires,
+            send_email=not no_email,
+        )
+        console.print(f"[green]✓[/green] Invitation sent to {email}")
+        console.print(f"  ID: {invite.id}")
+        console.print(f"  Token: {invite.token}")
+        console.print(f"  Expires: {invite.expires_at}")
 
     run_async(_send())
 
@@ -60,40 +57,55 @@ def invites_list_command(
 ) -> None:
     """List invitations for an organization."""
 
+    @_cli_errors
     async def _list():
-        vault = await Vault.create()
-        try:
-            invites = await vault.invites.list_by_organization(
-                organization_id=UUID(org_id),
-                pending_only=pending,
-                limit=limit,
-            )
-
-            if not invites:
-                console.print("[yellow]No invitations found[/yellow]")
-                return
-
-            table = Table(title="Invitations")
-            table.add_column("Email", style="cyan")
-            table.add_column("Status", style="green")
-            table.add_column("Expires", style="yellow")
-            table.add_column("ID", style="dim")
-
+        from rich.table import Table
+
+        vault = await get_vault()
+        invites = await vault.invites.list_by_organization(
+            organization_id=UUID(org_id),
+            pending_only=pending,
+            limit=limit,
+        )
+
+        if not invites:
+            console.print("[yellow]No invitations found[/yellow]")
+            return
+
+        if not _TTY:
+            now = datetime.now(timezone.utc)
+            rows = []
             for invite in invites:
-                status = "Accepted" if invite.accepted_at else "Pending"
-                if not invite.accepted_at and invite.expires_at < datetime.utcnow():
-                    status = "Expired"
-
-                table.add_row(
-                    invite.email,
-                    status,
-                    invite.expires_at.strftime("%Y-%m-%d"),
-                    str(invite.id)[:8],
+                status = "accepted" if invite.accepted_at else "pending"
+                if not invite.accepted_at and invite.expires_at < now:
+                    status = "expired"
+                rows.append(
+                    f"{invite.email}\t{status}\t"
+                    f"{invite.expires_at.strftime('%Y-%m-%d')}\t{invite.id}\n"
                 )
+            sys.stdout.write("".join(rows))
+            return
+
+        table = Table(title="Invitations")
+        table.add_column("Email", style="cyan")
+        table.add_column("Status", style="green")
+        table.add_column("Expires", style="yellow")
+        table.add_column("ID", style="dim")
+
+        now = datetime.now(timezone.utc)
+        for invite in invites:
+            status = "Accepted" if invite.accepted_at else "Pending"
+            if not invite.accepted_at and invite.expires_at < now:
+                status = "Expired"
+
+            table.add_row(
+                invite.email,
+                status,
+                invite.expires_at.strftime("%Y-%m-%d"),
+                str(invite.id)[:8],
+            )
 
-            console.print(table)
-        finally:
-            await vault.close()
+        console.print(table)
 
     run_async(_list())
 
@@ -104,16 +116,11 @@ def invites_revoke_command(
 ) -> None:
     """Revoke (delete) a pending invitation."""
 
+    @_cli_errors
     async def _revoke():
-        vault = await Vault.create()
-        try:
-            await vault.invites.revoke(UUID(invite_id))
-            console.print(f"[green]✓[/green] Invitation {invite_id[:8]}... revoked")
-        except ValueError as e:
-            console.print(f"[red]Error:[/red] {e}")
-            raise typer.Exit(1)
-        finally:
-            await vault.close()
+        vault = await get_vault()
+        await vault.invites.revoke(UUID(invite_id))
+        console.print(f"[green]✓[/green] Invitation {invite_id[:8]}... revoked")
 
     run_async(_revoke())
 
@@ -124,18 +131,13 @@ def invites_resend_command(
 ) -> None:
     """Resend an invitation email and extend expiration."""
 
+    @_cli_errors
     async def _resend():
-        vault = await Vault.create()
-        try:
-            invite = await vault.invites.resend(UUID(invite_id))
-            console.print(f"[green]✓[/green] Invitation resent to {invite.email}")
-            console.print(f"  New token: {invite.token}")
-            console.print(f"  New expiration: {invite.expires_at}")
-        except ValueError as e:
-            console.print(f"[red]Error:[/red] {e}")
-            raise typer.Exit(1)
-        finally:
-            await vault.close()
+        vault = await get_vault()
+        invite = await vault.invites.resend(UUID(invite_id))
+        console.print(f"[green]✓[/green] Invitation resent to {invite.email}")
+        console.print(f"  New token: {invite.token}")
+        console.print(f"  New expiration: {invite.expires_at}")
 
     run_async(_resend())
 
@@ -147,18 +149,13 @@ def invites_accept_command(
 ) -> None:
     """Accept an invitation using its token."""
 
+    @_cli_errors
     async def _accept():
-        vault = await Vault.create()
-        try:
-            invite = await vault.invites.accept(token, UUID(user_id))
-            console.print(f"[green]✓[/green] Invitation accepted")
-            console.print(f"  Organization: {invite.organization_id}")
-            console.print(f"  User: {user_id[:8]}...")
-        except ValueError as e:
-            console.print(f"[red]Error:[/red] {e}")
-            raise typer.Exit(1)
-        finally:
-            await vault.close()
+        vault = await get_vault()
+        invite = await vault.invites.accept(token, UUID(user_id))
+        console.print(f"[green]✓[/green] Invitation accepted")
+        console.print(f"  Organization: {invite.organization_id}")
+        console.print(f"  User: {user_id[:8]}...")
 
     run_async(_accept())
 
@@ -167,12 +164,10 @@ def invites_accept_command(
 def invites_cleanup_command() -> None:
     """Delete all expired invitations."""
 
+    @_cli_errors
     async def _cleanup():
-        vault = await Vault.create()
-        try:
-            deleted = await vault.invites.cleanup_expired()
-            console.print(f"[green]✓[/green] Cleaned up {deleted} expired invitations")
-        finally:
-            await vault.close()
+        vault = await get_vault()
+        deleted = await vault.invites.cleanup_expired()
+        console.print(f"[green]✓[/green] Cleaned up {deleted} expired invitations")
 
     run_async(_cleanup())
@@ -5,17 +5,22 @@ Applies pending SQL migrations to your Supabase database.
 """
 
 import asyncio
+import sys
 from typing import Optional
 
 import typer
 from rich.console import Console
-from rich.table import Table
 
 from ...config import load_config
 from ...migrations.manager import MigrationManager
-from ...utils.supabase import VaultSupabaseClient
+from .._errors import cli_errors, err_console
+from .._loop import run_async
+from .._vault import get_vault
 
-console = Console()
+# Skip rich's styling pipeline entirely when output is piped or redirected
+_TTY = sys.stdout.isatty()
+console = Console(force_terminal=_TTY, no_color=not _TTY, highlight=False)
+_cli_errors = cli_errors()
 
 
 def migrate_command(
@@ -36,38 +41,48 @@ def migrate_command(
     console.print("\n[bold cyan]Vault Migration[/bold cyan]\n")
 
     try:
-        # Load configuration
-        config = load_config()
+        # Check the configuration up front for a friendlier error
+        load_config()
         console.print("[green]✓[/green] Configuration loaded")
 
     except Exception as e:
-        console.print(f"[red]Error loading configuration:[/red] {e}")
-        console.print("\nRun [cyan]vault init[/cyan] to set up your configuration")
-        raise typer.Exit(1)
+        err_console.print(f"[red]Error loading configuration:[/red] {e}")
+        err_console.print("\nRun [cyan]vault init[/cyan] to set up your configuration")
+        raise typer.Exit(1) from None
 
     # Run migrations asynchronously
-    asyncio.run(_run_migrations(config, target))
+    run_async(_run_migrations(target))
 
 
-async def _run_migrations(config, target: Optional[str]) -> None:
+@_cli_errors
+async def _run_migrations(target: Optional[str]) -> None:
     """
     Internal function to run migrations asynchronously.
 
     Args:
-        config: Vault configuration
         target: Optional target migration version
     """
     try:
-        # Create Supabase client
-        client = await VaultSupabaseClient.create(config)
+        vault = await get_vault()
         console.print("[green]✓[/green] Connected to Supabase")
 
         # Create migration manager
-        manager = MigrationManager(client)
+        manager = MigrationManager(vault.client)
 
-        # Run migrations
+        # Run migrations, reporting each one as soon as it is applied
         console.print()
-        await manager.migrate(target=target)
+        applied_count = 0
+        try:
+            async for migration in manager.migrate_iter(target=target):
+                console.print(f"[green]✓[/green] {migration.version} {migration.name}")
+                applied_count += 1
+        finally:
+            await manager.close()
+
+        if applied_count:
+            console.print(f"\n[green]✓[/green] Applied {applied_count} migration(s)\n")
+        else:
+            console.print("No pending migrations\n")
 
     except NotImplementedError as e:
         console.print(f"\n[yellow]Note:[/yellow] {e}")
@@ -79,10 +94,6 @@ async def _run_migrations(config, target: Optional[str]) -> None:
         console.print("\nOr use psql:")
         console.print("[cyan]psql <your-db-url> < vault/migrations/versions/001_initial_schema.sql[/cyan]")
 
-    except Exception as e:
-        console.print(f"\n[red]Error:[/red] {e}")
-        raise typer.Exit(1)
-
 
 def status_command() -> None:
     """
@@ -93,59 +104,69 @@ def status_command() -> None:
     Example:
         $ vault status
     """
-    console.print("\n[bold cyan]Vault Migration Status[/bold cyan]\n")
+    if _TTY:
+        console.print("\n[bold cyan]Vault Migration Status[/bold cyan]\n")
 
     try:
-        # Load configuration
-        config = load_config()
+        # Check the configuration up front for a friendlier error
+        load_config()
 
     except Exception as e:
-        console.print(f"[red]Error loading configuration:[/red] {e}")
-        console.print("\nRun [cyan]vault init[/cyan] to set up your configuration")
-        raise typer.Exit(1)
+        err_console.print(f"[red]Error loading configuration:[/red] {e}")
+        err_console.print("\nRun [cyan]vault init[/cyan] to set up your configuration")
+        raise typer.Exit(1) from None
 
     # Run status check asynchronously
-    asyncio.run(_show_status(config))
-
-
-async def _show_status(config) -> None:
-    """
-    Internal function to show migration status.
-
-    Args:
-        config: Vault configuration
-    """
-    try:
-        # Create Supabase client
-        client = await VaultSupabaseClient.create(config)
-
-        # Create migration manager
-        manager = MigrationManager(client)
-
-        # Get migrations
-        migrations = manager.discover_migrations()
-        applied = await manager.get_applied_migrations()
-
-        # Create a table for display
-        table = Table(title="Migration Status")
-        table.add_column("Status", style="cyan", width=8)
-        table.add_column("Version", style="magenta")
-        table.add_column("Name", style="green")
-
-        for migration in migrations:
-            status = "✓" if migration.version in applied else "pending"
-            status_style = "green" if migration.version in applied else "yellow"
-
-            table.add_row(
-                f"[{status_style}]{status}[/{status_style}]",
-                migration.version,
-                migration.name,
-            )
-
+    run_async(_show_status())
+
+
+@_cli_errors
+async def _show_status() -> None:
+    """Internal function to show migration status."""
+    from rich.table import Table
+
+    vault = await get_vault()
+
+    # Create migration manager
+    manager = MigrationManager(vault.client)
+
+    # Scan the filesystem in a worker thread while the DB query is in flight
+    migrations, applied = await asyncio.gather(
+        asyncio.to_thread(manager.discover_migrations),
+        manager.get_applied_migrations(),
+    )
+    applied_set = frozenset(applied)
+
+    if not _TTY:
+        rows = (
+            ("applied" if m.version in applied_set else "pending", m.version, m.name)
+            for m in migrations
+        )
+        sys.stdout.write("".join("\t".join(row) + "\n" for row in rows))
+        return
+
+    # Create a table for display
+    table = Table(title="Migration Status")
+    table.add_column("Status", style="cyan", width=8)
+    table.add_column("Version", style="magenta")
+    table.add_column("Name", style="green")
+
+    add_row = table.add_row
+    applied_tag = "[green]✓[/green]"
+    pending_tag = "[yellow]pending[/yellow]"
+
+    pending_count = 0
+    for migration in migrations:
+        if migration.version in applied_set:
+            status = applied_tag
+        else:
+            status = pending_tag
+            pending_count += 1
+        add_row(status, migration.version, migration.name)
+
+    # Render table and summary into one buffer and flush it with a single write
+    with console.capture() as capture:
         console.print(table)
-
-        # Summary
-        pending_count = len([m for m in migrations if m.version not in applied])
         console.print(f"\nTotal: {len(migrations)} migrations")
         console.print(f"[green]Applied: {len(applied)}[/green]")
         console.print(f"[yellow]Pending: {pending_count}[/yellow]\n")
@@ -153,6 +174,4 @@ async def _show_status(config) -> None:
         if pending_count > 0:
             console.print("Run [cyan]vault migrate[/cyan] to apply pending migrations\n")
 
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1)
+    sys.stdout.write(capture.get())
@@ -4,18 +4,51 @@ vault orgs command - Organization management CLI.
 Create, list, and manage organizations via command line.
 """
 
-import asyncio
+import sys
 from typing import Optional
 from uuid import UUID
 
 import typer
 from rich.console import Console
-from rich.table import Table
 
-from ...config import load_config
 from ...client import Vault
+from .._cache import get_cached_org_id, invalidate_cached_org, put_cached_org_id
+from .._errors import cli_errors, err_console
+from .._loop import run_async
+from .._vault import get_vault
 
-console = Console()
+# orjson is an optional speedup; fall back to the stdlib parser
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# Skip rich's styling pipeline entirely when output is piped or redirected
+_TTY = sys.stdout.isatty()
+console = Console(force_terminal=_TTY, no_color=not _TTY, highlight=False)
+_cli_errors = cli_errors()
+
+
+async def _resolve_org_id(vault: Vault, slug: str) -> Optional[UUID]:
+    """
+    Resolve an organization slug to its ID, consulting the on-disk CLI cache first.
+
+    A slug can be renamed, or deleted and recreated, so a cached ID may be
+    up to a minute stale. Callers drop the entry whenever a lookup made with
+    it comes back empty or not found.
+    """
+    project = vault.config.supabase_url
+
+    org_id = get_cached_org_id(project, slug)
+    if org_id is not None:
+        return org_id
+
+    org = await vault.orgs.get_by_slug(slug)
+    if not org:
+        invalidate_cached_org(project, slug)
+        return None
+    put_cached_org_id(project, slug, org.id)
+    return org.id
 
 
 def orgs_create_command(
@@ -43,9 +76,10 @@ def orgs_create_command(
     """
     console.print("\n[bold cyan]Creating Organization[/bold cyan]\n")
 
-    asyncio.run(_create_org(name, slug, settings, metadata))
+    run_async(_create_org(name, slug, settings, metadata))
 
 
+@_cli_errors
 async def _create_org(
     name: str,
     slug: str,
@@ -53,42 +87,34 @@ async def _create_org(
     metadata: Optional[str],
 ) -> None:
     """Internal async function to create organization."""
-    import json
-
-    try:
-        config = load_config()
-        vault = await Vault.create()
-
-        # Parse JSON strings if provided
-        settings_dict = json.loads(settings) if settings else {}
-        metadata_dict = json.loads(metadata) if metadata else {}
-
-        org = await vault.orgs.create(
-            name=name,
-            slug=slug,
-            settings=settings_dict,
-            metadata=metadata_dict,
-        )
-
-        console.print(f"[green]✓[/green] Organization created successfully!")
-        console.print(f"\nID: [cyan]{org.id}[/cyan]")
-        console.print(f"Name: [cyan]{org.name}[/cyan]")
-        console.print(f"Slug: [cyan]{org.slug}[/cyan]")
-        console.print(f"Status: [cyan]{org.status}[/cyan]")
-
-        if org.settings:
-            console.print(f"Settings: [cyan]{org.settings}[/cyan]")
-        if org.metadata:
-            console.print(f"Metadata: [cyan]{org.metadata}[/cyan]")
-
-        console.print(f"Created: [cyan]{org.created_at}[/cyan]\n")
-
-    except json.JSONDecodeError as e:
-        console.print(f"[red]Error:[/red] Invalid JSON: {e}")
-        raise typer.Exit(1)
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1)
+    vault = await get_vault()
+
+    # Parse JSON strings if provided
+    settings_dict = _json_loads(settings) if settings else {}
+    metadata_dict = _json_loads(metadata) if metadata else {}
+
+    org = await vault.orgs.create(
+        name=name,
+        slug=slug,
+        settings=settings_dict,
+        metadata=metadata_dict,
+    )
+    put_cached_org_id(vault.config.supabase_url, org.slug, org.id)
+
+    lines = [
+        "[green]✓[/green] Organization created successfully!",
+        f"\nID: [cyan]{org.id}[/cyan]",
+        f"Name: [cyan]{org.name}[/cyan]",
+        f"Slug: [cyan]{org.slug}[/cyan]",
+        f"Status: [cyan]{org.status}[/cyan]",
+    ]
+    if org.settings:
+        lines.append(f"Settings: [cyan]{org.settings}[/cyan]")
+    if org.metadata:
+        lines.append(f"Metadata: [cyan]{org.metadata}[/cyan]")
+    lines.append(f"Created: [cyan]{org.created_at}[/cyan]\n")
+
+    console.print("\n".join(lines))
 
 
 def orgs_list_command(
@@ -100,6 +126,11 @@ def orgs_list_command(
         "-s",
         help="Filter by status (active, suspended, deleted)",
     ),
+    plain: bool = typer.Option(
+        False,
+        "--plain",
+        help="Write tab-separated rows without table formatting (default when piped)",
+    ),
 ) -> None:
     """
     List all organizations.
@@ -108,45 +139,60 @@ def orgs_list_command(
         $ vault orgs list
         $ vault orgs list --limit 10
         $ vault orgs list --status active
+        $ vault orgs list --plain | cut -f2
     """
-    console.print("\n[bold cyan]Organizations[/bold cyan]\n")
+    plain = plain or not _TTY
+    if not plain:
+        console.print("\n[bold cyan]Organizations[/bold cyan]\n")
 
-    asyncio.run(_list_orgs(limit, offset, status))
+    run_async(_list_orgs(limit, offset, status, plain))
 
 
-async def _list_orgs(limit: int, offset: int, status: Optional[str]) -> None:
+@_cli_errors
+async def _list_orgs(limit: int, offset: int, status: Optional[str], plain: bool = False) -> None:
     """Internal async function to list organizations."""
-    try:
-        config = load_config()
-        vault = await Vault.create()
+    from rich.table import Table
 
-        orgs = await vault.orgs.list(limit=limit, offset=offset, status=status)
+    vault = await get_vault()
 
-        if not orgs:
+    orgs = await vault.orgs.list(limit=limit, offset=offset, status=status)
+
+    if not orgs:
+        if not plain:
             console.print("[yellow]No organizations found[/yellow]\n")
-            return
-
-        # Create table
-        table = Table(title=f"Organizations (showing {len(orgs)})")
-        table.add_column("Name", style="cyan")
-        table.add_column("Slug", style="green")
-        table.add_column("Status", style="magenta")
-        table.add_column("Created", style="blue")
-
-        for org in orgs:
-            table.add_row(
-                org.name,
-                org.slug,
-                org.status,
-                org.created_at.strftime("%Y-%m-%d"),
+        return
+
+    if plain:
+        sys.stdout.write(
+            "".join(
+                f"{org.name}\t{org.slug}\t{org.status}\t{org.created_at.date().isoformat()}\n"
+                for org in orgs
             )
+        )
+        return
+
+    # Create table
+    table = Table(title=f"Organizations (showing {len(orgs)})")
+    table.add_column("Name", style="cyan")
+    table.add_column("Slug", style="green")
+    table.add_column("Status", style="magenta")
+    table.add_column("Created", style="blue")
+
+    add_row = table.add_row
+    for org in orgs:
+        add_row(
+            org.name,
+            org.slug,
+            org.status,
+            org.created_at.date().isoformat(),
+        )
 
+    # Render into one buffer and flush it with a single write
+    with console.capture() as capture:
         console.print(table)
         console.print()
 
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1)
+    sys.stdout.write(capture.get())
 
 
 def orgs_get_command(
@@ -160,43 +206,42 @@ def orgs_get_command(
     """
     console.print("\n[bold cyan]Organization Details[/bold cyan]\n")
 
-    asyncio.run(_get_org(slug))
+    run_async(_get_org(slug))
 
 
+@_cli_errors
 async def _get_org(slug: str) -> None:
     """Internal async function to get organization."""
-    try:
-        config = load_config()
-        vault = await Vault.create()
+    vault = await get_vault()
 
-        org = await vault.orgs.get_by_slug(slug)
+    # Always fetch the row: status, settings and updated_at must be current
+    org = await vault.orgs.get_by_slug(slug)
 
-        if not org:
-            console.print(f"[red]Organization not found:[/red] {slug}\n")
-            raise typer.Exit(1)
+    if not org:
+        invalidate_cached_org(vault.config.supabase_url, slug)
+        err_console.print(f"[red]Organization not found:[/red] {slug}\n")
+        raise typer.Exit(1)
 
-        console.print(f"ID: [cyan]{org.id}[/cyan]")
-        console.print(f"Name: [cyan]{org.name}[/cyan]")
-        console.print(f"Slug: [cyan]{org.slug}[/cyan]")
-        console.print(f"Status: [cyan]{org.status}[/cyan]")
-        console.print(f"Created: [cyan]{org.created_at}[/cyan]")
-        console.print(f"Updated: [cyan]{org.updated_at}[/cyan]")
+    put_cached_org_id(vault.config.supabase_url, slug, org.id)
 
-        if org.settings:
-            console.print(f"\nSettings:")
-            for key, value in org.settings.items():
-                console.print(f"  {key}: [cyan]{value}[/cyan]")
+    console.print(
+        f"ID: [cyan]{org.id}[/cyan]\n"
+        f"Name: [cyan]{org.name}[/cyan]\n"
+        f"Slug: [cyan]{org.slug}[/cyan]\n"
+        f"Status: [cyan]{org.status}[/cyan]\n"
+        f"Created: [cyan]{org.created_at}[/cyan]\n"
+        f"Updated: [cyan]{org.updated_at}[/cyan]"
+    )
 
-        if org.metadata:
-            console.print(f"\nMetadata:")
-            for key, value in org.metadata.items():
-                console.print(f"  {key}: [cyan]{value}[/cyan]")
+    if org.settings:
+        body = "\n".join(f"  {k}: [cyan]{v}[/cyan]" for k, v in org.settings.items())
+        console.print("\nSettings:\n" + body)
 
-        console.print()
+    if org.metadata:
+        body = "\n".join(f"  {k}: [cyan]{v}[/cyan]" for k, v in org.metadata.items())
+        console.print("\nMetadata:\n" + body)
 
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1)
+    console.print()
 
 
 def orgs_members_command(
@@ -209,6 +254,11 @@ def orgs_members_command(
         "-s",
         help="Filter by status (active, suspended, pending)",
     ),
+    plain: bool = typer.Option(
+        False,
+        "--plain",
+        help="Write tab-separated rows without table formatting (default when piped)",
+    ),
 ) -> None:
     """
     List members of an organization.
@@ -216,62 +266,80 @@ def orgs_members_command(
     Example:
         $ vault orgs members acme-corp
         $ vault orgs members acme-corp --status active
+        $ vault orgs members acme-corp --plain | cut -f1
     """
-    console.print(f"\n[bold cyan]Members of {slug}[/bold cyan]\n")
+    plain = plain or not _TTY
+    if not plain:
+        console.print(f"\n[bold cyan]Members of {slug}[/bold cyan]\n")
 
-    asyncio.run(_list_members(slug, limit, offset, status))
+    run_async(_list_members(slug, limit, offset, status, plain))
 
 
+@_cli_errors
 async def _list_members(
     slug: str,
     limit: int,
     offset: int,
     status: Optional[str],
+    plain: bool = False,
 ) -> None:
     """Internal async function to list organization members."""
-    try:
-        config = load_config()
-        vault = await Vault.create()
-
-        # Get organization first
-        org = await vault.orgs.get_by_slug(slug)
-        if not org:
-            console.print(f"[red]Organization not found:[/red] {slug}\n")
+    from rich.table import Table
+
+    vault = await get_vault()
+
+    # Resolve the organization and list its memberships in one request
+    memberships = await vault.memberships.list_by_organization_slug(
+        slug,
+        limit=limit,
+        offset=offset,
+        status=status,
+    )
+
+    if not memberships:
+        # Only an empty result needs the extra lookup to tell a missing org apart;
+        # skip the cache, since a stale ID would hide a deleted or renamed slug
+        invalidate_cached_org(vault.config.supabase_url, slug)
+        org_id = await _resolve_org_id(vault, slug)
+        if not org_id:
+            err_console.print(f"[red]Organization not found:[/red] {slug}\n")
             raise typer.Exit(1)
 
-        # List memberships
-        memberships = await vault.memberships.list_by_organization(
-            org.id,
-            limit=limit,
-            offset=offset,
-            status=status,
-        )
-
-        if not memberships:
+        if not plain:
             console.print("[yellow]No members found[/yellow]\n")
-            return
-
-        # Create table
-        table = Table(title=f"Members (showing {len(memberships)})")
-        table.add_column("User ID", style="cyan")
-        table.add_column("Role ID", style="green")
-        table.add_column("Status", style="magenta")
-        table.add_column("Joined", style="blue")
-
-        for membership in memberships:
-            table.add_row(
-                str(membership.user_id),
-                str(membership.role_id) if membership.role_id else "—",
-                membership.status,
-                membership.joined_at.strftime("%Y-%m-%d"),
+        return
+
+    if plain:
+        sys.stdout.write(
+            "".join(
+                f"{m.user_id}\t{m.role_id or ''}\t{m.status}\t{m.joined_at.date().isoformat()}\n"
+                for m in memberships
             )
+        )
+        return
+
+    # Create table
+    table = Table(title=f"Members (showing {len(memberships)})")
+    table.add_column("User ID", style="cyan")
+    table.add_column("Role ID", style="green")
+    table.add_column("Status", style="magenta")
+    table.add_column("Joined", style="blue")
+
+    add_row = table.add_row
+    for membership in memberships:
+        add_row(
+            str(membership.user_id),
+            str(membership.role_id) if membership.role_id else "—",
+            membership.status,
+            membership.joined_at.date().isoformat(),
+        )
 
+    # Render into one buffer and flush it with a single write
+    with console.capture() as capture:
         console.print(table)
         console.print()
 
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1)
+    sys.stdout.write(capture.get())
 
 
 def orgs_add_member_command(
@@ -291,54 +359,45 @@ def orgs_add_member_command(
         $ vault orgs add-member acme-corp user@example.com
         $ vault orgs add-member acme-corp user@example.com --role <role-uuid>
     """
+    # Validate the role ID before opening any connection
+    role_uuid = None
+    if role_id is not None:
+        try:
+            role_uuid = UUID(role_id)
+        except ValueError:
+            raise typer.BadParameter(
+                f"expected a UUID, got {role_id!r}", param_hint="'--role'"
+            ) from None
+
     console.print(f"\n[bold cyan]Adding Member to {slug}[/bold cyan]\n")
 
-    asyncio.run(_add_member(slug, user_email, role_id))
+    run_async(_add_member(slug, user_email, role_uuid))
 
 
+@_cli_errors
 async def _add_member(
     slug: str,
     user_email: str,
-    role_id: Optional[str],
+    role_uuid: Optional[UUID],
 ) -> None:
     """Internal async function to add member to organization."""
-    try:
-        config = load_config()
-        vault = await Vault.create()
-
-        # Get organization
-        org = await vault.orgs.get_by_slug(slug)
-        if not org:
-            console.print(f"[red]Organization not found:[/red] {slug}\n")
-            raise typer.Exit(1)
-
-        # Get user
-        user = await vault.users.get_by_email(user_email)
-        if not user:
-            console.print(f"[red]User not found:[/red] {user_email}\n")
-            raise typer.Exit(1)
-
-        # Create membership
-        role_uuid = UUID(role_id) if role_id else None
-        membership = await vault.memberships.create(
-            user_id=user.id,
-            organization_id=org.id,
-            role_id=role_uuid,
-        )
+    vault = await get_vault()
 
-        console.print(f"[green]✓[/green] Member added successfully!")
-        console.print(f"\nMembership ID: [cyan]{membership.id}[/cyan]")
-        console.print(f"User: [cyan]{user_email}[/cyan]")
-        console.print(f"Organization: [cyan]{slug}[/cyan]")
-        console.print(f"Role ID: [cyan]{membership.role_id or 'None'}[/cyan]")
-        console.print(f"Status: [cyan]{membership.status}[/cyan]\n")
+    # Resolve org and user and create the membership in one round-trip
+    membership = await vault.memberships.create_by_slug_and_email(
+        slug,
+        user_email,
+        role_id=role_uuid,
+    )
 
-    except ValueError as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1)
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1)
+    console.print(
+        "[green]✓[/green] Member added successfully!\n"
+        f"\nMembership ID: [cyan]{membership.id}[/cyan]\n"
+        f"User: [cyan]{user_email}[/cyan]\n"
+        f"Organization: [cyan]{slug}[/cyan]\n"
+        f"Role ID: [cyan]{membership.role_id or 'None'}[/cyan]\n"
+        f"Status: [cyan]{membership.status}[/cyan]\n"
+    )
 
 
 def orgs_remove_member_command(
@@ -360,51 +419,48 @@ def orgs_remove_member_command(
     """
     console.print(f"\n[bold cyan]Removing Member from {slug}[/bold cyan]\n")
 
-    asyncio.run(_remove_member(slug, user_email, yes))
+    # Confirm before connecting so a cancelled removal costs no requests
+    if not yes:
+        confirm = typer.confirm(
+            f"Remove {user_email} from {slug}?"
+        )
+        if not confirm:
+            console.print("[yellow]Cancelled[/yellow]\n")
+            raise typer.Exit(0)
+
+    run_async(_remove_member(slug, user_email))
 
 
+@_cli_errors
 async def _remove_member(
     slug: str,
     user_email: str,
-    yes: bool,
 ) -> None:
     """Internal async function to remove member from organization."""
-    try:
-        config = load_config()
-        vault = await Vault.create()
-
-        # Get organization
-        org = await vault.orgs.get_by_slug(slug)
-        if not org:
-            console.print(f"[red]Organization not found:[/red] {slug}\n")
-            raise typer.Exit(1)
+    vault = await get_vault()
 
-        # Get user
-        user = await vault.users.get_by_email(user_email)
-        if not user:
-            console.print(f"[red]User not found:[/red] {user_email}\n")
-            raise typer.Exit(1)
+    # Get organization
+    org_id = await _resolve_org_id(vault, slug)
+    if not org_id:
+        err_console.print(f"[red]Organization not found:[/red] {slug}\n")
+        raise typer.Exit(1)
 
-        # Confirm removal
-        if not yes:
-            confirm = typer.confirm(
-                f"Remove {user_email} from {slug}?"
-            )
-            if not confirm:
-                console.print("[yellow]Cancelled[/yellow]\n")
-                raise typer.Exit(0)
+    # Get user
+    user = await vault.users.get_by_email(user_email)
+    if not user:
+        invalidate_cached_org(vault.config.supabase_url, slug)
+        err_console.print(f"[red]User not found:[/red] {user_email}\n")
+        raise typer.Exit(1)
 
-        # Remove membership
+    # Remove membership
+    try:
         await vault.memberships.delete_by_user_and_org(
             user_id=user.id,
-            organization_id=org.id,
+            organization_id=org_id,
         )
+    except ValueError:
+        # A cached org may be stale; drop it so the next run re-fetches
+        invalidate_cached_org(vault.config.supabase_url, slug)
+        raise
 
-        console.print(f"[green]✓[/green] Member removed: {user_email}\n")
-
-    except ValueError as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1)
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1)
+    console.print(f"[green]✓[/green] Member removed: {user_email}\n")
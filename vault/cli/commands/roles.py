@@ -5,17 +5,86 @@ Create, list, and manage roles via command line.
 """
 
 import asyncio
-import json
+import re
+import sys
 from typing import List, Optional
 from uuid import UUID
 
 import typer
 from rich.console import Console
-from rich.table import Table
 
-from ...client import Vault
+from .._errors import cli_errors, err_console
+from .._json import check_output_format, write_json
+from .._loop import run_async
+from .._vault import get_vault
 
-console = Console()
+# orjson is an optional speedup; fall back to the stdlib parser
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# Skip rich's styling pipeline entirely when output is piped or redirected
+_TTY = sys.stdout.isatty()
+console = Console(force_terminal=_TTY, no_color=not _TTY, highlight=False)
+_cli_errors = cli_errors()
+
+
+# Fast path for the common --permissions shape: a flat JSON array of plain
+# permission strings like ["posts:read", "admin:*"]. Anything else (escapes,
+# unicode, nested values) goes through the JSON parser.
+_PERMISSIONS_ARRAY_RE = re.compile(r'\s*\[\s*(?:"[\w:*.\-]+"\s*(?:,\s*"[\w:*.\-]+"\s*)*)?\]\s*')
+_PERMISSION_RE = re.compile(r'"([\w:*.\-]+)"')
+
+
+def _parse_permissions(value: str) -> List[str]:
+    """Parse a --permissions JSON array."""
+    if _PERMISSIONS_ARRAY_RE.fullmatch(value):
+        return _PERMISSION_RE.findall(value)
+    return _json_loads(value)
+
+
+def _format_permissions(permissions: List[str], shown: int = 3) -> str:
+    """Summarize a permission list for a table cell."""
+    text = ", ".join(permissions[:shown])
+    if len(permissions) > shown:
+        text += f" (+{len(permissions) - shown} more)"
+    return text
+
+
+_PERMISSION_LINE = "  • [green]{}[/green]".format
+_NO_PERMISSIONS = "  [yellow]No permissions[/yellow]"
+
+
+def _permission_lines(permissions: List[str]) -> str:
+    """Format permissions as a bulleted markup block."""
+    return "\n".join(map(_PERMISSION_LINE, permissions)) or _NO_PERMISSIONS
+
+
+async def _require_org(vault, slug: str):
+    """Get an organization by slug, or report it missing and exit."""
+    org = await vault.orgs.get_by_slug(slug)
+    if not org:
+        err_console.print(f"[red]Organization not found:[/red] {slug}\n")
+        raise typer.Exit(1)
+    return org
+
+
+async def _require_role(vault, org_id: UUID, name: str):
+    """Get a role by name, or report it missing and exit."""
+    role = await vault.roles.get_by_name(org_id, name)
+    if not role:
+        err_console.print(f"[red]Role not found:[/red] {name}\n")
+        raise typer.Exit(1)
+    return role
+
+
+def _role_tsv(role) -> str:
+    """Format a role as a tab-separated line for piped output."""
+    return (
+        f"{role.name}\t{role.description or ''}\t{','.join(role.permissions)}\t"
+        f"{str(role.is_default).lower()}\t{str(role.is_system).lower()}\n"
+    )
 
 
 def roles_create_command(
@@ -49,9 +118,10 @@ def roles_create_command(
     """
     console.print("\n[bold cyan]Creating Role[/bold cyan]\n")
 
-    asyncio.run(_create_role(org_slug, name, permissions, description, default))
+    run_async(_create_role(org_slug, name, permissions, description, default))
 
 
+@_cli_errors
 async def _create_role(
     org_slug: str,
     name: str,
@@ -60,45 +130,39 @@ async def _create_role(
     default: bool,
 ) -> None:
     """Internal async function to create role."""
-    try:
-        vault = await Vault.create()
-
-        # Get organization first
-        org = await vault.orgs.get_by_slug(org_slug)
-        if not org:
-            console.print(f"[red]Organization not found:[/red] {org_slug}\n")
-            raise typer.Exit(1)
-
-        # Parse permissions
-        perms: List[str] = []
-        if permissions:
-            perms = json.loads(permissions)
-
-        role = await vault.roles.create(
-            organization_id=org.id,
-            name=name,
-            permissions=perms,
-            description=description,
-            is_default=default,
-        )
-
-        console.print(f"[green]✓[/green] Role created successfully!")
-        console.print(f"\nID: [cyan]{role.id}[/cyan]")
-        console.print(f"Name: [cyan]{role.name}[/cyan]")
-        console.print(f"Organization: [cyan]{org_slug}[/cyan]")
-        if role.description:
-            console.print(f"Description: [cyan]{role.description}[/cyan]")
-        console.print(f"Permissions: [cyan]{role.permissions}[/cyan]")
-        console.print(f"Default: [cyan]{role.is_default}[/cyan]")
-        console.print(f"System: [cyan]{role.is_system}[/cyan]")
-        console.print(f"Created: [cyan]{role.created_at}[/cyan]\n")
-
-    except json.JSONDecodeError as e:
-        console.print(f"[red]Error:[/red] Invalid JSON: {e}")
-        raise typer.Exit(1)
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1)
+    vault = await get_vault()
+
+    org = await _require_org(vault, org_slug)
+
+    # Parse permissions
+    perms: List[str] = []
+    if permissions:
+        perms = _parse_permissions(permissions)
+
+    role = await vault.roles.create(
+        organization_id=org.id,
+        name=name,
+        permissions=perms,
+        description=description,
+        is_default=default,
+    )
+
+    lines = [
+        "[green]✓[/green] Role created successfully!",
+        f"\nID: [cyan]{role.id}[/cyan]",
+        f"Name: [cyan]{role.name}[/cyan]",
+        f"Organization: [cyan]{org_slug}[/cyan]",
+    ]
+    if role.description:
+        lines.append(f"Description: [cyan]{role.description}[/cyan]")
+    lines += [
+        f"Permissions: [cyan]{role.permissions}[/cyan]",
+        f"Default: [cyan]{role.is_default}[/cyan]",
+        f"System: [cyan]{role.is_system}[/cyan]",
+        f"Created: [cyan]{role.created_at}[/cyan]\n",
+    ]
+
+    console.print("\n".join(lines))
 
 
 def roles_list_command(
@@ -110,6 +174,12 @@ def roles_list_command(
         "--all/--custom-only",
         help="Include system roles",
     ),
+    output: str = typer.Option(
+        "table",
+        "--output",
+        "-O",
+        help="Output format (table, json)",
+    ),
 ) -> None:
     """
     List roles for an organization.
@@ -118,71 +188,97 @@ def roles_list_command(
         $ vault roles list acme-corp
         $ vault roles list acme-corp --custom-only
         $ vault roles list acme-corp --limit 10
+        $ vault roles list acme-corp --output json | jq '.[].name'
     """
-    console.print(f"\n[bold cyan]Roles for {org_slug}[/bold cyan]\n")
+    output = check_output_format(output)
+    if _TTY and output == "table":
+        console.print(f"\n[bold cyan]Roles for {org_slug}[/bold cyan]\n")
 
-    asyncio.run(_list_roles(org_slug, limit, offset, all_roles))
+    run_async(_list_roles(org_slug, limit, offset, all_roles, output))
 
 
+@_cli_errors
 async def _list_roles(
     org_slug: str,
     limit: int,
     offset: int,
     include_system: bool,
+    output: str = "table",
 ) -> None:
     """Internal async function to list roles."""
-    try:
-        vault = await Vault.create()
-
-        # Get organization first
-        org = await vault.orgs.get_by_slug(org_slug)
-        if not org:
-            console.print(f"[red]Organization not found:[/red] {org_slug}\n")
-            raise typer.Exit(1)
-
-        roles = await vault.roles.list_by_organization(
-            org.id,
-            limit=limit,
-            offset=offset,
-            include_system=include_system,
-        )
+    from rich.table import Table
+
+    vault = await get_vault()
 
-        if not roles:
+    org = await _require_org(vault, org_slug)
+
+    # Rows are written as each page arrives rather than after the whole list
+    roles = vault.roles.iter_by_organization(
+        org.id,
+        limit=limit,
+        offset=offset,
+        include_system=include_system,
+    )
+
+    if output == "json":
+        write_json([role.model_dump() async for role in roles])
+        return
+
+    first = await anext(roles, None)
+    if first is None:
+        if _TTY:
             console.print("[yellow]No roles found[/yellow]\n")
-            return
-
-        # Create table
-        table = Table(title=f"Roles (showing {len(roles)})")
-        table.add_column("Name", style="cyan")
-        table.add_column("Description", style="white")
-        table.add_column("Permissions", style="green")
-        table.add_column("Default", style="magenta")
-        table.add_column("System", style="blue")
-
-        for role in roles:
-            perms_str = ", ".join(role.permissions[:3])
-            if len(role.permissions) > 3:
-                perms_str += f" (+{len(role.permissions) - 3} more)"
-
-            table.add_row(
-                role.name,
-                role.description or "—",
-                perms_str or "—",
-                "✓" if role.is_default else "—",
-                "✓" if role.is_system else "—",
-            )
-
-        console.print(table)
-        console.print()
-
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1)
+        return
+
+    if not _TTY:
+        write = sys.stdout.write
+        write(_role_tsv(first))
+        async for role in roles:
+            write(_role_tsv(role))
+        return
+
+    from rich.live import Live
+
+    # Create table
+    table = Table(title="Roles")
+    table.add_column("Name", style="cyan")
+    table.add_column("Description", style="white")
+    table.add_column("Permissions", style="green")
+    table.add_column("Default", style="magenta")
+    table.add_column("System", style="blue")
+
+    add_row = table.add_row
+    check, dash = "✓", "—"
+
+    def add(role) -> None:
+        add_row(
+            role.name,
+            role.description or dash,
+            _format_permissions(role.permissions) or dash,
+            check if role.is_default else dash,
+            check if role.is_system else dash,
+        )
+
+    add(first)
+    count = 1
+    with Live(table, console=console, refresh_per_second=10):
+        async for role in roles:
+            add(role)
+            count += 1
+        table.title = f"Roles (showing {count})"
+
+    console.print()
 
 
 def roles_get_command(
     org_slug: str = typer.Argument(..., help="Organization slug"),
     name: str = typer.Argument(..., help="Role name"),
+    output: str = typer.Option(
+        "table",
+        "--output",
+        "-O",
+        help="Output format (table, json)",
+    ),
 ) -> None:
     """
     Get a role by name.
@@ -190,51 +286,46 @@ def roles_get_command(
     Example:
         $ vault roles get acme-corp Editor
         $ vault roles get acme-corp Admin
+        $ vault roles get acme-corp Editor --output json
     """
-    console.print("\n[bold cyan]Role Details[/bold cyan]\n")
+    output = check_output_format(output)
+    if output == "table":
+        console.print("\n[bold cyan]Role Details[/bold cyan]\n")
 
-    asyncio.run(_get_role(org_slug, name))
+    run_async(_get_role(org_slug, name, output))
 
 
-async def _get_role(org_slug: str, name: str) -> None:
+@_cli_errors
+async def _get_role(org_slug: str, name: str, output: str = "table") -> None:
     """Internal async function to get role."""
-    try:
-        vault = await Vault.create()
-
-        # Get organization first
-        org = await vault.orgs.get_by_slug(org_slug)
-        if not org:
-            console.print(f"[red]Organization not found:[/red] {org_slug}\n")
-            raise typer.Exit(1)
-
-        role = await vault.roles.get_by_name(org.id, name)
-
-        if not role:
-            console.print(f"[red]Role not found:[/red] {name}\n")
-            raise typer.Exit(1)
-
-        console.print(f"ID: [cyan]{role.id}[/cyan]")
-        console.print(f"Name: [cyan]{role.name}[/cyan]")
-        console.print(f"Organization: [cyan]{org_slug}[/cyan]")
-        if role.description:
-            console.print(f"Description: [cyan]{role.description}[/cyan]")
-        console.print(f"Default: [cyan]{role.is_default}[/cyan]")
-        console.print(f"System: [cyan]{role.is_system}[/cyan]")
-        console.print(f"Created: [cyan]{role.created_at}[/cyan]")
-        console.print(f"Updated: [cyan]{role.updated_at}[/cyan]")
-
-        console.print("\n[bold]Permissions:[/bold]")
-        if role.permissions:
-            for perm in role.permissions:
-                console.print(f"  • [green]{perm}[/green]")
-        else:
-            console.print("  [yellow]No permissions[/yellow]")
-
-        console.print()
-
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1)
+    vault = await get_vault()
+
+    org = await _require_org(vault, org_slug)
+
+    role = await _require_role(vault, org.id, name)
+
+    if output == "json":
+        write_json(role.model_dump())
+        return
+
+    lines = [
+        f"ID: [cyan]{role.id}[/cyan]",
+        f"Name: [cyan]{role.name}[/cyan]",
+        f"Organization: [cyan]{org_slug}[/cyan]",
+    ]
+    if role.description:
+        lines.append(f"Description: [cyan]{role.description}[/cyan]")
+    lines += [
+        f"Default: [cyan]{role.is_default}[/cyan]",
+        f"System: [cyan]{role.is_system}[/cyan]",
+        f"Created: [cyan]{role.created_at}[/cyan]",
+        f"Updated: [cyan]{role.updated_at}[/cyan]",
+        "\n[bold]Permissions:[/bold]",
+        _permission_lines(role.permissions),
+        "",
+    ]
+
+    console.print("\n".join(lines))
 
 
 def roles_update_command(
@@ -274,9 +365,10 @@ def roles_update_command(
     """
     console.print("\n[bold cyan]Updating Role[/bold cyan]\n")
 
-    asyncio.run(_update_role(org_slug, name, new_name, permissions, description, default))
+    run_async(_update_role(org_slug, name, new_name, permissions, description, default))
 
 
+@_cli_errors
 async def _update_role(
     org_slug: str,
     name: str,
@@ -286,52 +378,39 @@ async def _update_role(
     default: Optional[bool],
 ) -> None:
     """Internal async function to update role."""
-    try:
-        vault = await Vault.create()
-
-        # Get organization first
-        org = await vault.orgs.get_by_slug(org_slug)
-        if not org:
-            console.print(f"[red]Organization not found:[/red] {org_slug}\n")
-            raise typer.Exit(1)
-
-        # Get role
-        role = await vault.roles.get_by_name(org.id, name)
-        if not role:
-            console.print(f"[red]Role not found:[/red] {name}\n")
-            raise typer.Exit(1)
-
-        # Parse permissions
-        perms: Optional[List[str]] = None
-        if permissions:
-            perms = json.loads(permissions)
-
-        updated = await vault.roles.update(
-            role_id=role.id,
-            name=new_name,
-            permissions=perms,
-            description=description,
-            is_default=default,
-        )
+    vault = await get_vault()
 
-        console.print(f"[green]✓[/green] Role updated successfully!")
-        console.print(f"\nID: [cyan]{updated.id}[/cyan]")
-        console.print(f"Name: [cyan]{updated.name}[/cyan]")
-        if updated.description:
-            console.print(f"Description: [cyan]{updated.description}[/cyan]")
-        console.print(f"Permissions: [cyan]{updated.permissions}[/cyan]")
-        console.print(f"Default: [cyan]{updated.is_default}[/cyan]")
-        console.print(f"Updated: [cyan]{updated.updated_at}[/cyan]\n")
-
-    except json.JSONDecodeError as e:
-        console.print(f"[red]Error:[/red] Invalid JSON: {e}")
-        raise typer.Exit(1)
-    except ValueError as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1)
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1)
+    org = await _require_org(vault, org_slug)
+
+    role = await _require_role(vault, org.id, name)
+
+    # Parse permissions
+    perms: Optional[List[str]] = None
+    if permissions:
+        perms = _parse_permissions(permissions)
+
+    updated = await vault.roles.update(
+        role_id=role.id,
+        name=new_name,
+        permissions=perms,
+        description=description,
+        is_default=default,
+    )
+
+    lines = [
+        "[green]✓[/green] Role updated successfully!",
+        f"\nID: [cyan]{updated.id}[/cyan]",
+        f"Name: [cyan]{updated.name}[/cyan]",
+    ]
+    if updated.description:
+        lines.append(f"Description: [cyan]{updated.description}[/cyan]")
+    lines += [
+        f"Permissions: [cyan]{updated.permissions}[/cyan]",
+        f"Default: [cyan]{updated.is_default}[/cyan]",
+        f"Updated: [cyan]{updated.updated_at}[/cyan]\n",
+    ]
+
+    console.print("\n".join(lines))
 
 
 def roles_delete_command(
@@ -355,50 +434,36 @@ def roles_delete_command(
     """
     console.print("\n[bold cyan]Deleting Role[/bold cyan]\n")
 
-    asyncio.run(_delete_role(org_slug, name, yes))
+    # Confirm before connecting so a cancelled delete costs no requests;
+    # system roles are still rejected before anything is deleted
+    if not yes:
+        confirm = typer.confirm(
+            f"Delete role '{name}' from {org_slug}? Members with this role will lose it."
+        )
+        if not confirm:
+            console.print("[yellow]Cancelled[/yellow]\n")
+            raise typer.Exit(0)
+
+    run_async(_delete_role(org_slug, name))
 
 
-async def _delete_role(org_slug: str, name: str, yes: bool) -> None:
+@_cli_errors
+async def _delete_role(org_slug: str, name: str) -> None:
     """Internal async function to delete role."""
-    try:
-        vault = await Vault.create()
-
-        # Get organization first
-        org = await vault.orgs.get_by_slug(org_slug)
-        if not org:
-            console.print(f"[red]Organization not found:[/red] {org_slug}\n")
-            raise typer.Exit(1)
-
-        # Get role
-        role = await vault.roles.get_by_name(org.id, name)
-        if not role:
-            console.print(f"[red]Role not found:[/red] {name}\n")
-            raise typer.Exit(1)
-
-        if role.is_system:
-            console.print(f"[red]Error:[/red] Cannot delete system role: {name}\n")
-            raise typer.Exit(1)
-
-        # Confirm deletion
-        if not yes:
-            confirm = typer.confirm(
-                f"Delete role '{name}' from {org_slug}? Members with this role will lose it."
-            )
-            if not confirm:
-                console.print("[yellow]Cancelled[/yellow]\n")
-                raise typer.Exit(0)
-
-        await vault.roles.delete(role.id)
-
-        console.print(f"[green]✓[/green] Role deleted: {name}\n")
-
-    except ValueError as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1)
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
+    vault = await get_vault()
+
+    org = await _require_org(vault, org_slug)
+
+    role = await _require_role(vault, org.id, name)
+
+    if role.is_system:
+        err_console.print(f"[red]Error:[/red] Cannot delete system role: {name}\n")
         raise typer.Exit(1)
 
+    await vault.roles.delete(role.id)
+
+    console.print(f"[green]✓[/green] Role deleted: {name}\n")
+
 
 def roles_add_permission_command(
     org_slug: str = typer.Argument(..., help="Organization slug"),
@@ -414,40 +479,25 @@ def roles_add_permission_command(
     """
     console.print("\n[bold cyan]Adding Permission[/bold cyan]\n")
 
-    asyncio.run(_add_permission(org_slug, name, permission))
+    run_async(_add_permission(org_slug, name, permission))
 
 
+@_cli_errors
 async def _add_permission(org_slug: str, name: str, permission: str) -> None:
     """Internal async function to add permission."""
-    try:
-        vault = await Vault.create()
-
-        # Get organization first
-        org = await vault.orgs.get_by_slug(org_slug)
-        if not org:
-            console.print(f"[red]Organization not found:[/red] {org_slug}\n")
-            raise typer.Exit(1)
-
-        # Get role
-        role = await vault.roles.get_by_name(org.id, name)
-        if not role:
-            console.print(f"[red]Role not found:[/red] {name}\n")
-            raise typer.Exit(1)
-
-        updated = await vault.roles.add_permissions(role.id, [permission])
-
-        console.print(f"[green]✓[/green] Permission added: {permission}")
-        console.print(f"\nCurrent permissions for '{name}':")
-        for perm in updated.permissions:
-            console.print(f"  • [green]{perm}[/green]")
-        console.print()
-
-    except ValueError as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1)
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1)
+    vault = await get_vault()
+
+    org = await _require_org(vault, org_slug)
+
+    role = await _require_role(vault, org.id, name)
+
+    updated = await vault.roles.add_permissions(role.id, [permission])
+
+    console.print(
+        f"[green]✓[/green] Permission added: {permission}\n"
+        f"\nCurrent permissions for '{name}':\n"
+        f"{_permission_lines(updated.permissions)}\n"
+    )
 
 
 def roles_remove_permission_command(
@@ -463,48 +513,30 @@ def roles_remove_permission_command(
     """
     console.print("\n[bold cyan]Removing Permission[/bold cyan]\n")
 
-    asyncio.run(_remove_permission(org_slug, name, permission))
+    run_async(_remove_permission(org_slug, name, permission))
 
 
+@_cli_errors
 async def _remove_permission(org_slug: str, name: str, permission: str) -> None:
     """Internal async function to remove permission."""
-    try:
-        vault = await Vault.create()
-
-        # Get organization first
-        org = await vault.orgs.get_by_slug(org_slug)
-        if not org:
-            console.print(f"[red]Organization not found:[/red] {org_slug}\n")
-            raise typer.Exit(1)
-
-        # Get role
-        role = await vault.roles.get_by_name(org.id, name)
-        if not role:
-            console.print(f"[red]Role not found:[/red] {name}\n")
-            raise typer.Exit(1)
-
-        if permission not in role.permissions:
-            console.print(f"[yellow]Permission not found on role:[/yellow] {permission}\n")
-            raise typer.Exit(1)
-
-        updated = await vault.roles.remove_permissions(role.id, [permission])
-
-        console.print(f"[green]✓[/green] Permission removed: {permission}")
-        console.print(f"\nCurrent permissions for '{name}':")
-        if updated.permissions:
-            for perm in updated.permissions:
-                console.print(f"  • [green]{perm}[/green]")
-        else:
-            console.print("  [yellow]No permissions[/yellow]")
-        console.print()
-
-    except ValueError as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1)
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
+    vault = await get_vault()
+
+    org = await _require_org(vault, org_slug)
+
+    role = await _require_role(vault, org.id, name)
+
+    if permission not in frozenset(role.permissions):
+        console.print(f"[yellow]Permission not found on role:[/yellow] {permission}\n")
         raise typer.Exit(1)
 
+    updated = await vault.roles.remove_permissions(role.id, [permission])
+
+    console.print(
+        f"[green]✓[/green] Permission removed: {permission}\n"
+        f"\nCurrent permissions for '{name}':\n"
+        f"{_permission_lines(updated.permissions)}\n"
+    )
+
 
 def roles_init_system_command(
     org_slug: str = typer.Argument(..., help="Organization slug"),
@@ -519,47 +551,40 @@ def roles_init_system_command(
     """
     console.print("\n[bold cyan]Initializing System Roles[/bold cyan]\n")
 
-    asyncio.run(_init_system_roles(org_slug))
+    run_async(_init_system_roles(org_slug))
 
 
+@_cli_errors
 async def _init_system_roles(org_slug: str) -> None:
     """Internal async function to initialize system roles."""
-    try:
-        vault = await Vault.create()
-
-        # Get organization first
-        org = await vault.orgs.get_by_slug(org_slug)
-        if not org:
-            console.print(f"[red]Organization not found:[/red] {org_slug}\n")
-            raise typer.Exit(1)
-
-        # Check if system roles already exist
-        existing = await vault.roles.list_by_organization(org.id, include_system=True)
-        system_roles = [r for r in existing if r.is_system]
-
-        if system_roles:
-            console.print(f"[yellow]System roles already exist for {org_slug}:[/yellow]")
-            for role in system_roles:
-                console.print(f"  • {role.name}")
-            console.print()
-            raise typer.Exit(1)
-
-        roles = await vault.roles.create_system_roles(org.id)
-
-        console.print(f"[green]✓[/green] System roles created!")
-        console.print()
-
-        for role in roles:
-            console.print(f"[bold]{role.name}[/bold]")
-            console.print(f"  Description: {role.description}")
-            console.print(f"  Permissions: {role.permissions}")
-            console.print(f"  Default: {role.is_default}")
-            console.print()
-
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
+    vault = await get_vault()
+
+    org = await _require_org(vault, org_slug)
+
+    # Check if system roles already exist
+    system_roles = await vault.roles.list_by_organization(org.id, system_only=True)
+
+    if system_roles:
+        console.print(
+            f"[yellow]System roles already exist for {org_slug}:[/yellow]\n"
+            + "".join(f"  • {role.name}\n" for role in system_roles)
+        )
         raise typer.Exit(1)
 
+    roles = await vault.roles.create_system_roles(org.id)
+
+    lines = ["[green]✓[/green] System roles created!", ""]
+    for role in roles:
+        lines.extend([
+            f"[bold]{role.name}[/bold]",
+            f"  Description: {role.description}",
+            f"  Permissions: {role.permissions}",
+            f"  Default: {role.is_default}",
+            "",
+        ])
+
+    console.print("\n".join(lines))
+
 
 def roles_assign_command(
     org_slug: str = typer.Argument(..., help="Organization slug"),
@@ -577,53 +602,50 @@ def roles_assign_command(
     """
     console.print("\n[bold cyan]Assigning Role[/bold cyan]\n")
 
-    asyncio.run(_assign_role(org_slug, user_email, role_name))
+    run_async(_assign_role(org_slug, user_email, role_name))
 
 
+@_cli_errors
 async def _assign_role(org_slug: str, user_email: str, role_name: str) -> None:
     """Internal async function to assign role."""
-    try:
-        vault = await Vault.create()
-
-        # Get organization first
-        org = await vault.orgs.get_by_slug(org_slug)
-        if not org:
-            console.print(f"[red]Organization not found:[/red] {org_slug}\n")
-            raise typer.Exit(1)
-
-        # Get user
-        user = await vault.users.get_by_email(user_email)
-        if not user:
-            console.print(f"[red]User not found:[/red] {user_email}\n")
-            raise typer.Exit(1)
-
-        # Get role
-        role = await vault.roles.get_by_name(org.id, role_name)
-        if not role:
-            console.print(f"[red]Role not found:[/red] {role_name}\n")
-            raise typer.Exit(1)
-
-        # Get membership
-        membership = await vault.memberships.get_by_user_and_org(user.id, org.id)
-        if not membership:
-            console.print(f"[red]User is not a member of {org_slug}[/red]\n")
-            raise typer.Exit(1)
-
-        # Update membership with role
-        updated = await vault.memberships.update(
-            membership_id=membership.id,
-            role_id=role.id,
-        )
-
-        console.print(f"[green]✓[/green] Role assigned!")
-        console.print(f"\nUser: [cyan]{user_email}[/cyan]")
-        console.print(f"Organization: [cyan]{org_slug}[/cyan]")
-        console.print(f"Role: [cyan]{role_name}[/cyan]")
-        console.print(f"Permissions: [cyan]{role.permissions}[/cyan]\n")
+    vault = await get_vault()
+
+    # Organization and user lookups are independent, so run them together.
+    # The plain lookups are gathered (not the _require_* helpers) so a
+    # missing entity can't exit while its sibling request is still running.
+    org, user = await asyncio.gather(
+        vault.orgs.get_by_slug(org_slug),
+        vault.users.get_by_email(user_email),
+    )
+    if not org:
+        err_console.print(f"[red]Organization not found:[/red] {org_slug}\n")
+        raise typer.Exit(1)
+    if not user:
+        err_console.print(f"[red]User not found:[/red] {user_email}\n")
+        raise typer.Exit(1)
 
-    except ValueError as e:
-        console.print(f"[red]Error:[/red] {e}")
+    # Role and membership both only need the org and user IDs
+    role, membership = await asyncio.gather(
+        vault.roles.get_by_name(org.id, role_name),
+        vault.memberships.get_by_user_and_org(user.id, org.id),
+    )
+    if not role:
+        err_console.print(f"[red]Role not found:[/red] {role_name}\n")
         raise typer.Exit(1)
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
+    if not membership:
+        err_console.print(f"[red]User is not a member of {org_slug}[/red]\n")
         raise typer.Exit(1)
+
+    # Update membership with role
+    updated = await vault.memberships.update(
+        membership_id=membership.id,
+        role_id=role.id,
+    )
+
+    console.print(
+        "[green]✓[/green] Role assigned!\n"
+        f"\nUser: [cyan]{user_email}[/cyan]\n"
+        f"Organization: [cyan]{org_slug}[/cyan]\n"
+        f"Role: [cyan]{role_name}[/cyan]\n"
+        f"Permissions: [cyan]{role.permissions}[/cyan]\n"
+    )
@@ -4,18 +4,31 @@ vault users command - User management CLI.
 Create, list, update, and delete users via command line.
 """
 
-import asyncio
+import sys
 from typing import Optional
 from uuid import UUID
 
 import typer
 from rich.console import Console
-from rich.table import Table
 
-from ...config import load_config
-from ...client import Vault
+from .._errors import cli_errors, err_console
+from .._json import check_output_format, write_json
+from .._loop import run_async
+from .._vault import get_vault
 
-console = Console()
+# Skip rich's styling pipeline entirely when output is piped or redirected
+_TTY = sys.stdout.isatty()
+console = Console(force_terminal=_TTY, no_color=not _TTY, highlight=False)
+_cli_errors = cli_errors()
+
+
+async def _require_user(vault, email: str):
+    """Get a user by email, or report them missing and exit."""
+    user = await vault.users.get_by_email(email)
+    if not user:
+        err_console.print(f"[red]User not found:[/red] {email}\n")
+        raise typer.Exit(1)
+    return user
 
 
 def users_create_command(
@@ -50,9 +63,10 @@ def users_create_command(
     """
     console.print("\n[bold cyan]Creating User[/bold cyan]\n")
 
-    asyncio.run(_create_user(email, password, display_name, confirm))
+    run_async(_create_user(email, password, display_name, confirm))
 
 
+@_cli_errors
 async def _create_user(
     email: str,
     password: Optional[str],
@@ -60,27 +74,23 @@ async def _create_user(
     confirm: bool,
 ) -> None:
     """Internal async function to create user."""
-    try:
-        config = load_config()
-        vault = await Vault.create()
-
-        user = await vault.users.create(
-            email=email,
-            password=password,
-            display_name=display_name,
-            email_confirm=confirm,
-        )
+    vault = await get_vault()
 
-        console.print(f"[green]✓[/green] User created successfully!")
-        console.print(f"\nID: [cyan]{user.id}[/cyan]")
-        console.print(f"Email: [cyan]{user.email}[/cyan]")
-        console.print(f"Display Name: [cyan]{user.display_name or 'N/A'}[/cyan]")
-        console.print(f"Status: [cyan]{user.status}[/cyan]")
-        console.print(f"Email Verified: [cyan]{user.email_verified}[/cyan]\n")
+    user = await vault.users.create(
+        email=email,
+        password=password,
+        display_name=display_name,
+        email_confirm=confirm,
+    )
 
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1)
+    console.print(
+        "[green]✓[/green] User created successfully!\n"
+        f"\nID: [cyan]{user.id}[/cyan]\n"
+        f"Email: [cyan]{user.email}[/cyan]\n"
+        f"Display Name: [cyan]{user.display_name or 'N/A'}[/cyan]\n"
+        f"Status: [cyan]{user.status}[/cyan]\n"
+        f"Email Verified: [cyan]{user.email_verified}[/cyan]\n"
+    )
 
 
 def users_list_command(
@@ -92,6 +102,12 @@ def users_list_command(
         "-s",
         help="Filter by status (active, suspended, deleted)",
     ),
+    output: str = typer.Option(
+        "table",
+        "--output",
+        "-O",
+        help="Output format (table, json)",
+    ),
 ) -> None:
     """
     List all users.
@@ -100,97 +116,127 @@ def users_list_command(
         $ vault users list
         $ vault users list --limit 10
         $ vault users list --status active
+        $ vault users list --output json | jq '.[].email'
     """
-    console.print("\n[bold cyan]Users[/bold cyan]\n")
+    output = check_output_format(output)
+    if _TTY and output == "table":
+        console.print("\n[bold cyan]Users[/bold cyan]\n")
 
-    asyncio.run(_list_users(limit, offset, status))
+    run_async(_list_users(limit, offset, status, output))
 
 
-async def _list_users(limit: int, offset: int, status: Optional[str]) -> None:
+@_cli_errors
+async def _list_users(
+    limit: int,
+    offset: int,
+    status: Optional[str],
+    output: str = "table",
+) -> None:
     """Internal async function to list users."""
-    try:
-        config = load_config()
-        vault = await Vault.create()
+    from rich.table import Table
 
-        users = await vault.users.list(limit=limit, offset=offset, status=status)
+    vault = await get_vault()
 
-        if not users:
+    users = await vault.users.list(limit=limit, offset=offset, status=status)
+
+    if output == "json":
+        write_json([user.model_dump() for user in users])
+        return
+
+    if not users:
+        if _TTY:
             console.print("[yellow]No users found[/yellow]\n")
-            return
-
-        # Create table
-        table = Table(title=f"Users (showing {len(users)})")
-        table.add_column("Email", style="cyan")
-        table.add_column("Display Name", style="green")
-        table.add_column("Status", style="magenta")
-        table.add_column("Verified", style="yellow")
-        table.add_column("Created", style="blue")
-
-        for user in users:
-            table.add_row(
-                user.email,
-                user.display_name or "—",
-                user.status,
-                "✓" if user.email_verified else "✗",
-                user.created_at.strftime("%Y-%m-%d"),
+        return
+
+    if not _TTY:
+        sys.stdout.write(
+            "".join(
+                f"{user.email}\t{user.display_name or ''}\t{user.status}\t"
+                f"{str(user.email_verified).lower()}\t{user.created_at.strftime('%Y-%m-%d')}\n"
+                for user in users
             )
+        )
+        return
+
+    # Create table
+    table = Table(title=f"Users (showing {len(users)})")
+    table.add_column("Email", style="cyan")
+    table.add_column("Display Name", style="green")
+    table.add_column("Status", style="magenta")
+    table.add_column("Verified", style="yellow")
+    table.add_column("Created", style="blue")
+
+    rows = [
+        (
+            user.email,
+            user.display_name or "—",
+            user.status,
+            "✓" if user.email_verified else "✗",
+            user.created_at.strftime("%Y-%m-%d"),
+        )
+        for user in users
+    ]
 
-        console.print(table)
-        console.print()
+    add_row = table.add_row
+    for row in rows:
+        add_row(*row)
 
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1)
+    console.print(table)
+    console.print()
 
 
 def users_get_command(
     email: str = typer.Argument(..., help="User email address"),
+    output: str = typer.Option(
+        "table",
+        "--output",
+        "-O",
+        help="Output format (table, json)",
+    ),
 ) -> None:
     """
     Get a user by email.
 
     Example:
         $ vault users get user@example.com
+        $ vault users get user@example.com --output json
     """
-    console.print("\n[bold cyan]User Details[/bold cyan]\n")
+    output = check_output_format(output)
+    if output == "table":
+        console.print("\n[bold cyan]User Details[/bold cyan]\n")
 
-    asyncio.run(_get_user(email))
+    run_async(_get_user(email, output))
 
 
-async def _get_user(email: str) -> None:
+@_cli_errors
+async def _get_user(email: str, output: str = "table") -> None:
     """Internal async function to get user."""
-    try:
-        config = load_config()
-        vault = await Vault.create()
-
-        user = await vault.users.get_by_email(email)
-
-        if not user:
-            console.print(f"[red]User not found:[/red] {email}\n")
-            raise typer.Exit(1)
-
-        console.print(f"ID: [cyan]{user.id}[/cyan]")
-        console.print(f"Email: [cyan]{user.email}[/cyan]")
-        console.print(f"Display Name: [cyan]{user.display_name or 'N/A'}[/cyan]")
-        console.print(f"Status: [cyan]{user.status}[/cyan]")
-        console.print(f"Email Verified: [cyan]{user.email_verified}[/cyan]")
-        console.print(f"Auth Provider: [cyan]{user.auth_provider}[/cyan]")
-        console.print(f"Created: [cyan]{user.created_at}[/cyan]")
-        console.print(f"Updated: [cyan]{user.updated_at}[/cyan]")
-
-        if user.last_sign_in_at:
-            console.print(f"Last Sign In: [cyan]{user.last_sign_in_at}[/cyan]")
-
-        if user.metadata:
-            console.print(f"\nMetadata:")
-            for key, value in user.metadata.items():
-                console.print(f"  {key}: [cyan]{value}[/cyan]")
-
-        console.print()
-
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1)
+    vault = await get_vault()
+
+    user = await _require_user(vault, email)
+
+    if output == "json":
+        write_json(user.model_dump())
+        return
+
+    lines = [
+        f"ID: [cyan]{user.id}[/cyan]",
+        f"Email: [cyan]{user.email}[/cyan]",
+        f"Display Name: [cyan]{user.display_name or 'N/A'}[/cyan]",
+        f"Status: [cyan]{user.status}[/cyan]",
+        f"Email Verified: [cyan]{user.email_verified}[/cyan]",
+        f"Auth Provider: [cyan]{user.auth_provider}[/cyan]",
+        f"Created: [cyan]{user.created_at}[/cyan]",
+        f"Updated: [cyan]{user.updated_at}[/cyan]",
+    ]
+    if user.last_sign_in_at:
+        lines.append(f"Last Sign In: [cyan]{user.last_sign_in_at}[/cyan]")
+    if user.metadata:
+        lines.append("\nMetadata:")
+        lines.extend(f"  {k}: [cyan]{v}[/cyan]" for k, v in user.metadata.items())
+    lines.append("")
+
+    console.print("\n".join(lines))
 
 
 def users_delete_command(
@@ -219,36 +265,27 @@ def users_delete_command(
     """
     console.print("\n[bold cyan]Delete User[/bold cyan]\n")
 
-    asyncio.run(_delete_user(email, hard, yes))
-
-
-async def _delete_user(email: str, hard: bool, yes: bool) -> None:
-    """Internal async function to delete user."""
-    try:
-        config = load_config()
-        vault = await Vault.create()
+    # Confirm before connecting so a cancelled delete costs no requests
+    if not yes:
+        delete_type = "permanently delete" if hard else "soft delete"
+        confirm = typer.confirm(
+            f"Are you sure you want to {delete_type} {email}?"
+        )
+        if not confirm:
+            console.print("[yellow]Cancelled[/yellow]\n")
+            raise typer.Exit(0)
 
-        user = await vault.users.get_by_email(email)
+    run_async(_delete_user(email, hard))
 
-        if not user:
-            console.print(f"[red]User not found:[/red] {email}\n")
-            raise typer.Exit(1)
 
-        # Confirm deletion
-        if not yes:
-            delete_type = "permanently delete" if hard else "soft delete"
-            confirm = typer.confirm(
-                f"Are you sure you want to {delete_type} {email}?"
-            )
-            if not confirm:
-                console.print("[yellow]Cancelled[/yellow]\n")
-                raise typer.Exit(0)
+@_cli_errors
+async def _delete_user(email: str, hard: bool) -> None:
+    """Internal async function to delete user."""
+    vault = await get_vault()
 
-        await vault.users.delete(user.id, soft_delete=not hard)
+    user = await _require_user(vault, email)
 
-        delete_msg = "permanently deleted" if hard else "marked as deleted"
-        console.print(f"[green]✓[/green] User {delete_msg}: {email}\n")
+    await vault.users.delete(user.id, soft_delete=not hard)
 
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(1)
+    delete_msg = "permanently deleted" if hard else "marked as deleted"
+    console.print(f"[green]✓[/green] User {delete_msg}: {email}\n")
@@ -12,63 +12,137 @@ Usage:
     vault api-keys          Manage API keys
 """
 
+from typing import Callable, Dict, List, Optional, Tuple
+
+import click
 import typer
-from rich.console import Console
+from typer.core import TyperGroup
+
+
+def _register_init(app: typer.Typer) -> None:
+    from .commands import init
+
+    app.command(name="init")(init.init_command)
+
+
+def _register_migrate(app: typer.Typer) -> None:
+    from .commands import migrate
+
+    app.command(name="migrate")(migrate.migrate_command)
+
+
+def _register_status(app: typer.Typer) -> None:
+    from .commands import migrate
+
+    app.command(name="status")(migrate.status_command)
+
+
+def _register_users(app: typer.Typer) -> None:
+    from .commands import users
+
+    users_app = typer.Typer(help="Manage users")
+    users_app.command(name="create")(users.users_create_command)
+    users_app.command(name="list")(users.users_list_command)
+    users_app.command(name="get")(users.users_get_command)
+    users_app.command(name="delete")(users.users_delete_command)
+    app.add_typer(users_app, name="users")
+
+
+def _register_orgs(app: typer.Typer) -> None:
+    from .commands import orgs
+
+    orgs_app = typer.Typer(help="Manage organizations")
+    orgs_app.command(name="create")(orgs.orgs_create_command)
+    orgs_app.command(name="list")(orgs.orgs_list_command)
+    orgs_app.command(name="get")(orgs.orgs_get_command)
+    orgs_app.command(name="members")(orgs.orgs_members_command)
+    orgs_app.command(name="add-member")(orgs.orgs_add_member_command)
+    orgs_app.command(name="remove-member")(orgs.orgs_remove_member_command)
+    app.add_typer(orgs_app, name="orgs")
+
+
+def _register_roles(app: typer.Typer) -> None:
+    from .commands import roles
+
+    roles_app = typer.Typer(help="Manage roles and permissions")
+    roles_app.command(name="create")(roles.roles_create_command)
+    roles_app.command(name="list")(roles.roles_list_command)
+    roles_app.command(name="get")(roles.roles_get_command)
+    roles_app.command(name="update")(roles.roles_update_command)
+    roles_app.command(name="delete")(roles.roles_delete_command)
+    roles_app.command(name="add-permission")(roles.roles_add_permission_command)
+    roles_app.command(name="remove-permission")(roles.roles_remove_permission_command)
+    roles_app.command(name="init-system")(roles.roles_init_system_command)
+    roles_app.command(name="assign")(roles.roles_assign_command)
+    app.add_typer(roles_app, name="roles")
+
+
+def _register_invites(app: typer.Typer) -> None:
+    from .commands import invites
+
+    app.add_typer(invites.app, name="invites")
+
+
+def _register_apikeys(app: typer.Typer) -> None:
+    from .commands import apikeys
+
+    app.add_typer(apikeys.app, name="api-keys")
+
+
+# Subcommands in help order, with the one-line help shown by `vault --help`.
+# Each registers itself on a Typer app after importing its command module
+# (which pulls in the Supabase client), so a run only loads the subcommand
+# it invokes.
+LAZY_COMMANDS: Dict[str, Tuple[Callable[[typer.Typer], None], str]] = {
+    "init": (_register_init, "Initialize Vault in your project."),
+    "migrate": (_register_migrate, "Run database migrations."),
+    "status": (_register_status, "Show migration status."),
+    "users": (_register_users, "Manage users"),
+    "orgs": (_register_orgs, "Manage organizations"),
+    "roles": (_register_roles, "Manage roles and permissions"),
+    "invites": (_register_invites, "Manage organization invitations"),
+    "api-keys": (_register_apikeys, "Manage API keys for service authentication"),
+}
+
+
+class LazyTyperGroup(TyperGroup):
+    """Top-level group that builds subcommands on first use."""
+
+    _listing_help = False
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return list(LAZY_COMMANDS)
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        command = self.commands.get(cmd_name)
+        if command is None and cmd_name in LAZY_COMMANDS:
+            register, short_help = LAZY_COMMANDS[cmd_name]
+            if self._listing_help:
+                # The command list only needs the one-line help
+                return click.Command(cmd_name, short_help=short_help)
+
+            sub_app = typer.Typer()
+            register(sub_app)
+            command = typer.main.get_group(sub_app).commands[cmd_name]
+            self.commands[cmd_name] = command
+        return command
+
+    def format_help(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        self._listing_help = True
+        try:
+            super().format_help(ctx, formatter)
+        finally:
+            self._listing_help = False
 
-from .commands import apikeys, init, invites, migrate, orgs, roles, users
 
 # Create the main Typer app
 app = typer.Typer(
     name="vault",
     help="Multi-tenant RBAC library with Supabase integration",
     add_completion=False,
+    cls=LazyTyperGroup,
 )
 
-# Create a Rich console for pretty output
-console = Console()
-
-# Register top-level commands
-app.command(name="init")(init.init_command)
-app.command(name="migrate")(migrate.migrate_command)
-app.command(name="status")(migrate.status_command)
-
-# Create users subcommand group
-users_app = typer.Typer(help="Manage users")
-users_app.command(name="create")(users.users_create_command)
-users_app.command(name="list")(users.users_list_command)
-users_app.command(name="get")(users.users_get_command)
-users_app.command(name="delete")(users.users_delete_command)
-app.add_typer(users_app, name="users")
-
-# Create orgs subcommand group
-orgs_app = typer.Typer(help="Manage organizations")
-orgs_app.command(name="create")(orgs.orgs_create_command)
-orgs_app.command(name="list")(orgs.orgs_list_command)
-orgs_app.command(name="get")(orgs.orgs_get_command)
-orgs_app.command(name="members")(orgs.orgs_members_command)
-orgs_app.command(name="add-member")(orgs.orgs_add_member_command)
-orgs_app.command(name="remove-member")(orgs.orgs_remove_member_command)
-app.add_typer(orgs_app, name="orgs")
-
-# Create roles subcommand group
-roles_app = typer.Typer(help="Manage roles and permissions")
-roles_app.command(name="create")(roles.roles_create_command)
-roles_app.command(name="list")(roles.roles_list_command)
-roles_app.command(name="get")(roles.roles_get_command)
-roles_app.command(name="update")(roles.roles_update_command)
-roles_app.command(name="delete")(roles.roles_delete_command)
-roles_app.command(name="add-permission")(roles.roles_add_permission_command)
-roles_app.command(name="remove-permission")(roles.roles_remove_permission_command)
-roles_app.command(name="init-system")(roles.roles_init_system_command)
-roles_app.command(name="assign")(roles.roles_assign_command)
-app.add_typer(roles_app, name="roles")
-
-# Add invites subcommand group
-app.add_typer(invites.app, name="invites")
-
-# Add api-keys subcommand group
-app.add_typer(apikeys.app, name="api-keys")
-
 
 @app.callback()
 def callback() -> None:
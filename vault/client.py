@@ -4,17 +4,20 @@ Main Vault client.
 This is the primary interface users interact with.
 """
 
-from typing import Optional
+from functools import cached_property
+from typing import TYPE_CHECKING, Optional
 
-from .apikeys import APIKeyManager
-from .audit import AuditLogger
-from .auth import SessionManager, UserManager
 from .config import VaultConfig, load_config
-from .invitations import InvitationManager
-from .organizations import MembershipManager, OrganizationManager
-from .rbac import PermissionManager, RoleManager
 from .utils.supabase import VaultSupabaseClient
-from .webhooks import WebhookManager
+
+if TYPE_CHECKING:
+    from .apikeys import APIKeyManager
+    from .audit import AuditLogger
+    from .auth import SessionManager, UserManager
+    from .invitations import InvitationManager
+    from .organizations import MembershipManager, OrganizationManager
+    from .rbac import PermissionManager, RoleManager
+    from .webhooks import WebhookManager
 
 
 class Vault:
@@ -65,23 +68,82 @@ class Vault:
         self.config = config
         self.client = client
 
-        # Phase 2: User management and sessions
-        self.users = UserManager(self)
-        self.sessions = SessionManager(self)
+    # Managers are built (and their modules imported) on first access, so a
+    # script that only touches vault.users doesn't set up the other nine.
+
+    # Phase 2: User management and sessions
+    @cached_property
+    def users(self) -> "UserManager":
+        """User management."""
+        from .auth import UserManager
+
+        return UserManager(self)
+
+    @cached_property
+    def sessions(self) -> "SessionManager":
+        """Sign-in, sign-out and token validation."""
+        from .auth import SessionManager
+
+        return SessionManager(self)
+
+    # Phase 3: Organizations and memberships
+    @cached_property
+    def orgs(self) -> "OrganizationManager":
+        """Organization management."""
+        from .organizations import OrganizationManager
+
+        return OrganizationManager(self)
+
+    @cached_property
+    def memberships(self) -> "MembershipManager":
+        """Organization memberships."""
+        from .organizations import MembershipManager
+
+        return MembershipManager(self)
+
+    # Phase 4: RBAC - roles and permissions
+    @cached_property
+    def roles(self) -> "RoleManager":
+        """Role management."""
+        from .rbac import RoleManager
+
+        return RoleManager(self)
+
+    @cached_property
+    def permissions(self) -> "PermissionManager":
+        """Permission checks."""
+        from .rbac import PermissionManager
+
+        return PermissionManager(self)
+
+    # Phase 5: Advanced features
+    @cached_property
+    def invites(self) -> "InvitationManager":
+        """Organization invitations."""
+        from .invitations import InvitationManager
+
+        return InvitationManager(self)
+
+    @cached_property
+    def audit(self) -> "AuditLogger":
+        """Audit logging."""
+        from .audit import AuditLogger
+
+        return AuditLogger(self)
+
+    @cached_property
+    def webhooks(self) -> "WebhookManager":
+        """Webhook registration and delivery."""
+        from .webhooks import WebhookManager
 
-        # Phase 3: Organizations and memberships
-        self.orgs = OrganizationManager(self)
-        self.memberships = MembershipManager(self)
+        return WebhookManager(self)
 
-        # Phase 4: RBAC - roles and permissions
-        self.roles = RoleManager(self)
-        self.permissions = PermissionManager(self)
+    @cached_property
+    def api_keys(self) -> "APIKeyManager":
+        """API key management."""
+        from .apikeys import APIKeyManager
 
-        # Phase 5: Advanced features
-        self.invites = InvitationManager(self)
-        self.audit = AuditLogger(self)
-        self.webhooks = WebhookManager(self)
-        self.api_keys = APIKeyManager(self)
+        return APIKeyManager(self)
 
     @classmethod
     async def create(
@@ -134,7 +196,12 @@ class Vault:
             from .migrations.manager import MigrationManager
 
             manager = MigrationManager(client)
-            await manager.migrate()
+            # One cheap query when up to date; the full run only when behind
+            if not await manager.is_current():
+                try:
+                    await manager.migrate()
+                finally:
+                    await manager.close()
 
         return cls(config=config, client=client)
 
@@ -152,8 +219,9 @@ class Vault:
                 await vault.close()
             ```
         """
-        # Close webhook HTTP client
-        await self.webhooks.close()
+        # Close webhook HTTP client (only if webhooks were used)
+        if "webhooks" in self.__dict__:
+            await self.webhooks.close()
         # Close Supabase client
         await self.client.close()
 
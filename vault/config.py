@@ -4,7 +4,9 @@ Vault configuration management.
 Loads configuration from environment variables or .env file.
 """
 
-from typing import Optional
+import functools
+import os
+from typing import Optional, Tuple
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -38,6 +40,8 @@ class VaultConfig(BaseSettings):
         case_sensitive=False,
         extra="ignore",
         populate_by_name=True,
+        # load_config() shares instances between callers, so they can't be mutated
+        frozen=True,
     )
 
     # Supabase connection
@@ -46,8 +50,10 @@ class VaultConfig(BaseSettings):
         description="Supabase project URL (e.g., https://xxx.supabase.co)",
     )
 
+    # Length is checked by pydantic-core; anything shorter can't be a real key
     supabase_key: str = Field(
         ...,
+        min_length=10,
         description="Supabase service role key (for admin operations)",
     )
 
@@ -57,6 +63,12 @@ class VaultConfig(BaseSettings):
         description="Supabase anon key (for client operations)",
     )
 
+    # Optional: Direct Postgres connection for applying migrations
+    database_url: Optional[str] = Field(
+        default=None,
+        description="PostgreSQL connection string used by vault migrate (requires asyncpg)",
+    )
+
     # Database schema
     db_schema: str = Field(
         default="public",
@@ -73,7 +85,10 @@ class VaultConfig(BaseSettings):
     # Feature flags
     auto_migrate: bool = Field(
         default=False,
-        description="Automatically run migrations on client initialization",
+        description=(
+            "Automatically run migrations on client initialization "
+            "(one vault_migrations query per Vault.create when up to date)"
+        ),
     )
 
     enable_audit_log: bool = Field(
@@ -87,6 +102,48 @@ class VaultConfig(BaseSettings):
         description="From email address for invitations (uses Supabase default if not set)",
     )
 
+    # HTTP connection pool (shared by all Supabase sub-clients)
+    http2: bool = Field(
+        default=True,
+        description="Multiplex concurrent requests over HTTP/2 connections",
+    )
+
+    http_max_connections: int = Field(
+        default=40,
+        ge=1,
+        description="Maximum number of open connections to Supabase",
+    )
+
+    http_max_keepalive_connections: int = Field(
+        default=20,
+        ge=0,
+        description="Maximum number of idle connections kept open for reuse",
+    )
+
+    http_keepalive_expiry: float = Field(
+        default=60.0,
+        ge=0,
+        description="Seconds an idle connection is kept open",
+    )
+
+    http_connect_retries: int = Field(
+        default=2,
+        ge=0,
+        description="Times a failed connection attempt is retried",
+    )
+
+    # Permission checks
+    permission_cache_ttl: float = Field(
+        default=30.0,
+        ge=0,
+        description="Seconds memberships and roles used by permission checks are cached (0 disables)",
+    )
+    permission_negative_cache_ttl: float = Field(
+        default=5.0,
+        ge=0,
+        description="Seconds a missing membership or role is cached (0 disables)",
+    )
+
     # Debug
     debug: bool = Field(
         default=False,
@@ -99,19 +156,8 @@ class VaultConfig(BaseSettings):
         """Ensure Supabase URL is valid."""
         if not v.startswith("https://"):
             raise ValueError("supabase_url must start with https://")
-        if not v.endswith(".supabase.co") and not v.endswith(".supabase.in"):
-            # Allow custom domains but warn
-            pass
         return v.rstrip("/")
 
-    @field_validator("supabase_key")
-    @classmethod
-    def validate_supabase_key(cls, v: str) -> str:
-        """Ensure Supabase key is not empty."""
-        if not v or len(v) < 10:
-            raise ValueError("supabase_key appears invalid (too short)")
-        return v
-
 
 def load_config(**kwargs) -> VaultConfig:
     """
@@ -122,6 +168,11 @@ def load_config(**kwargs) -> VaultConfig:
     2. Environment variables (VAULT_*)
     3. .env file
 
+    Calls with the same arguments, VAULT_* environment and .env file share
+    one VaultConfig, so the .env file is parsed and validated once (later
+    calls only stat it). VaultConfig is frozen; use
+    ``config.model_copy(update=...)`` to derive a changed copy.
+
     Args:
         **kwargs: Override configuration values
 
@@ -140,4 +191,27 @@ def load_config(**kwargs) -> VaultConfig:
         config = load_config(debug=True)
         ```
     """
-    return VaultConfig(**kwargs)
+    env = tuple(sorted((k, v) for k, v in os.environ.items() if k.upper().startswith("VAULT_")))
+    try:
+        return _load_config_cached(tuple(sorted(kwargs.items())), env, _env_file_state())
+    except TypeError:
+        # Unhashable override value; build an uncached config
+        return VaultConfig(**kwargs)
+
+
+def _env_file_state() -> Tuple[str, int]:
+    # A stat instead of re-reading .env; an edited file gets a new mtime
+    env_file = os.path.abspath(VaultConfig.model_config["env_file"])
+    try:
+        return env_file, os.stat(env_file).st_mtime_ns
+    except OSError:
+        return env_file, 0
+
+
+@functools.lru_cache(maxsize=32)
+def _load_config_cached(kwargs: Tuple, env: Tuple, env_file: Tuple[str, int]) -> VaultConfig:
+    # env and env_file are part of the cache key only, so changes aren't missed
+    return VaultConfig(**dict(kwargs))
+
+
+load_config.cache_clear = _load_config_cached.cache_clear
@@ -4,7 +4,7 @@ Vault decorators module.
 Provides decorators for authentication and authorization.
 """
 
-from .auth import RequireAuth, require_auth
+from .auth import RequireAuth, invalidate_token, require_auth, validate_token
 from .permissions import (
     RequireOrgRole,
     RequirePermission,
@@ -17,6 +17,8 @@ __all__ = [
     # Auth decorators
     "require_auth",
     "RequireAuth",
+    "invalidate_token",
+    "validate_token",
     # Permission decorators
     "require_permission",
     "require_org_role",
@@ -4,10 +4,125 @@ Authentication decorators for Vault.
 Provides decorators for protecting routes/endpoints with authentication.
 """
 
+from __future__ import annotations
+
+import asyncio
+import base64
 import functools
-from typing import Any, Callable, Optional
+import hashlib
+import inspect
+import json
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+
+from ..utils.cache import TTLCache
+
+if TYPE_CHECKING:
+    from ..auth.models import VaultUser
+
+# Validated tokens are kept briefly so repeat requests skip the round trip
+# to Supabase Auth. Keys are 16-byte BLAKE2b digests, so bearer tokens aren't
+# retained and lookups hash a short key instead of the whole JWT.
+TOKEN_CACHE_TTL = 30.0
+TOKEN_CACHE_MAXSIZE = 1024
+
+# Keyword arguments the token is read from ('authorization' may carry "Bearer ")
+_TOKEN_PARAMS = ("authorization", "token", "access_token")
+
+_token_cache = TTLCache(ttl=TOKEN_CACHE_TTL, maxsize=TOKEN_CACHE_MAXSIZE)
+
+# Validations in progress, so concurrent requests with a cold token share one
+_token_inflight: "Dict[bytes, asyncio.Future]" = {}
+
+
+def _token_key(vault_instance, token: str) -> bytes:
+    # Include the project so a token is never reused across Vault clients
+    project = getattr(getattr(vault_instance, "config", None), "supabase_url", "")
+    return hashlib.blake2b(f"{project}\0{token}".encode(), digest_size=16).digest()
+
+
+def _token_expiry(token: str) -> Optional[float]:
+    """Read the exp claim without verifying the token (it was just validated)."""
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+async def validate_token(vault_instance, token: str) -> Optional[VaultUser]:
+    """
+    Validate a token, reusing a recent result for the same token.
+
+    Concurrent calls for a token that isn't cached yet wait on a single
+    validation instead of each calling Supabase.
+
+    Args:
+        vault_instance: Vault client instance
+        token: JWT access token
+
+    Returns:
+        VaultUser if token is valid, None otherwise
+
+    Example:
+        ```python
+        user = await validate_token(vault, request.headers["Authorization"][7:])
+        ```
+    """
+    key = _token_key(vault_instance, token)
+
+    user = _token_cache.get(key)
+    if user is not None:
+        return user
+
+    pending = _token_inflight.get(key)
+    if pending is None:
+        pending = asyncio.ensure_future(_validate(vault_instance, token, key))
+        _token_inflight[key] = pending
+        pending.add_done_callback(lambda _: _token_inflight.pop(key, None))
+
+    # Shield so one caller being cancelled doesn't cancel the others' lookup
+    return await asyncio.shield(pending)
+
+
+async def _validate(vault_instance, token: str, key: bytes) -> Optional[VaultUser]:
+    """Validate a token against Supabase and cache the user."""
+    user = await vault_instance.sessions.get_user_from_token(token)
+    if not user:
+        return None
+
+    # Never cache past the token's own expiry
+    ttl = TOKEN_CACHE_TTL
+    exp = _token_expiry(token)
+    if exp is not None:
+        ttl = min(ttl, exp - time.time())
+
+    _token_cache.set(key, user, ttl=ttl)
+    return user
+
+
+def invalidate_token(token: Optional[str] = None, vault=None) -> None:
+    """
+    Drop cached validation results.
+
+    Call this after signing a user out so the token is rejected immediately
+    instead of when its cache entry expires.
+
+    Args:
+        token: Token to forget (all tokens if not provided)
+        vault: Vault client the token was validated with
 
-from ..auth.models import VaultUser
+    Example:
+        ```python
+        await vault.sessions.sign_out(token)
+        invalidate_token(token, vault)
+        ```
+    """
+    if token is None:
+        _token_cache.clear()
+    else:
+        _token_cache.pop(_token_key(vault, token))
 
 
 def require_auth(func: Optional[Callable] = None, *, vault=None):
@@ -48,29 +163,27 @@ def require_auth(func: Optional[Callable] = None, *, vault=None):
         1. As 'authorization' header (FastAPI, Flask)
         2. As 'token' parameter
         3. Via custom token extraction (override get_token)
+
+        Validated tokens are cached for TOKEN_CACHE_TTL seconds (never past
+        the token's exp claim). Use invalidate_token() after signing out.
     """
 
     def decorator(f: Callable) -> Callable:
+        # Only look for the token under names the function can actually receive
+        signature = inspect.signature(f)
+        params = signature.parameters
+        accepts_any = any(p.kind is p.VAR_KEYWORD for p in params.values())
+        token_params = tuple(n for n in _TOKEN_PARAMS if accepts_any or n in params)
+
         @functools.wraps(f)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
-            # Extract token from arguments
+            # Extract token from arguments, in order of precedence
             token = None
-
-            # Check for 'authorization' header (FastAPI style)
-            if "authorization" in kwargs:
-                auth_header = kwargs["authorization"]
-                if auth_header.startswith("Bearer "):
-                    token = auth_header[7:]
-                else:
-                    token = auth_header
-
-            # Check for 'token' parameter
-            elif "token" in kwargs:
-                token = kwargs["token"]
-
-            # Check for 'access_token' parameter
-            elif "access_token" in kwargs:
-                token = kwargs["access_token"]
+            for name in token_params:
+                value = kwargs.get(name)
+                if value is not None:
+                    token = value.removeprefix("Bearer ") if name == "authorization" else value
+                    break
 
             if not token:
                 raise ValueError(
@@ -80,11 +193,10 @@ def require_auth(func: Optional[Callable] = None, *, vault=None):
 
             # Get vault instance
             vault_instance = vault
-            if not vault_instance:
+            if vault_instance is None:
                 # Try to find vault in kwargs or args
-                if "vault" in kwargs:
-                    vault_instance = kwargs["vault"]
-                elif args and hasattr(args[0], "sessions"):
+                vault_instance = kwargs.get("vault")
+                if vault_instance is None and args and hasattr(args[0], "sessions"):
                     # Might be a class method with self
                     vault_instance = args[0]
 
@@ -95,7 +207,7 @@ def require_auth(func: Optional[Callable] = None, *, vault=None):
                 )
 
             # Validate token and get user
-            user = await vault_instance.sessions.get_user_from_token(token)
+            user = await validate_token(vault_instance, token)
 
             if not user:
                 raise ValueError("Invalid or expired token")
@@ -106,6 +218,8 @@ def require_auth(func: Optional[Callable] = None, *, vault=None):
             # Call the original function
             return await f(*args, **kwargs)
 
+        # Saves inspect.signature() (e.g. FastAPI at startup) unwrapping to f
+        wrapper.__signature__ = signature
         return wrapper
 
     # Support both @require_auth and @require_auth(vault=vault)
@@ -178,11 +292,9 @@ class RequireAuth:
         Raises:
             ValueError: If token is invalid
         """
-        token = authorization
-        if authorization.startswith("Bearer "):
-            token = authorization[7:]
+        token = authorization.removeprefix("Bearer ")
 
-        user = await self.vault.sessions.get_user_from_token(token)
+        user = await validate_token(self.vault, token)
 
         if not user:
             raise ValueError("Invalid or expired token")
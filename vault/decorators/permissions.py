@@ -4,11 +4,148 @@ Permission decorators for Vault.
 Provides decorators for protecting routes/endpoints with permission checks.
 """
 
-import functools
-from typing import Any, Callable, List, Optional, Union
+from __future__ import annotations
+
+import inspect
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, List, Optional, Union
 from uuid import UUID
 
-from ..auth.models import VaultUser
+from ..utils.ids import parse_uuid
+
+if TYPE_CHECKING:
+    from ..auth.models import VaultUser
+
+
+def _resolve_request(kwargs: dict, org_id_param: str, decorator: str) -> tuple:
+    """
+    Find the user and organization ID for a decorated call.
+
+    Args:
+        kwargs: Keyword arguments of the call
+        org_id_param: Name of the parameter containing organization_id
+        decorator: Decorator name, used in error messages
+
+    Returns:
+        Tuple of (user, organization_id)
+
+    Raises:
+        ValueError: If the user or organization ID is missing
+    """
+    # Get user from kwargs (should be set by @require_auth)
+    user: Optional[VaultUser] = kwargs.get("user")
+    if not user:
+        raise ValueError(
+            "User not found in request. "
+            f"Apply @require_auth decorator before @{decorator}."
+        )
+
+    # Get organization_id from kwargs
+    org_id = kwargs.get(org_id_param)
+    if not org_id:
+        raise ValueError(
+            f"Organization ID not found. "
+            f"Pass '{org_id_param}' parameter to the function."
+        )
+
+    # Convert to UUID if string
+    if isinstance(org_id, str):
+        org_id = parse_uuid(org_id)
+
+    return user, org_id
+
+
+def _resolve_vault(args: tuple, kwargs: dict, usage: str):
+    """
+    Find the Vault instance for a call when none was bound at decoration time.
+
+    Args:
+        args: Positional arguments of the call
+        kwargs: Keyword arguments of the call
+        usage: Example decorator usage, used in error messages
+
+    Returns:
+        Vault instance
+
+    Raises:
+        ValueError: If no Vault instance was passed
+    """
+    vault_instance = None
+    if "vault" in kwargs:
+        vault_instance = kwargs["vault"]
+    elif args and hasattr(args[0], "permissions"):
+        vault_instance = args[0]
+
+    if not vault_instance:
+        raise ValueError(
+            "Vault instance not provided. "
+            f"Pass vault instance via decorator: {usage}"
+        )
+
+    return vault_instance
+
+
+def _update_wrapper(wrapper: Callable, func: Callable) -> Callable:
+    """
+    Copy the metadata frameworks need from func onto wrapper.
+
+    A lighter functools.wraps: the signature is computed once here, so
+    FastAPI reads it directly instead of unwrapping on every registration.
+    """
+    wrapper.__module__ = func.__module__
+    wrapper.__name__ = func.__name__
+    wrapper.__qualname__ = func.__qualname__
+    wrapper.__doc__ = func.__doc__
+    wrapper.__wrapped__ = func
+    wrapper.__signature__ = inspect.signature(func)
+    return wrapper
+
+
+def _guard(
+    func: Callable,
+    check: Callable[[Any, UUID, UUID], Awaitable[bool]],
+    denied_message: str,
+    *,
+    vault,
+    org_id_param: str,
+    decorator: str,
+    usage: str,
+) -> Callable:
+    """
+    Wrap a function so it only runs if an authorization check passes.
+
+    When the Vault instance is bound at decoration time the wrapper skips
+    looking for one in the call arguments.
+
+    Args:
+        func: Function to protect
+        check: Called with (vault_instance, user_id, organization_id)
+        denied_message: PermissionError message when the check fails
+        vault: Vault instance bound at decoration time, if any
+        org_id_param: Name of the parameter containing organization_id
+        decorator: Decorator name, used in error messages
+        usage: Example decorator usage, used in error messages
+
+    Returns:
+        Wrapped function
+    """
+    if vault is not None:
+
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            user, org_id = _resolve_request(kwargs, org_id_param, decorator)
+            if not await check(vault, user.id, org_id):
+                raise PermissionError(denied_message)
+            return await func(*args, **kwargs)
+
+    else:
+
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            user, org_id = _resolve_request(kwargs, org_id_param, decorator)
+            vault_instance = _resolve_vault(args, kwargs, usage)
+            if not await check(vault_instance, user.id, org_id):
+                raise PermissionError(denied_message)
+            return await func(*args, **kwargs)
+
+    return _update_wrapper(wrapper, func)
 
 
 def require_permission(
@@ -68,69 +205,38 @@ def require_permission(
         - Expects 'user' (VaultUser) and 'organization_id' (UUID) in kwargs
         - The organization_id parameter name can be customized via org_id_param
     """
+    permissions_list = [permission] if isinstance(permission, str) else list(permission)
+    denied_message = f"Permission denied. Required: {', '.join(permissions_list)}"
 
-    def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        async def wrapper(*args: Any, **kwargs: Any) -> Any:
-            # Get user from kwargs (should be set by @require_auth)
-            user: Optional[VaultUser] = kwargs.get("user")
-            if not user:
-                raise ValueError(
-                    "User not found in request. "
-                    "Apply @require_auth decorator before @require_permission."
-                )
-
-            # Get organization_id from kwargs
-            org_id = kwargs.get(org_id_param)
-            if not org_id:
-                raise ValueError(
-                    f"Organization ID not found. "
-                    f"Pass '{org_id_param}' parameter to the function."
-                )
-
-            # Convert to UUID if string
-            if isinstance(org_id, str):
-                org_id = UUID(org_id)
-
-            # Get vault instance
-            vault_instance = vault
-            if not vault_instance:
-                if "vault" in kwargs:
-                    vault_instance = kwargs["vault"]
-                elif args and hasattr(args[0], "permissions"):
-                    vault_instance = args[0]
-
-            if not vault_instance:
-                raise ValueError(
-                    "Vault instance not provided. "
-                    "Pass vault instance via decorator: @require_permission(..., vault=vault)"
-                )
-
-            # Check permissions
-            permissions_list = [permission] if isinstance(permission, str) else permission
-
-            if require_all:
-                has_permission = await vault_instance.permissions.check_all(
-                    user_id=user.id,
-                    organization_id=org_id,
-                    permissions=permissions_list,
-                )
-            else:
-                has_permission = await vault_instance.permissions.check_any(
-                    user_id=user.id,
-                    organization_id=org_id,
-                    permissions=permissions_list,
-                )
-
-            if not has_permission:
-                perms_str = ", ".join(permissions_list)
-                raise PermissionError(
-                    f"Permission denied. Required: {perms_str}"
-                )
+    # Pick the check once rather than branching on require_all per call
+    if require_all:
 
-            return await func(*args, **kwargs)
+        async def check(vault_instance, user_id: UUID, org_id: UUID) -> bool:
+            return await vault_instance.permissions.check_all(
+                user_id=user_id,
+                organization_id=org_id,
+                permissions=permissions_list,
+            )
+
+    else:
 
-        return wrapper
+        async def check(vault_instance, user_id: UUID, org_id: UUID) -> bool:
+            return await vault_instance.permissions.check_any(
+                user_id=user_id,
+                organization_id=org_id,
+                permissions=permissions_list,
+            )
+
+    def decorator(func: Callable) -> Callable:
+        return _guard(
+            func,
+            check,
+            denied_message,
+            vault=vault,
+            org_id_param=org_id_param,
+            decorator="require_permission",
+            usage="@require_permission(..., vault=vault)",
+        )
 
     return decorator
 
@@ -165,62 +271,26 @@ def require_org_role(
             return {"updated": True}
         ```
     """
+    roles_list = [role] if isinstance(role, str) else list(role)
+    denied_message = f"Role required: {' or '.join(roles_list)}"
 
-    def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        async def wrapper(*args: Any, **kwargs: Any) -> Any:
-            # Get user from kwargs
-            user: Optional[VaultUser] = kwargs.get("user")
-            if not user:
-                raise ValueError(
-                    "User not found in request. "
-                    "Apply @require_auth decorator before @require_org_role."
-                )
-
-            # Get organization_id from kwargs
-            org_id = kwargs.get(org_id_param)
-            if not org_id:
-                raise ValueError(
-                    f"Organization ID not found. "
-                    f"Pass '{org_id_param}' parameter to the function."
-                )
-
-            # Convert to UUID if string
-            if isinstance(org_id, str):
-                org_id = UUID(org_id)
-
-            # Get vault instance
-            vault_instance = vault
-            if not vault_instance:
-                if "vault" in kwargs:
-                    vault_instance = kwargs["vault"]
-                elif args and hasattr(args[0], "permissions"):
-                    vault_instance = args[0]
-
-            if not vault_instance:
-                raise ValueError(
-                    "Vault instance not provided. "
-                    "Pass vault instance via decorator: @require_org_role(..., vault=vault)"
-                )
-
-            # Check role
-            roles_list = [role] if isinstance(role, str) else role
-
-            has_role = await vault_instance.permissions.check_any_role(
-                user_id=user.id,
-                organization_id=org_id,
-                role_names=roles_list,
-            )
-
-            if not has_role:
-                roles_str = " or ".join(roles_list)
-                raise PermissionError(
-                    f"Role required: {roles_str}"
-                )
-
-            return await func(*args, **kwargs)
+    async def check(vault_instance, user_id: UUID, org_id: UUID) -> bool:
+        return await vault_instance.permissions.check_any_role(
+            user_id=user_id,
+            organization_id=org_id,
+            role_names=roles_list,
+        )
 
-        return wrapper
+    def decorator(func: Callable) -> Callable:
+        return _guard(
+            func,
+            check,
+            denied_message,
+            vault=vault,
+            org_id_param=org_id_param,
+            decorator="require_org_role",
+            usage="@require_org_role(..., vault=vault)",
+        )
 
     return decorator
 
@@ -247,57 +317,22 @@ def require_org_member(
         ```
     """
 
-    def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        async def wrapper(*args: Any, **kwargs: Any) -> Any:
-            # Get user from kwargs
-            user: Optional[VaultUser] = kwargs.get("user")
-            if not user:
-                raise ValueError(
-                    "User not found in request. "
-                    "Apply @require_auth decorator before @require_org_member."
-                )
-
-            # Get organization_id from kwargs
-            org_id = kwargs.get(org_id_param)
-            if not org_id:
-                raise ValueError(
-                    f"Organization ID not found. "
-                    f"Pass '{org_id_param}' parameter to the function."
-                )
-
-            # Convert to UUID if string
-            if isinstance(org_id, str):
-                org_id = UUID(org_id)
-
-            # Get vault instance
-            vault_instance = vault
-            if not vault_instance:
-                if "vault" in kwargs:
-                    vault_instance = kwargs["vault"]
-                elif args and hasattr(args[0], "permissions"):
-                    vault_instance = args[0]
-
-            if not vault_instance:
-                raise ValueError(
-                    "Vault instance not provided. "
-                    "Pass vault instance via decorator: @require_org_member(vault=vault)"
-                )
-
-            # Check membership
-            is_member = await vault_instance.permissions.is_member(
-                user_id=user.id,
-                organization_id=org_id,
-            )
-
-            if not is_member:
-                raise PermissionError(
-                    "You are not a member of this organization."
-                )
-
-            return await func(*args, **kwargs)
+    async def check(vault_instance, user_id: UUID, org_id: UUID) -> bool:
+        return await vault_instance.permissions.is_member(
+            user_id=user_id,
+            organization_id=org_id,
+        )
 
-        return wrapper
+    def decorator(func: Callable) -> Callable:
+        return _guard(
+            func,
+            check,
+            "You are not a member of this organization.",
+            vault=vault,
+            org_id_param=org_id_param,
+            decorator="require_org_member",
+            usage="@require_org_member(vault=vault)",
+        )
 
     return decorator
 
@@ -334,6 +369,9 @@ class RequirePermission:
         self.vault = vault
         self.permission = permission
         self.require_all = require_all
+        self._permissions_list = (
+            [permission] if isinstance(permission, str) else list(permission)
+        )
 
     def __call__(self, func: Callable) -> Callable:
         return require_permission(
@@ -353,21 +391,17 @@ class RequirePermission:
         Returns:
             True if user has permission, False otherwise
         """
-        permissions_list = (
-            [self.permission] if isinstance(self.permission, str) else self.permission
-        )
-
         if self.require_all:
             return await self.vault.permissions.check_all(
                 user_id=user.id,
                 organization_id=organization_id,
-                permissions=permissions_list,
+                permissions=self._permissions_list,
             )
         else:
             return await self.vault.permissions.check_any(
                 user_id=user.id,
                 organization_id=organization_id,
-                permissions=permissions_list,
+                permissions=self._permissions_list,
             )
 
 
@@ -393,6 +427,7 @@ class RequireOrgRole:
     def __init__(self, vault, role: Union[str, List[str]]) -> None:
         self.vault = vault
         self.role = role
+        self._roles_list = [role] if isinstance(role, str) else list(role)
 
     def __call__(self, func: Callable) -> Callable:
         return require_org_role(self.role, vault=self.vault)(func)
@@ -408,10 +443,8 @@ class RequireOrgRole:
         Returns:
             True if user has role, False otherwise
         """
-        roles_list = [self.role] if isinstance(self.role, str) else self.role
-
         return await self.vault.permissions.check_any_role(
             user_id=user.id,
             organization_id=organization_id,
-            role_names=roles_list,
+            role_names=self._roles_list,
         )
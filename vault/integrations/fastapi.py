@@ -23,8 +23,10 @@ Example:
     ```
 """
 
+from contextlib import asynccontextmanager
 from contextvars import ContextVar
-from typing import Callable, List, Optional, Union
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple, Union
+from uuid import UUID
 
 try:
     from fastapi import Depends, FastAPI, HTTPException, Request
@@ -35,17 +37,52 @@ except ImportError:
         "Install it with: pip install fastapi"
     )
 
+from ..apikeys.models import VaultAPIKey
 from ..auth.models import VaultUser
 from ..client import Vault
+from ..decorators.auth import validate_token
+from ..utils.ids import parse_uuid
 
 # Context variable to store Vault instance
 _vault_ctx: ContextVar[Optional[Vault]] = ContextVar("vault", default=None)
-_user_ctx: ContextVar[Optional[VaultUser]] = ContextVar("current_user", default=None)
 
 # Security scheme
 security = HTTPBearer(auto_error=False)
 
 
+def _get_org_id(request: Request, org_id_param: str) -> UUID:
+    """
+    Read the organization ID from the path or query parameters.
+
+    Args:
+        request: Current request
+        org_id_param: Name of path/query parameter containing org ID
+
+    Returns:
+        Organization UUID
+
+    Raises:
+        HTTPException: 400 if the parameter is missing or not a UUID
+    """
+    org_id = request.path_params.get(org_id_param) or request.query_params.get(
+        org_id_param
+    )
+
+    if not org_id:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Missing {org_id_param} parameter",
+        )
+
+    try:
+        return parse_uuid(org_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid {org_id_param} format",
+        )
+
+
 class VaultFastAPI:
     """
     FastAPI integration for Vault.
@@ -89,21 +126,34 @@ class VaultFastAPI:
         self.supabase_key = supabase_key
         self._vault: Optional[Vault] = None
 
+        # Dependencies by factory arguments. Returning the same callable for
+        # the same arguments lets FastAPI run it once per request, e.g. the
+        # auth dependency shared by stacked permission and role checks.
+        self._dependencies: Dict[Tuple, Callable] = {}
+
         if app:
             self._setup_lifespan(app)
 
     def _setup_lifespan(self, app: FastAPI) -> None:
-        """Set up automatic Vault lifecycle with FastAPI."""
-        original_startup = app.on_event("startup")
-        original_shutdown = app.on_event("shutdown")
+        """
+        Set up automatic Vault lifecycle with FastAPI.
+
+        Wraps the app's existing lifespan, so the Vault client is ready
+        before the app's own startup code runs and is closed after its
+        shutdown code.
+        """
+        app_lifespan = app.router.lifespan_context
 
-        @app.on_event("startup")
-        async def startup() -> None:
+        @asynccontextmanager
+        async def lifespan(app: FastAPI) -> AsyncIterator[Any]:
             await self.setup()
+            try:
+                async with app_lifespan(app) as state:
+                    yield state
+            finally:
+                await self.teardown()
 
-        @app.on_event("shutdown")
-        async def shutdown() -> None:
-            await self.teardown()
+        app.router.lifespan_context = lifespan
 
     async def setup(self) -> None:
         """Initialize Vault client."""
@@ -131,7 +181,8 @@ class VaultFastAPI:
         """
         Dependency that requires authentication.
 
-        Returns the current user or raises 401.
+        Returns the current user or raises 401. Validated tokens are cached
+        briefly (see vault.decorators.invalidate_token).
 
         Example:
             ```python
@@ -153,7 +204,7 @@ class VaultFastAPI:
                 )
 
             token = credentials.credentials
-            user = await self.vault.sessions.get_user_from_token(token)
+            user = await validate_token(self.vault, token)
 
             if not user:
                 raise HTTPException(
@@ -162,10 +213,11 @@ class VaultFastAPI:
                     headers={"WWW-Authenticate": "Bearer"},
                 )
 
-            _user_ctx.set(user)
+            request.state.vault_user = user
             return user
 
-        return dependency
+        key = ("auth",)
+        return self._dependencies.setdefault(key, dependency)
 
     def require_permission(
         self,
@@ -196,26 +248,7 @@ class VaultFastAPI:
             request: Request,
             user: VaultUser = Depends(self.require_auth()),
         ) -> VaultUser:
-            # Get org_id from path or query params
-            org_id = request.path_params.get(org_id_param) or request.query_params.get(
-                org_id_param
-            )
-
-            if not org_id:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Missing {org_id_param} parameter",
-                )
-
-            from uuid import UUID
-
-            try:
-                org_uuid = UUID(org_id)
-            except ValueError:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Invalid {org_id_param} format",
-                )
+            org_uuid = _get_org_id(request, org_id_param)
 
             # Check permissions
             if all_required:
@@ -235,7 +268,8 @@ class VaultFastAPI:
 
             return user
 
-        return dependency
+        key = ("permission", permissions, org_id_param, all_required)
+        return self._dependencies.setdefault(key, dependency)
 
     def require_role(
         self,
@@ -266,25 +300,7 @@ class VaultFastAPI:
             request: Request,
             user: VaultUser = Depends(self.require_auth()),
         ) -> VaultUser:
-            org_id = request.path_params.get(org_id_param) or request.query_params.get(
-                org_id_param
-            )
-
-            if not org_id:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Missing {org_id_param} parameter",
-                )
-
-            from uuid import UUID
-
-            try:
-                org_uuid = UUID(org_id)
-            except ValueError:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Invalid {org_id_param} format",
-                )
+            org_uuid = _get_org_id(request, org_id_param)
 
             # Check role
             if any_role:
@@ -293,13 +309,9 @@ class VaultFastAPI:
                 )
             else:
                 # Check all roles (user must have all specified roles)
-                has_role = True
-                for role in roles:
-                    if not await self.vault.permissions.check_role(
-                        user.id, org_uuid, role
-                    ):
-                        has_role = False
-                        break
+                has_role = await self.vault.permissions.check_access(
+                    user.id, org_uuid, roles=list(roles), all_roles=True
+                )
 
             if not has_role:
                 raise HTTPException(
@@ -309,7 +321,8 @@ class VaultFastAPI:
 
             return user
 
-        return dependency
+        key = ("role", roles, org_id_param, any_role)
+        return self._dependencies.setdefault(key, dependency)
 
     def require_org_member(self, org_id_param: str = "org_id") -> Callable:
         """
@@ -333,37 +346,88 @@ class VaultFastAPI:
             request: Request,
             user: VaultUser = Depends(self.require_auth()),
         ) -> VaultUser:
-            org_id = request.path_params.get(org_id_param) or request.query_params.get(
-                org_id_param
-            )
+            org_uuid = _get_org_id(request, org_id_param)
+
+            is_member = await self.vault.permissions.is_member(user.id, org_uuid)
 
-            if not org_id:
+            if not is_member:
                 raise HTTPException(
-                    status_code=400,
-                    detail=f"Missing {org_id_param} parameter",
+                    status_code=403,
+                    detail="Not a member of this organization",
                 )
 
-            from uuid import UUID
+            return user
 
-            try:
-                org_uuid = UUID(org_id)
-            except ValueError:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Invalid {org_id_param} format",
-                )
+        key = ("member", org_id_param)
+        return self._dependencies.setdefault(key, dependency)
 
-            is_member = await self.vault.permissions.is_member(user.id, org_uuid)
+    def require(
+        self,
+        *permissions: str,
+        roles: Optional[List[str]] = None,
+        org_id_param: str = "org_id",
+        all_required: bool = True,
+        any_role: bool = True,
+    ) -> Callable:
+        """
+        Dependency that checks membership, permissions and roles at once.
 
-            if not is_member:
+        Use this instead of stacking require_org_member, require_permission
+        and require_role: the user's membership and role are looked up once
+        for all conditions.
+
+        Args:
+            *permissions: Permission strings (e.g., "posts:write")
+            roles: Role names (e.g., ["Owner", "Admin"])
+            org_id_param: Name of path/query parameter containing org ID
+            all_required: If True, all permissions required; if False, any one
+            any_role: If True, any role matches; if False, all required
+
+        Example:
+            ```python
+            @app.post("/orgs/{org_id}/posts")
+            async def create_post(
+                org_id: str,
+                user = Depends(
+                    vault_integration.require("posts:write", roles=["Editor", "Admin"])
+                ),
+            ):
+                return {"created": True}
+            ```
+        """
+
+        async def dependency(
+            request: Request,
+            user: VaultUser = Depends(self.require_auth()),
+        ) -> VaultUser:
+            org_uuid = _get_org_id(request, org_id_param)
+
+            allowed = await self.vault.permissions.check_access(
+                user.id,
+                org_uuid,
+                permissions=list(permissions),
+                require_all=all_required,
+                roles=roles,
+                all_roles=not any_role,
+            )
+
+            if not allowed:
                 raise HTTPException(
                     status_code=403,
-                    detail="Not a member of this organization",
+                    detail="Insufficient permissions",
                 )
 
             return user
 
-        return dependency
+        key = (
+            "access",
+            permissions,
+            tuple(roles) if roles is not None else None,
+            org_id_param,
+            all_required,
+            any_role,
+        )
+        return self._dependencies.setdefault(key, dependency)
 
     def require_api_key(
         self,
@@ -386,7 +450,6 @@ class VaultFastAPI:
                 return {"data": [...]}
             ```
         """
-        from ..apikeys.models import VaultAPIKey
 
         async def dependency(request: Request) -> VaultAPIKey:
             api_key = request.headers.get(header_name)
@@ -419,7 +482,8 @@ class VaultFastAPI:
 
             return result.api_key
 
-        return dependency
+        key = ("api_key", scopes, header_name)
+        return self._dependencies.setdefault(key, dependency)
 
 
 def get_vault() -> Vault:
@@ -443,11 +507,11 @@ def get_vault() -> Vault:
     return vault
 
 
-def get_current_user() -> Optional[VaultUser]:
+def get_current_user(request: Request) -> Optional[VaultUser]:
     """
-    Get the current authenticated user from context.
+    Get the user authenticated for the current request.
 
-    Returns None if no user is authenticated.
+    Returns None if no require_* dependency has authenticated the request.
 
     Example:
         ```python
@@ -458,4 +522,4 @@ def get_current_user() -> Optional[VaultUser]:
             return {"email": user.email}
         ```
     """
-    return _user_ctx.get()
+    return getattr(request.state, "vault_user", None)
@@ -7,11 +7,15 @@ Handles invitation system for organizations.
 from .invites import InvitationManager
 from .models import (
     CreateInvitationRequest,
+    InvitationOrganization,
+    InvitationUser,
     VaultInvitation,
 )
 
 __all__ = [
     "InvitationManager",
     "VaultInvitation",
+    "InvitationUser",
+    "InvitationOrganization",
     "CreateInvitationRequest",
 ]
@@ -9,16 +9,51 @@ Wraps: supabase_auth._async.gotrue_admin_api.AsyncGoTrueAdminAPI.invite_user_by_
 Source: venv/lib/python3.14/site-packages/supabase_auth/_async/gotrue_admin_api.py:81
 """
 
+import hashlib
 import secrets
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING, List, Optional
 from uuid import UUID
 
+from postgrest.exceptions import APIError
+from postgrest.types import CountMethod, ReturnMethod
+
+from ..utils.cache import TTLCache
 from .models import VaultInvitation
 
 if TYPE_CHECKING:
     from ..client import Vault
 
+# Seconds invitations fetched by get() and get_by_token() are reused. The
+# accept link is typically opened several times (preview, form, submit).
+INVITATION_CACHE_TTL = 30.0
+
+# Seconds organization names used in invitation emails are reused, so
+# bulk-inviting or resending to one organization looks it up once
+ORG_NAME_CACHE_TTL = 60.0
+
+# Listing columns: each invitation with its inviter and organization embedded
+# (PostgREST resource embedding), so callers don't look them up per row
+_LIST_COLUMNS = (
+    "*, inviter:invited_by(id,email,display_name), organization:organization_id(id,name)"
+)
+
+# Expired invitations deleted per cleanup_expired() transaction
+CLEANUP_BATCH_SIZE = 1000
+
+# Error codes raised by the invitation database functions for failed checks
+_CHECK_ERRORS = ("P0001", "P0002")
+
+
+def _hash_token(token: str) -> str:
+    """Hash an invitation token the way it is stored (hex SHA-256)."""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def _rpc_row(data) -> dict:
+    # PostgREST returns a scalar JSON function result bare or in a list
+    return data[0] if isinstance(data, list) else data
+
 
 class InvitationManager:
     """
@@ -26,10 +61,17 @@ class InvitationManager:
 
     The invitation flow:
     1. Create invitation with email, org, and optional role
-    2. Generate unique token and store in vault_invitations
+    2. Generate unique token and store its hash in vault_invitations
     3. Optionally trigger Supabase email via invite_user_by_email
     4. User accepts invitation via token
     5. Create membership and mark invitation as accepted
+
+    The checks and writes for creating and accepting an invitation run
+    inside the vault_create_invitation and vault_accept_invitation database
+    functions, so each is one round-trip and one transaction.
+
+    Invitations looked up by ID or token are cached briefly; changes made
+    through this manager invalidate them.
     """
 
     def __init__(self, vault: "Vault") -> None:
@@ -41,10 +83,38 @@ class InvitationManager:
         """
         self.vault = vault
         self.client = vault.client
+        self._by_id = TTLCache(ttl=INVITATION_CACHE_TTL, maxsize=1024)
+        self._by_token = TTLCache(ttl=INVITATION_CACHE_TTL, maxsize=1024)
+        self._org_names = TTLCache(ttl=ORG_NAME_CACHE_TTL, maxsize=256)
+
+    def _cache(self, invitation: VaultInvitation) -> VaultInvitation:
+        self._by_id.set(invitation.id, invitation)
+        if invitation.token_hash:
+            self._by_token.set(invitation.token_hash, invitation)
+        return invitation
+
+    def _forget(self, invitation: VaultInvitation) -> None:
+        self._by_id.pop(invitation.id)
+        if invitation.token_hash:
+            self._by_token.pop(invitation.token_hash)
+
+    def _forget_all(self) -> None:
+        self._by_id.clear()
+        self._by_token.clear()
+
+    async def _org_name(self, organization_id: UUID) -> Optional[str]:
+        name = self._org_names.get(organization_id)
+        if name is None:
+            org = await self.vault.orgs.get(organization_id)
+            if org is None:
+                return None
+            name = org.name
+            self._org_names.set(organization_id, name)
+        return name
 
     def _generate_token(self, length: int = 32) -> str:
-        """Generate a secure random token for invitations."""
-        return secrets.token_urlsafe(length)
+        """Generate a secure random token of length random bytes, hex-encoded."""
+        return secrets.token_hex(length)
 
     async def create(
         self,
@@ -88,59 +158,35 @@ class InvitationManager:
             print(f"Invitation token: {invite.token}")
             ```
         """
-        # Verify organization exists
-        org = await self.vault.orgs.get(organization_id)
-        if not org:
-            raise ValueError(f"Organization {organization_id} not found")
-
-        # Check if user already exists and is a member
-        existing_user = await self.vault.users.get_by_email(email)
-        if existing_user:
-            existing_membership = (
-                await self.client.table("vault_memberships")
-                .select("id")
-                .eq("user_id", str(existing_user.id))
-                .eq("organization_id", str(organization_id))
-                .execute()
-            )
-            if existing_membership.data:
-                raise ValueError(f"User {email} is already a member of this organization")
-
-        # Check for existing pending invitation
-        existing_invite = (
-            await self.client.table("vault_invitations")
-            .select("id")
-            .eq("email", email)
-            .eq("organization_id", str(organization_id))
-            .is_("accepted_at", "null")
-            .execute()
-        )
-        if existing_invite.data:
-            # Revoke existing invitation before creating new one
-            await self.client.table("vault_invitations").delete().eq(
-                "id", existing_invite.data[0]["id"]
-            ).execute()
-
         # Generate token and expiration
         token = self._generate_token()
-        expires_at = datetime.utcnow() + timedelta(days=expires_in_days)
-
-        # Create invitation record
-        invitation_data = {
-            "organization_id": str(organization_id),
-            "email": email,
-            "role_id": str(role_id) if role_id else None,
-            "invited_by": str(invited_by) if invited_by else None,
-            "token": token,
-            "expires_at": expires_at.isoformat(),
-            "created_at": datetime.utcnow().isoformat(),
-        }
-
-        result = await self.client.table("vault_invitations").insert(
-            invitation_data
-        ).execute()
+        expires_at = datetime.now(timezone.utc) + timedelta(days=expires_in_days)
+
+        # Verify the organization, check membership, replace any pending
+        # invitation and insert the new one in a single transaction
+        try:
+            result = await self.client.rpc(
+                "vault_create_invitation",
+                {
+                    "p_organization_id": str(organization_id),
+                    "p_email": email,
+                    "p_token_hash": _hash_token(token),
+                    "p_expires_at": expires_at.isoformat(),
+                    "p_role_id": str(role_id) if role_id else None,
+                    "p_invited_by": str(invited_by) if invited_by else None,
+                },
+            ).execute()
+        except APIError as e:
+            if e.code in _CHECK_ERRORS:
+                raise ValueError(e.message) from e
+            raise
 
-        invitation = VaultInvitation(**result.data[0])
+        # Any pending invitation this one replaced was deleted
+        self._forget_all()
+
+        created = _rpc_row(result.data)
+        invitation = VaultInvitation.from_db({**created["invitation"], "token": token})
+        self._org_names.set(organization_id, created["organization_name"])
 
         # Optionally send email via Supabase
         if send_email:
@@ -148,7 +194,7 @@ class InvitationManager:
                 options = {
                     "data": {
                         "organization_id": str(organization_id),
-                        "organization_name": org.name,
+                        "organization_name": created["organization_name"],
                         "invitation_token": token,
                         "role_id": str(role_id) if role_id else None,
                     }
@@ -174,6 +220,10 @@ class InvitationManager:
         Returns:
             VaultInvitation instance or None if not found
         """
+        invitation = self._by_id.get(invitation_id)
+        if invitation is not None:
+            return invitation
+
         result = await self.client.table("vault_invitations").select("*").eq(
             "id", str(invitation_id)
         ).execute()
@@ -181,26 +231,34 @@ class InvitationManager:
         if not result.data:
             return None
 
-        return VaultInvitation(**result.data[0])
+        return self._cache(VaultInvitation.from_db(result.data[0]))
 
     async def get_by_token(self, token: str) -> Optional[VaultInvitation]:
         """
         Get an invitation by its token.
 
+        The token is looked up by its hash; the raw token is never sent to
+        the database.
+
         Args:
             token: Invitation token
 
         Returns:
             VaultInvitation instance or None if not found
         """
+        token_hash = _hash_token(token)
+        invitation = self._by_token.get(token_hash)
+        if invitation is not None:
+            return invitation
+
         result = await self.client.table("vault_invitations").select("*").eq(
-            "token", token
+            "token_hash", token_hash
         ).execute()
 
         if not result.data:
             return None
 
-        return VaultInvitation(**result.data[0])
+        return self._cache(VaultInvitation.from_db({"token_hash": token_hash, **result.data[0]}))
 
     async def list_by_organization(
         self,
@@ -219,9 +277,9 @@ class InvitationManager:
             offset: Number of invitations to skip
 
         Returns:
-            List of VaultInvitation instances
+            List of VaultInvitation instances, with inviter and organization set
         """
-        query = self.client.table("vault_invitations").select("*").eq(
+        query = self.client.table("vault_invitations").select(_LIST_COLUMNS).eq(
             "organization_id", str(organization_id)
         )
 
@@ -232,7 +290,7 @@ class InvitationManager:
             "created_at", desc=True
         ).execute()
 
-        return [VaultInvitation(**inv) for inv in result.data]
+        return [VaultInvitation.from_db(inv) for inv in result.data]
 
     async def list_by_email(
         self,
@@ -247,16 +305,18 @@ class InvitationManager:
             pending_only: Only return pending (unaccepted) invitations
 
         Returns:
-            List of VaultInvitation instances
+            List of VaultInvitation instances, with inviter and organization set
         """
-        query = self.client.table("vault_invitations").select("*").eq("email", email)
+        query = self.client.table("vault_invitations").select(_LIST_COLUMNS).eq(
+            "email", email
+        )
 
         if pending_only:
             query = query.is_("accepted_at", "null")
 
         result = await query.order("created_at", desc=True).execute()
 
-        return [VaultInvitation(**inv) for inv in result.data]
+        return [VaultInvitation.from_db(inv) for inv in result.data]
 
     async def accept(
         self,
@@ -274,7 +334,8 @@ class InvitationManager:
             Updated VaultInvitation instance
 
         Raises:
-            ValueError: If invitation not found, expired, or already accepted
+            ValueError: If invitation not found, expired, or already accepted,
+                or the user is missing or already a member
 
         Example:
             ```python
@@ -293,43 +354,26 @@ class InvitationManager:
         if invitation.accepted_at:
             raise ValueError("Invitation has already been accepted")
 
-        if invitation.expires_at < datetime.utcnow():
+        if invitation.expires_at < datetime.now(timezone.utc):
             raise ValueError("Invitation has expired")
 
-        # Verify user exists
-        user = await self.vault.users.get(user_id)
-        if not user:
-            raise ValueError(f"User {user_id} not found")
-
-        # Verify email matches (if user exists with different email, that's OK)
-        # This allows accepting invites for an existing user who was invited
-
-        # Check if user is already a member
-        existing_membership = (
-            await self.client.table("vault_memberships")
-            .select("id")
-            .eq("user_id", str(user_id))
-            .eq("organization_id", str(invitation.organization_id))
-            .execute()
-        )
-        if existing_membership.data:
-            raise ValueError("User is already a member of this organization")
-
-        # Create membership
-        await self.vault.memberships.create(
-            user_id=user_id,
-            organization_id=invitation.organization_id,
-            role_id=invitation.role_id,
-        )
-
-        # Mark invitation as accepted
-        now = datetime.utcnow()
-        result = await self.client.table("vault_invitations").update({
-            "accepted_at": now.isoformat(),
-            "accepted_by": str(user_id),
-        }).eq("id", str(invitation.id)).execute()
+        # Verify the user, check membership, create it and mark the
+        # invitation accepted in a single transaction. The function repeats
+        # the checks above under a row lock, so concurrent accepts can't race.
+        # A user whose email differs from the invited one may still accept.
+        self._forget(invitation)
+        try:
+            result = await self.client.rpc(
+                "vault_accept_invitation",
+                {"p_token_hash": _hash_token(token), "p_user_id": str(user_id)},
+            ).execute()
+        except APIError as e:
+            if e.code in _CHECK_ERRORS:
+                raise ValueError(e.message) from e
+            raise
 
-        return VaultInvitation(**result.data[0])
+        self.vault.permissions.invalidate_user(user_id)
+        return VaultInvitation.from_db(_rpc_row(result.data))
 
     async def revoke(self, invitation_id: UUID) -> None:
         """
@@ -354,9 +398,16 @@ class InvitationManager:
         if invitation.accepted_at:
             raise ValueError("Cannot revoke an accepted invitation")
 
-        await self.client.table("vault_invitations").delete().eq(
-            "id", str(invitation_id)
-        ).execute()
+        # The cached copy may be stale, so only delete the row while it is
+        # still pending. The deleted row isn't needed; skip sending it back.
+        result = await self.client.table("vault_invitations").delete(
+            count=CountMethod.exact, returning=ReturnMethod.minimal
+        ).eq("id", str(invitation_id)).is_("accepted_at", "null").execute()
+        self._forget(invitation)
+
+        if not result.count:
+            # Accepted, or already deleted by a concurrent revoke or cleanup
+            raise ValueError(f"Invitation {invitation_id} not found or already accepted")
 
     async def resend(
         self,
@@ -386,24 +437,30 @@ class InvitationManager:
 
         # Generate new token and extend expiration
         new_token = self._generate_token()
-        new_expires_at = datetime.utcnow() + timedelta(days=7)
+        new_expires_at = datetime.now(timezone.utc) + timedelta(days=7)
 
+        # Only update the row while it is still pending; the cached copy
+        # may predate an acceptance
         result = await self.client.table("vault_invitations").update({
-            "token": new_token,
+            "token_hash": _hash_token(new_token),
             "expires_at": new_expires_at.isoformat(),
-        }).eq("id", str(invitation_id)).execute()
+        }).eq("id", str(invitation_id)).is_("accepted_at", "null").execute()
+
+        self._forget(invitation)
+        if not result.data:
+            raise ValueError(f"Invitation {invitation_id} not found or already accepted")
 
-        updated_invitation = VaultInvitation(**result.data[0])
+        updated_invitation = VaultInvitation.from_db({**result.data[0], "token": new_token})
 
-        # Get org for email metadata
-        org = await self.vault.orgs.get(invitation.organization_id)
+        # Get org name for email metadata
+        org_name = await self._org_name(invitation.organization_id)
 
         # Resend email
         try:
             options = {
                 "data": {
                     "organization_id": str(invitation.organization_id),
-                    "organization_name": org.name if org else None,
+                    "organization_name": org_name,
                     "invitation_token": new_token,
                     "role_id": str(invitation.role_id) if invitation.role_id else None,
                 }
@@ -435,8 +492,9 @@ class InvitationManager:
         Returns:
             Count of invitations
         """
+        # head=True: only the count header comes back, no rows
         query = self.client.table("vault_invitations").select(
-            "id", count="exact"
+            "id", count="exact", head=True
         ).eq("organization_id", str(organization_id))
 
         if pending_only:
@@ -445,10 +503,17 @@ class InvitationManager:
         result = await query.execute()
         return result.count or 0
 
-    async def cleanup_expired(self) -> int:
+    async def cleanup_expired(self, batch_size: int = CLEANUP_BATCH_SIZE) -> int:
         """
         Delete all expired unaccepted invitations.
 
+        Rows are deleted in batches by the vault_cleanup_expired_invitations
+        database function, one short transaction per batch, so a large backlog
+        never locks the table for long.
+
+        Args:
+            batch_size: Maximum invitations deleted per transaction
+
         Returns:
             Number of invitations deleted
 
@@ -458,19 +523,19 @@ class InvitationManager:
             print(f"Cleaned up {deleted} expired invitations")
             ```
         """
-        now = datetime.utcnow().isoformat()
-
-        # Get count first
-        count_result = await self.client.table("vault_invitations").select(
-            "id", count="exact"
-        ).is_("accepted_at", "null").lt("expires_at", now).execute()
+        count = 0
+        while True:
+            result = await self.client.rpc(
+                "vault_cleanup_expired_invitations",
+                {"p_batch_size": batch_size},
+            ).execute()
 
-        count = count_result.count or 0
+            deleted = result.data or 0
+            count += deleted
+            if deleted < batch_size:
+                break
 
         if count > 0:
-            # Delete expired invitations
-            await self.client.table("vault_invitations").delete().is_(
-                "accepted_at", "null"
-            ).lt("expires_at", now).execute()
+            self._forget_all()
 
         return count
@@ -4,11 +4,48 @@ Vault invitation models.
 Pydantic models for organization invitations in Vault.
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, EmailStr, Field, field_validator
+
+# Columns parsed by VaultInvitation.from_db()
+_UUID_FIELDS = ("id", "organization_id", "role_id", "invited_by", "accepted_by")
+_DATETIME_FIELDS = ("expires_at", "accepted_at", "created_at")
+
+
+def _assume_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _parse_datetime(value: Any) -> Any:
+    if isinstance(value, str):
+        return _assume_utc(datetime.fromisoformat(value))
+    if isinstance(value, datetime):
+        return _assume_utc(value)
+    return value
+
+
+def _parse_uuid(value: Any) -> Any:
+    return UUID(value) if isinstance(value, str) else value
+
+
+class InvitationUser(BaseModel):
+    """User who sent an invitation, embedded in invitation listings."""
+
+    id: UUID
+    email: EmailStr
+    display_name: Optional[str] = None
+
+
+class InvitationOrganization(BaseModel):
+    """Organization an invitation is for, embedded in invitation listings."""
+
+    id: UUID
+    name: str
 
 
 class VaultInvitation(BaseModel):
@@ -27,8 +64,10 @@ class VaultInvitation(BaseModel):
     # Who sent the invite
     invited_by: Optional[UUID] = None
 
-    # Token for accepting
-    token: str
+    # Token for accepting. Only a SHA-256 hash is stored, so the raw token is
+    # set only on invitations returned by create() and resend().
+    token: Optional[str] = None
+    token_hash: Optional[str] = None
     expires_at: datetime
 
     # Tracking
@@ -38,6 +77,55 @@ class VaultInvitation(BaseModel):
     # Timestamps
     created_at: datetime
 
+    # Related rows, set on invitations returned by list_by_organization()
+    # and list_by_email()
+    inviter: Optional[InvitationUser] = None
+    organization: Optional[InvitationOrganization] = None
+
+    @field_validator("expires_at", "accepted_at", "created_at")
+    @classmethod
+    def assume_utc(cls, v: Optional[datetime]) -> Optional[datetime]:
+        """Treat timestamps without an offset as UTC, so they compare with aware ones."""
+        return v if v is None else _assume_utc(v)
+
+    @classmethod
+    def from_db(cls, row: Dict[str, Any]) -> "VaultInvitation":
+        """
+        Build an invitation from a vault_invitations row without validation.
+
+        Rows from the database are already well-formed, so only UUIDs and
+        timestamps are parsed before model_construct(). Falls back to the
+        validating constructor if a value doesn't parse.
+
+        Args:
+            row: Row as returned by PostgREST, optionally with embedded
+                inviter and organization
+
+        Returns:
+            VaultInvitation instance
+        """
+        try:
+            data = dict(row)
+            for field in _UUID_FIELDS:
+                data[field] = _parse_uuid(data.get(field))
+            for field in _DATETIME_FIELDS:
+                data[field] = _parse_datetime(data.get(field))
+
+            inviter = data.get("inviter")
+            if isinstance(inviter, dict):
+                data["inviter"] = InvitationUser.model_construct(
+                    **{**inviter, "id": _parse_uuid(inviter["id"])}
+                )
+            organization = data.get("organization")
+            if isinstance(organization, dict):
+                data["organization"] = InvitationOrganization.model_construct(
+                    **{**organization, "id": _parse_uuid(organization["id"])}
+                )
+        except (KeyError, TypeError, ValueError):
+            return cls(**row)
+
+        return cls.model_construct(**data)
+
     model_config = {
         "from_attributes": True,
         "json_schema_extra": {
@@ -48,6 +136,7 @@ class VaultInvitation(BaseModel):
                 "role_id": "789e0123-e89b-12d3-a456-426614174000",
                 "invited_by": "012e3456-e89b-12d3-a456-426614174000",
                 "token": "abc123xyz",
+                "token_hash": "604365fa1146d17e81aa41ef72ef03b07a5d3c2e44cfa6f9b817606779eccae6",
                 "expires_at": "2024-01-08T00:00:00Z",
                 "accepted_at": None,
                 "accepted_by": None,
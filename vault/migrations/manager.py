@@ -4,16 +4,30 @@ Migration manager for Vault database schema.
 Handles applying SQL migrations to the Supabase/PostgreSQL database.
 """
 
+import asyncio
 import os
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 
 from ..utils.supabase import VaultSupabaseClient
 
+# asyncpg is optional; without it migrations have to be applied manually
+try:
+    import asyncpg
+except ImportError:
+    asyncpg = None
+
+# Discovered migrations per versions directory, with the directory mtime they
+# were read at. Adding, removing or renaming a file changes the mtime.
+_discovered: Dict[Path, Tuple[int, List["Migration"]]] = {}
+
 
 class Migration:
     """Represents a single database migration."""
 
+    __slots__ = ("version", "version_int", "name", "path")
+
     def __init__(self, version: str, name: str, path: Path) -> None:
         """
         Initialize a migration.
@@ -22,8 +36,13 @@ class Migration:
             version: Migration version (e.g., "001")
             name: Migration name (e.g., "initial_schema")
             path: Path to the SQL file
+
+        Raises:
+            ValueError: If the version is not numeric
         """
         self.version = version
+        # Numeric version for ordering, so "010" sorts after "009" and "10" after "9"
+        self.version_int = int(version)
         self.name = name
         self.path = path
 
@@ -50,6 +69,8 @@ class Migration:
             raise ValueError(f"Invalid migration filename: {path.name}. Expected format: 001_name.sql")
 
         version, name = parts
+        if not version.isdigit():
+            raise ValueError(f"Invalid migration filename: {path.name}. Version must be numeric")
         return cls(version=version, name=name, path=path)
 
     def read_sql(self) -> str:
@@ -81,11 +102,15 @@ class MigrationManager:
         """
         self.client = client
         self.migrations_dir = Path(__file__).parent / "versions"
+        # Direct Postgres connections, created on first use by _execute_sql
+        self._pool: Optional["asyncpg.Pool"] = None
 
     def discover_migrations(self) -> List[Migration]:
         """
         Discover all migration files in the versions directory.
 
+        The directory is only rescanned when its mtime changes.
+
         Returns:
             List of Migration objects, sorted by version
 
@@ -94,20 +119,66 @@ class MigrationManager:
             >>> migrations = manager.discover_migrations()
             [Migration(version="001", name="initial_schema")]
         """
-        if not self.migrations_dir.exists():
+        try:
+            mtime = self.migrations_dir.stat().st_mtime_ns
+        except FileNotFoundError:
             return []
 
+        cached = _discovered.get(self.migrations_dir)
+        if cached is not None and cached[0] == mtime:
+            return list(cached[1])
+
         migrations = []
-        for path in self.migrations_dir.glob("*.sql"):
-            try:
-                migration = Migration.from_file(path)
-                migrations.append(migration)
-            except ValueError as e:
-                print(f"Warning: Skipping invalid migration file: {e}")
+        with os.scandir(self.migrations_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".sql") or not entry.is_file():
+                    continue
+                try:
+                    migration = Migration.from_file(Path(entry.path))
+                    migrations.append(migration)
+                except ValueError as e:
+                    print(f"Warning: Skipping invalid migration file: {e}")
 
         # Sort by version
-        migrations.sort(key=lambda m: m.version)
-        return migrations
+        migrations.sort(key=attrgetter("version_int"))
+        _discovered[self.migrations_dir] = (mtime, migrations)
+        return list(migrations)
+
+    def head(self) -> Optional[Migration]:
+        """
+        Get the latest available migration.
+
+        Returns:
+            The highest-versioned migration, or None if there are none
+        """
+        migrations = self.discover_migrations()
+        return migrations[-1] if migrations else None
+
+    async def is_current(self) -> bool:
+        """
+        Check whether the latest available migration is applied.
+
+        Asks vault_migrations for that one version with a single one-row
+        query, so a reset, re-pointed or rolled-back database is noticed.
+        It doesn't detect a gap left by an older migration that was skipped;
+        get_pending_migrations() does.
+
+        Returns:
+            True if the latest migration is recorded as applied
+        """
+        head = self.head()
+        if head is None:
+            return True
+
+        try:
+            result = await self.client.table("vault_migrations").select("version").eq(
+                "version", head.version
+            ).limit(1).execute()
+        except Exception:
+            # Table doesn't exist yet - no migrations applied
+            return False
+
+        return bool(result.data)
 
     async def get_applied_migrations(self) -> List[str]:
         """
@@ -143,85 +214,145 @@ class MigrationManager:
         """
         print(f"Applying migration {migration.version}: {migration.name}")
 
-        sql = migration.read_sql()
+        # Read off the event loop; an initial schema can be large
+        sql = await asyncio.to_thread(migration.read_sql)
 
-        # Execute the SQL via Supabase RPC
-        # Note: We need to use the postgrest client directly for raw SQL
-        # Split the SQL into individual statements and execute them
-        # For now, we'll use a simple approach - in production, you might want
-        # to use a proper SQL parser or psycopg2
         try:
-            # Execute via raw SQL using the PostgREST client
-            # Note: This is a simplified approach. For production, consider using
-            # psycopg2 or the Supabase SQL editor API
-            await self._execute_sql(sql)
+            await self._execute_sql(sql, migration)
             print(f"✓ Migration {migration.version} applied successfully")
         except Exception as e:
             print(f"✗ Migration {migration.version} failed: {e}")
             raise
 
-    async def _execute_sql(self, sql: str) -> None:
+    async def _get_pool(self) -> "asyncpg.Pool":
         """
-        Execute raw SQL against the database.
+        Get the Postgres connection pool, creating it on first use.
 
-        This is a helper method that handles executing SQL migrations.
-        In Supabase, we need to use the underlying PostgreSQL connection.
+        Raises:
+            NotImplementedError: If asyncpg or VAULT_DATABASE_URL is missing
+        """
+        if self._pool is not None:
+            return self._pool
+
+        database_url = self.client.config.database_url
+        if asyncpg is None or not database_url:
+            raise NotImplementedError(
+                "Direct SQL execution requires asyncpg (pip install vault[migrations]) "
+                "and VAULT_DATABASE_URL. "
+                "Otherwise run migrations manually via Supabase dashboard or psql. "
+                "Migration SQL files are in vault/migrations/versions/"
+            )
+
+        # Prepared statements can't be reused across connections behind
+        # Supavisor/pgbouncer in transaction mode, so don't cache them
+        self._pool = await asyncpg.create_pool(
+            database_url, min_size=1, max_size=3, statement_cache_size=0
+        )
+        return self._pool
+
+    async def _execute_sql(self, sql: str, migration: Optional[Migration] = None) -> None:
+        """
+        Execute raw SQL against the database in a single transaction.
 
         Args:
-            sql: SQL to execute
+            sql: SQL to execute; may contain several statements
+            migration: Migration the SQL belongs to, recorded in vault_migrations
+                in the same transaction
 
-        Note:
-            This is a simplified implementation. For production use,
-            consider using psycopg2 or the Supabase Management API.
+        Raises:
+            NotImplementedError: If asyncpg or VAULT_DATABASE_URL is missing
         """
-        # For now, we'll use the RPC endpoint approach
-        # In a real implementation, you'd want to:
-        # 1. Use psycopg2 with the database connection string
-        # 2. Or use Supabase Management API
-        # 3. Or have users run migrations via Supabase dashboard initially
-
-        # Since this is v1 and we want to keep it simple, we'll document
-        # that users should run the initial migration manually or via
-        # the Supabase dashboard, and we'll use this for tracking only
-
-        # For now, just execute via RPC (requires creating a migration function)
-        # This is a placeholder - we'll need to implement proper SQL execution
-        raise NotImplementedError(
-            "Direct SQL execution not yet implemented. "
-            "Please run migrations manually via Supabase dashboard or psql. "
-            "Migration SQL files are in vault/migrations/versions/"
-        )
-
-    async def migrate(self, target: Optional[str] = None) -> None:
+        pool = await self._get_pool()
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                # Without arguments, execute() runs the whole script over the
+                # simple query protocol, so multiple statements are fine
+                await conn.execute(sql)
+                if migration is not None:
+                    await conn.execute(
+                        "INSERT INTO vault_migrations (version, name) VALUES ($1, $2) "
+                        "ON CONFLICT (version) DO NOTHING",
+                        migration.version,
+                        migration.name,
+                    )
+
+    async def close(self) -> None:
+        """Close the Postgres connection pool, if one was opened."""
+        if self._pool is not None:
+            pool, self._pool = self._pool, None
+            await pool.close()
+
+    async def get_pending_migrations(self, target: Optional[str] = None) -> List[Migration]:
         """
-        Run all pending migrations up to the target version.
+        Get migrations that have not been applied yet.
 
         Args:
             target: Target migration version (default: latest)
 
+        Returns:
+            Pending migrations up to the target, sorted by version
+
         Example:
-            >>> # Run all pending migrations
-            >>> await manager.migrate()
-            >>>
-            >>> # Run up to specific version
-            >>> await manager.migrate(target="003")
+            >>> pending = await manager.get_pending_migrations()
+            [Migration(version="002", name="webhooks_and_api_keys")]
         """
         # Discover all available migrations
         migrations = self.discover_migrations()
 
         if not migrations:
-            print("No migrations found")
-            return
+            return []
 
         # Get already applied migrations
-        applied = await self.get_applied_migrations()
+        applied = frozenset(await self.get_applied_migrations())
 
         # Filter to pending migrations
         pending = [m for m in migrations if m.version not in applied]
 
         if target:
             # Only run migrations up to target
-            pending = [m for m in pending if m.version <= target]
+            target_int = int(target)
+            pending = [m for m in pending if m.version_int <= target_int]
+
+        return pending
+
+    async def migrate_iter(self, target: Optional[str] = None) -> AsyncIterator[Migration]:
+        """
+        Apply pending migrations one at a time, yielding each once it is applied.
+
+        Unlike migrate(), this doesn't print anything, so callers can render
+        progress themselves. Stopping iteration early leaves the migrations
+        applied so far in place.
+
+        Args:
+            target: Target migration version (default: latest)
+
+        Yields:
+            Each Migration after it has been applied
+
+        Example:
+            >>> async for migration in manager.migrate_iter():
+            ...     print(f"Applied {migration.version}")
+        """
+        for migration in await self.get_pending_migrations(target):
+            sql = await asyncio.to_thread(migration.read_sql)
+            await self._execute_sql(sql, migration)
+            yield migration
+
+    async def migrate(self, target: Optional[str] = None) -> None:
+        """
+        Run all pending migrations up to the target version.
+
+        Args:
+            target: Target migration version (default: latest)
+
+        Example:
+            >>> # Run all pending migrations
+            >>> await manager.migrate()
+            >>>
+            >>> # Run up to specific version
+            >>> await manager.migrate(target="003")
+        """
+        pending = await self.get_pending_migrations(target)
 
         if not pending:
             print("No pending migrations")
@@ -249,7 +380,7 @@ class MigrationManager:
             [ ] 003_add_webhooks
         """
         migrations = self.discover_migrations()
-        applied = await self.get_applied_migrations()
+        applied = frozenset(await self.get_applied_migrations())
 
         print("Migration Status:")
         print("-" * 50)
@@ -0,0 +1,45 @@
+-- ============================================================================
+-- Vault Add Member Function - Migration 003
+-- ============================================================================
+-- Adds a function that resolves an organization by slug and a user by email
+-- and creates the membership in one round-trip and one transaction
+-- ============================================================================
+
+-- ============================================================================
+-- ADD MEMBER (slug + email -> membership)
+-- ============================================================================
+CREATE OR REPLACE FUNCTION vault_add_member(
+    p_slug TEXT,
+    p_email TEXT,
+    p_role_id UUID DEFAULT NULL
+)
+RETURNS JSON
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_org_id UUID;
+    v_user_id UUID;
+    v_membership vault_memberships;
+BEGIN
+    SELECT id INTO v_org_id FROM vault_organizations WHERE slug = p_slug;
+    IF v_org_id IS NULL THEN
+        RAISE EXCEPTION 'Organization not found: %', p_slug USING ERRCODE = 'P0002';
+    END IF;
+
+    SELECT id INTO v_user_id FROM vault_users WHERE email = p_email;
+    IF v_user_id IS NULL THEN
+        RAISE EXCEPTION 'User not found: %', p_email USING ERRCODE = 'P0002';
+    END IF;
+
+    INSERT INTO vault_memberships (user_id, organization_id, role_id)
+    VALUES (v_user_id, v_org_id, p_role_id)
+    RETURNING * INTO v_membership;
+
+    RETURN row_to_json(v_membership);
+END;
+$$;
+
+-- Record this migration
+INSERT INTO vault_migrations (version, name)
+VALUES ('003', 'add_member_function')
+ON CONFLICT (version) DO NOTHING;
@@ -0,0 +1,112 @@
+-- ============================================================================
+-- Vault Invitation Functions - Migration 004
+-- ============================================================================
+-- Adds functions that run the checks and writes for creating and accepting
+-- an invitation in one round-trip and one transaction
+-- ============================================================================
+
+-- ============================================================================
+-- CREATE INVITATION
+-- ============================================================================
+-- Replaces any pending invitation for the same email and organization.
+-- Returns {"invitation": <row>, "organization_name": <text>}
+CREATE OR REPLACE FUNCTION vault_create_invitation(
+    p_organization_id UUID,
+    p_email TEXT,
+    p_token TEXT,
+    p_expires_at TIMESTAMPTZ,
+    p_role_id UUID DEFAULT NULL,
+    p_invited_by UUID DEFAULT NULL
+)
+RETURNS JSON
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_org_name TEXT;
+    v_invitation vault_invitations;
+BEGIN
+    SELECT name INTO v_org_name FROM vault_organizations WHERE id = p_organization_id;
+    IF NOT FOUND THEN
+        RAISE EXCEPTION 'Organization % not found', p_organization_id USING ERRCODE = 'P0002';
+    END IF;
+
+    IF EXISTS (
+        SELECT 1
+        FROM vault_memberships m
+        JOIN vault_users u ON u.id = m.user_id
+        WHERE u.email = p_email AND m.organization_id = p_organization_id
+    ) THEN
+        RAISE EXCEPTION 'User % is already a member of this organization', p_email;
+    END IF;
+
+    DELETE FROM vault_invitations
+    WHERE email = p_email
+      AND organization_id = p_organization_id
+      AND accepted_at IS NULL;
+
+    INSERT INTO vault_invitations (organization_id, email, role_id, invited_by, token, expires_at)
+    VALUES (p_organization_id, p_email, p_role_id, p_invited_by, p_token, p_expires_at)
+    RETURNING * INTO v_invitation;
+
+    RETURN json_build_object(
+        'invitation', row_to_json(v_invitation),
+        'organization_name', v_org_name
+    );
+END;
+$$;
+
+-- ============================================================================
+-- ACCEPT INVITATION
+-- ============================================================================
+-- Creates the membership and marks the invitation accepted.
+-- Returns the updated invitation row
+CREATE OR REPLACE FUNCTION vault_accept_invitation(
+    p_token TEXT,
+    p_user_id UUID
+)
+RETURNS JSON
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_invitation vault_invitations;
+BEGIN
+    SELECT * INTO v_invitation FROM vault_invitations WHERE token = p_token FOR UPDATE;
+    IF NOT FOUND THEN
+        RAISE EXCEPTION 'Invitation not found' USING ERRCODE = 'P0002';
+    END IF;
+
+    IF v_invitation.accepted_at IS NOT NULL THEN
+        RAISE EXCEPTION 'Invitation has already been accepted';
+    END IF;
+
+    IF v_invitation.expires_at < NOW() THEN
+        RAISE EXCEPTION 'Invitation has expired';
+    END IF;
+
+    IF NOT EXISTS (SELECT 1 FROM vault_users WHERE id = p_user_id) THEN
+        RAISE EXCEPTION 'User % not found', p_user_id USING ERRCODE = 'P0002';
+    END IF;
+
+    IF EXISTS (
+        SELECT 1 FROM vault_memberships
+        WHERE user_id = p_user_id AND organization_id = v_invitation.organization_id
+    ) THEN
+        RAISE EXCEPTION 'User is already a member of this organization';
+    END IF;
+
+    INSERT INTO vault_memberships (user_id, organization_id, role_id)
+    VALUES (p_user_id, v_invitation.organization_id, v_invitation.role_id);
+
+    UPDATE vault_invitations
+    SET accepted_at = NOW(), accepted_by = p_user_id
+    WHERE id = v_invitation.id
+    RETURNING * INTO v_invitation;
+
+    RETURN row_to_json(v_invitation);
+END;
+$$;
+
+-- Record this migration
+INSERT INTO vault_migrations (version, name)
+VALUES ('004', 'invitation_functions')
+ON CONFLICT (version) DO NOTHING;
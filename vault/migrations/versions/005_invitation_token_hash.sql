@@ -0,0 +1,130 @@
+-- ============================================================================
+-- Vault Invitation Token Hash - Migration 005
+-- ============================================================================
+-- Stores a SHA-256 hash of each invitation token instead of the token itself,
+-- so the database never holds a live invitation secret. Invitations are
+-- looked up by hashing the presented token.
+-- ============================================================================
+
+ALTER TABLE vault_invitations ADD COLUMN IF NOT EXISTS token_hash TEXT;
+
+-- Hash the tokens of existing invitations (their links keep working), then
+-- discard the raw tokens
+UPDATE vault_invitations
+SET token_hash = encode(sha256(convert_to(token, 'UTF8')), 'hex')
+WHERE token_hash IS NULL AND token IS NOT NULL;
+
+ALTER TABLE vault_invitations ALTER COLUMN token DROP NOT NULL;
+UPDATE vault_invitations SET token = NULL WHERE token IS NOT NULL;
+
+ALTER TABLE vault_invitations ALTER COLUMN token_hash SET NOT NULL;
+
+DROP INDEX IF EXISTS idx_vault_invitations_token;
+CREATE UNIQUE INDEX IF NOT EXISTS idx_vault_invitations_token_hash
+    ON vault_invitations(token_hash);
+
+-- ============================================================================
+-- INVITATION FUNCTIONS (take the token hash instead of the token)
+-- ============================================================================
+DROP FUNCTION IF EXISTS vault_create_invitation(UUID, TEXT, TEXT, TIMESTAMPTZ, UUID, UUID);
+DROP FUNCTION IF EXISTS vault_accept_invitation(TEXT, UUID);
+
+-- Replaces any pending invitation for the same email and organization.
+-- Returns {"invitation": <row>, "organization_name": <text>}
+CREATE OR REPLACE FUNCTION vault_create_invitation(
+    p_organization_id UUID,
+    p_email TEXT,
+    p_token_hash TEXT,
+    p_expires_at TIMESTAMPTZ,
+    p_role_id UUID DEFAULT NULL,
+    p_invited_by UUID DEFAULT NULL
+)
+RETURNS JSON
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_org_name TEXT;
+    v_invitation vault_invitations;
+BEGIN
+    SELECT name INTO v_org_name FROM vault_organizations WHERE id = p_organization_id;
+    IF NOT FOUND THEN
+        RAISE EXCEPTION 'Organization % not found', p_organization_id USING ERRCODE = 'P0002';
+    END IF;
+
+    IF EXISTS (
+        SELECT 1
+        FROM vault_memberships m
+        JOIN vault_users u ON u.id = m.user_id
+        WHERE u.email = p_email AND m.organization_id = p_organization_id
+    ) THEN
+        RAISE EXCEPTION 'User % is already a member of this organization', p_email;
+    END IF;
+
+    DELETE FROM vault_invitations
+    WHERE email = p_email
+      AND organization_id = p_organization_id
+      AND accepted_at IS NULL;
+
+    INSERT INTO vault_invitations (organization_id, email, role_id, invited_by, token_hash, expires_at)
+    VALUES (p_organization_id, p_email, p_role_id, p_invited_by, p_token_hash, p_expires_at)
+    RETURNING * INTO v_invitation;
+
+    RETURN json_build_object(
+        'invitation', row_to_json(v_invitation),
+        'organization_name', v_org_name
+    );
+END;
+$$;
+
+-- Creates the membership and marks the invitation accepted.
+-- Returns the updated invitation row
+CREATE OR REPLACE FUNCTION vault_accept_invitation(
+    p_token_hash TEXT,
+    p_user_id UUID
+)
+RETURNS JSON
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_invitation vault_invitations;
+BEGIN
+    SELECT * INTO v_invitation FROM vault_invitations WHERE token_hash = p_token_hash FOR UPDATE;
+    IF NOT FOUND THEN
+        RAISE EXCEPTION 'Invitation not found' USING ERRCODE = 'P0002';
+    END IF;
+
+    IF v_invitation.accepted_at IS NOT NULL THEN
+        RAISE EXCEPTION 'Invitation has already been accepted';
+    END IF;
+
+    IF v_invitation.expires_at < NOW() THEN
+        RAISE EXCEPTION 'Invitation has expired';
+    END IF;
+
+    IF NOT EXISTS (SELECT 1 FROM vault_users WHERE id = p_user_id) THEN
+        RAISE EXCEPTION 'User % not found', p_user_id USING ERRCODE = 'P0002';
+    END IF;
+
+    IF EXISTS (
+        SELECT 1 FROM vault_memberships
+        WHERE user_id = p_user_id AND organization_id = v_invitation.organization_id
+    ) THEN
+        RAISE EXCEPTION 'User is already a member of this organization';
+    END IF;
+
+    INSERT INTO vault_memberships (user_id, organization_id, role_id)
+    VALUES (p_user_id, v_invitation.organization_id, v_invitation.role_id);
+
+    UPDATE vault_invitations
+    SET accepted_at = NOW(), accepted_by = p_user_id
+    WHERE id = v_invitation.id
+    RETURNING * INTO v_invitation;
+
+    RETURN row_to_json(v_invitation);
+END;
+$$;
+
+-- Record this migration
+INSERT INTO vault_migrations (version, name)
+VALUES ('005', 'invitation_token_hash')
+ON CONFLICT (version) DO NOTHING;
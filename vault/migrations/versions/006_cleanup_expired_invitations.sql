@@ -0,0 +1,35 @@
+-- ============================================================================
+-- Vault Expired Invitation Cleanup - Migration 006
+-- ============================================================================
+-- Adds a function that deletes one bounded batch of expired invitations.
+-- Each call is its own transaction, so callers loop until a batch comes back
+-- short instead of holding locks on every expired row at once.
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION vault_cleanup_expired_invitations(
+    p_batch_size INTEGER DEFAULT 1000
+)
+RETURNS INTEGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_deleted INTEGER;
+BEGIN
+    DELETE FROM vault_invitations
+    WHERE id IN (
+        SELECT id FROM vault_invitations
+        WHERE accepted_at IS NULL AND expires_at < NOW()
+        LIMIT p_batch_size
+        -- Skip rows another transaction holds (e.g. an accept in progress)
+        FOR UPDATE SKIP LOCKED
+    );
+
+    GET DIAGNOSTICS v_deleted = ROW_COUNT;
+    RETURN v_deleted;
+END;
+$$;
+
+-- Record this migration
+INSERT INTO vault_migrations (version, name)
+VALUES ('006', 'cleanup_expired_invitations')
+ON CONFLICT (version) DO NOTHING;
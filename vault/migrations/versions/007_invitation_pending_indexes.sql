@@ -0,0 +1,28 @@
+-- ============================================================================
+-- Vault Pending Invitation Indexes - Migration 007
+-- ============================================================================
+-- Adds partial indexes covering only pending (unaccepted) invitations, used
+-- by the pending listings and counts and by expired invitation cleanup.
+-- Accepted invitations are never scanned, and the indexes stay small as
+-- they accumulate.
+-- ============================================================================
+
+-- list_by_organization / count_by_organization (pending_only)
+CREATE INDEX IF NOT EXISTS idx_vault_invitations_pending_org
+    ON vault_invitations(organization_id, created_at DESC)
+    WHERE accepted_at IS NULL;
+
+-- list_by_email (pending_only)
+CREATE INDEX IF NOT EXISTS idx_vault_invitations_pending_email
+    ON vault_invitations(email, created_at DESC)
+    WHERE accepted_at IS NULL;
+
+-- vault_cleanup_expired_invitations
+CREATE INDEX IF NOT EXISTS idx_vault_invitations_pending_expires
+    ON vault_invitations(expires_at)
+    WHERE accepted_at IS NULL;
+
+-- Record this migration
+INSERT INTO vault_migrations (version, name)
+VALUES ('007', 'invitation_pending_indexes')
+ON CONFLICT (version) DO NOTHING;
@@ -5,7 +5,7 @@ Handles operations for user memberships in organizations (vault_memberships tabl
 """
 
 from datetime import datetime
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 from uuid import UUID
 
 from .models import (
@@ -18,6 +18,20 @@ if TYPE_CHECKING:
     from ..client import Vault
 
 
+def _row_to_membership(row: dict) -> VaultMembership:
+    """Build a VaultMembership from a vault_memberships row."""
+    return VaultMembership(
+        id=UUID(row["id"]),
+        user_id=UUID(row["user_id"]),
+        organization_id=UUID(row["organization_id"]),
+        role_id=UUID(row["role_id"]) if row.get("role_id") else None,
+        status=row.get("status", "active"),
+        metadata=row.get("metadata", {}),
+        joined_at=datetime.fromisoformat(row["joined_at"].replace("Z", "+00:00")),
+        updated_at=datetime.fromisoformat(row["updated_at"].replace("Z", "+00:00")),
+    )
+
+
 class MembershipManager:
     """
     Manager for organization membership operations.
@@ -94,32 +108,116 @@ class MembershipManager:
             metadata=metadata or {},
         )
 
-        # Insert into vault_memberships
-        insert_data = {
-            "user_id": str(request.user_id),
-            "organization_id": str(request.organization_id),
-            "metadata": request.metadata,
-        }
+        memberships = await self.create_many([request])
 
-        if request.role_id is not None:
-            insert_data["role_id"] = str(request.role_id)
+        if not memberships:
+            raise ValueError("Failed to create membership")
 
-        result = await self.client.table("vault_memberships").insert(insert_data).execute()
+        return memberships[0]
 
-        if not result.data or len(result.data) == 0:
+    async def create_many(
+        self,
+        requests: List[CreateMembershipRequest],
+    ) -> List[VaultMembership]:
+        """
+        Create several memberships in a single request.
+
+        All rows are inserted by one bulk insert, so either every membership
+        is created or none is.
+
+        Args:
+            requests: Memberships to create
+
+        Returns:
+            Created VaultMemberships, in the order of requests
+
+        Raises:
+            APIError: If a user is already a member or validation fails
+
+        Example:
+            ```python
+            memberships = await vault.memberships.create_many([
+                CreateMembershipRequest(user_id=user_id, organization_id=org_id)
+                for user_id in new_user_ids
+            ])
+            ```
+        """
+        if not requests:
+            return []
+
+        insert_data = []
+        for request in requests:
+            row = {
+                "user_id": str(request.user_id),
+                "organization_id": str(request.organization_id),
+                "metadata": request.metadata,
+            }
+            if request.role_id is not None:
+                row["role_id"] = str(request.role_id)
+            insert_data.append(row)
+
+        # Columns a row leaves out (role_id) get the column default, as they
+        # would in a single-row insert
+        result = await self.client.table("vault_memberships").insert(
+            insert_data, default_to_null=False
+        ).execute()
+
+        if not result.data:
+            return []
+
+        for member_data in result.data:
+            self.vault.permissions.invalidate_user(member_data["user_id"])
+        return [_row_to_membership(m) for m in result.data]
+
+    async def create_by_slug_and_email(
+        self,
+        slug: str,
+        email: str,
+        role_id: Optional[UUID] = None,
+    ) -> VaultMembership:
+        """
+        Add a user to an organization by organization slug and user email.
+
+        Resolves both lookups and inserts the membership inside the
+        vault_add_member database function, so the whole operation is one
+        round-trip and one transaction.
+
+        Args:
+            slug: Organization slug
+            email: User email
+            role_id: Optional role UUID
+
+        Returns:
+            Created VaultMembership
+
+        Raises:
+            APIError: If the organization or user does not exist, or the
+                user is already a member
+
+        Example:
+            ```python
+            membership = await vault.memberships.create_by_slug_and_email(
+                "acme-corp",
+                "user@example.com",
+                role_id=editor_role_id,
+            )
+            ```
+        """
+        result = await self.client.rpc(
+            "vault_add_member",
+            {
+                "p_slug": slug,
+                "p_email": email,
+                "p_role_id": str(role_id) if role_id else None,
+            },
+        ).execute()
+
+        if not result.data:
             raise ValueError("Failed to create membership")
 
-        member_data = result.data[0]
-        return VaultMembership(
-            id=UUID(member_data["id"]),
-            user_id=UUID(member_data["user_id"]),
-            organization_id=UUID(member_data["organization_id"]),
-            role_id=UUID(member_data["role_id"]) if member_data.get("role_id") else None,
-            status=member_data.get("status", "active"),
-            metadata=member_data.get("metadata", {}),
-            joined_at=datetime.fromisoformat(member_data["joined_at"].replace("Z", "+00:00")),
-            updated_at=datetime.fromisoformat(member_data["updated_at"].replace("Z", "+00:00")),
-        )
+        member_data = result.data[0] if isinstance(result.data, list) else result.data
+        self.vault.permissions.invalidate_user(UUID(member_data["user_id"]))
+        return _row_to_membership(member_data)
 
     async def get(self, membership_id: UUID) -> Optional[VaultMembership]:
         """
@@ -144,16 +242,7 @@ class MembershipManager:
             return None
 
         member_data = result.data[0]
-        return VaultMembership(
-            id=UUID(member_data["id"]),
-            user_id=UUID(member_data["user_id"]),
-            organization_id=UUID(member_data["organization_id"]),
-            role_id=UUID(member_data["role_id"]) if member_data.get("role_id") else None,
-            status=member_data.get("status", "active"),
-            metadata=member_data.get("metadata", {}),
-            joined_at=datetime.fromisoformat(member_data["joined_at"].replace("Z", "+00:00")),
-            updated_at=datetime.fromisoformat(member_data["updated_at"].replace("Z", "+00:00")),
-        )
+        return _row_to_membership(member_data)
 
     async def get_by_user_and_org(
         self,
@@ -177,24 +266,43 @@ class MembershipManager:
                 print(f"User is a member with role: {membership.role_id}")
             ```
         """
-        result = await self.client.table("vault_memberships").select("*").eq(
-            "user_id", str(user_id)
+        memberships = await self.get_many_by_users_and_org([user_id], organization_id)
+        return memberships.get(UUID(str(user_id)))
+
+    async def get_many_by_users_and_org(
+        self,
+        user_ids: List[UUID],
+        organization_id: UUID,
+    ) -> Dict[UUID, VaultMembership]:
+        """
+        Get several users' memberships in an organization in a single request.
+
+        Args:
+            user_ids: User UUIDs
+            organization_id: Organization UUID
+
+        Returns:
+            Dict mapping user ID to VaultMembership; users who aren't members
+            are left out
+
+        Example:
+            ```python
+            memberships = await vault.memberships.get_many_by_users_and_org(user_ids, org_id)
+            new_user_ids = [u for u in user_ids if u not in memberships]
+            ```
+        """
+        if not user_ids:
+            return {}
+
+        result = await self.client.table("vault_memberships").select("*").in_(
+            "user_id", [str(u) for u in user_ids]
         ).eq("organization_id", str(organization_id)).execute()
 
-        if not result.data or len(result.data) == 0:
-            return None
+        if not result.data:
+            return {}
 
-        member_data = result.data[0]
-        return VaultMembership(
-            id=UUID(member_data["id"]),
-            user_id=UUID(member_data["user_id"]),
-            organization_id=UUID(member_data["organization_id"]),
-            role_id=UUID(member_data["role_id"]) if member_data.get("role_id") else None,
-            status=member_data.get("status", "active"),
-            metadata=member_data.get("metadata", {}),
-            joined_at=datetime.fromisoformat(member_data["joined_at"].replace("Z", "+00:00")),
-            updated_at=datetime.fromisoformat(member_data["updated_at"].replace("Z", "+00:00")),
-        )
+        memberships = [_row_to_membership(m) for m in result.data]
+        return {m.user_id: m for m in memberships}
 
     async def list_by_organization(
         self,
@@ -238,19 +346,51 @@ class MembershipManager:
         if not result.data:
             return []
 
-        return [
-            VaultMembership(
-                id=UUID(m["id"]),
-                user_id=UUID(m["user_id"]),
-                organization_id=UUID(m["organization_id"]),
-                role_id=UUID(m["role_id"]) if m.get("role_id") else None,
-                status=m.get("status", "active"),
-                metadata=m.get("metadata", {}),
-                joined_at=datetime.fromisoformat(m["joined_at"].replace("Z", "+00:00")),
-                updated_at=datetime.fromisoformat(m["updated_at"].replace("Z", "+00:00")),
-            )
-            for m in result.data
-        ]
+        return [_row_to_membership(m) for m in result.data]
+
+    async def list_by_organization_slug(
+        self,
+        slug: str,
+        limit: int = 50,
+        offset: int = 0,
+        status: Optional[str] = None,
+    ) -> List[VaultMembership]:
+        """
+        List all members of an organization identified by its slug.
+
+        Resolves the organization through an inner-join embed, so the lookup
+        and the membership listing happen in a single request.
+
+        Args:
+            slug: Organization slug
+            limit: Maximum number of memberships to return
+            offset: Number of memberships to skip
+            status: Optional status filter (active, suspended, pending)
+
+        Returns:
+            List of VaultMembership instances (empty if the organization
+            does not exist or has no matching members)
+
+        Example:
+            ```python
+            members = await vault.memberships.list_by_organization_slug("acme-corp")
+            ```
+        """
+        query = self.client.table("vault_memberships").select(
+            "*, vault_organizations!inner(slug)"
+        ).eq("vault_organizations.slug", slug)
+
+        if status:
+            query = query.eq("status", status)
+
+        query = query.range(offset, offset + limit - 1).order("joined_at")
+
+        result = await query.execute()
+
+        if not result.data:
+            return []
+
+        return [_row_to_membership(m) for m in result.data]
 
     async def list_by_user(
         self,
@@ -294,19 +434,7 @@ class MembershipManager:
         if not result.data:
             return []
 
-        return [
-            VaultMembership(
-                id=UUID(m["id"]),
-                user_id=UUID(m["user_id"]),
-                organization_id=UUID(m["organization_id"]),
-                role_id=UUID(m["role_id"]) if m.get("role_id") else None,
-                status=m.get("status", "active"),
-                metadata=m.get("metadata", {}),
-                joined_at=datetime.fromisoformat(m["joined_at"].replace("Z", "+00:00")),
-                updated_at=datetime.fromisoformat(m["updated_at"].replace("Z", "+00:00")),
-            )
-            for m in result.data
-        ]
+        return [_row_to_membership(m) for m in result.data]
 
     async def update(
         self,
@@ -371,16 +499,8 @@ class MembershipManager:
             raise ValueError(f"Membership not found: {membership_id}")
 
         member_data = result.data[0]
-        return VaultMembership(
-            id=UUID(member_data["id"]),
-            user_id=UUID(member_data["user_id"]),
-            organization_id=UUID(member_data["organization_id"]),
-            role_id=UUID(member_data["role_id"]) if member_data.get("role_id") else None,
-            status=member_data.get("status", "active"),
-            metadata=member_data.get("metadata", {}),
-            joined_at=datetime.fromisoformat(member_data["joined_at"].replace("Z", "+00:00")),
-            updated_at=datetime.fromisoformat(member_data["updated_at"].replace("Z", "+00:00")),
-        )
+        self.vault.permissions.invalidate_user(member_data["user_id"])
+        return _row_to_membership(member_data)
 
     async def delete(self, membership_id: UUID) -> None:
         """
@@ -406,6 +526,8 @@ class MembershipManager:
         if not result.data or len(result.data) == 0:
             raise ValueError(f"Membership not found: {membership_id}")
 
+        self.vault.permissions.invalidate_user(result.data[0]["user_id"])
+
     async def delete_by_user_and_org(
         self,
         user_id: UUID,
@@ -437,6 +559,8 @@ class MembershipManager:
                 f"Membership not found for user {user_id} in organization {organization_id}"
             )
 
+        self.vault.permissions.invalidate_user(user_id)
+
     async def count_by_organization(
         self,
         organization_id: UUID,
@@ -464,8 +588,9 @@ class MembershipManager:
             )
             ```
         """
+        # head=True: only the count header comes back, no rows
         query = self.client.table("vault_memberships").select(
-            "id", count="exact"
+            "id", count="exact", head=True
         ).eq("organization_id", str(organization_id))
 
         if status:
@@ -4,13 +4,29 @@ Permission management for Vault.
 Handles permission checking and validation for users within organizations.
 """
 
-from typing import TYPE_CHECKING, List, Optional
+import asyncio
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Union,
+)
 from uuid import UUID
 
-from .models import check_permission, check_permissions
+from ..utils.cache import TTLCache
+from .models import VaultRole, check_permission, check_permissions
 
 if TYPE_CHECKING:
     from ..client import Vault
+    from ..organizations.models import VaultMembership
+
+# Cache default that tells "not cached" apart from a cached None
+_MISSING = object()
 
 
 class PermissionManager:
@@ -38,6 +54,13 @@ class PermissionManager:
             permissions=["users:read", "users:write"]
         )
         ```
+
+    Memberships and roles looked up for checks are cached for
+    config.permission_cache_ttl seconds; lookups that find nothing are
+    cached for config.permission_negative_cache_ttl. Changes made through
+    vault.memberships and vault.roles invalidate the cache; call
+    invalidate_user() or invalidate_role() after changing them any other way.
+    Concurrent checks that miss the cache share a single lookup.
     """
 
     def __init__(self, vault: "Vault") -> None:
@@ -50,6 +73,120 @@ class PermissionManager:
         self.vault = vault
         self.client = vault.client
 
+        ttl = vault.config.permission_cache_ttl
+        self._negative_ttl = min(ttl, vault.config.permission_negative_cache_ttl)
+        self._memberships = TTLCache(ttl=ttl)
+        self._roles = TTLCache(ttl=ttl)
+
+        # Lookups in progress, keyed by (cache, key)
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+
+    def invalidate_user(self, user_id: Union[UUID, str]) -> None:
+        """
+        Drop cached memberships for a user.
+
+        Args:
+            user_id: User UUID
+        """
+        user_key = str(user_id)
+        self._memberships.discard_where(lambda key: key[0] == user_key)
+        for pending_key in list(self._inflight):
+            cache, key = pending_key
+            if cache is self._memberships and key[0] == user_key:
+                del self._inflight[pending_key]
+
+    def invalidate_role(self, role_id: Union[UUID, str]) -> None:
+        """
+        Drop a cached role.
+
+        Args:
+            role_id: Role UUID
+        """
+        self._roles.pop(str(role_id))
+        self._inflight.pop((self._roles, str(role_id)), None)
+
+    def clear_cache(self) -> None:
+        """Drop all cached memberships and roles."""
+        self._memberships.clear()
+        self._roles.clear()
+        self._inflight.clear()
+
+    async def _cached(
+        self,
+        cache: TTLCache,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Get a value from a cache, fetching it once on a miss.
+
+        Concurrent callers missing the same key await one fetch. Entries
+        invalidated while their fetch is running aren't written back.
+        """
+        value = cache.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        pending_key = (cache, key)
+        pending = self._inflight.get(pending_key)
+        if pending is None:
+            pending = asyncio.ensure_future(fetch())
+            self._inflight[pending_key] = pending
+
+            def done(task: asyncio.Future) -> None:
+                if self._inflight.get(pending_key) is not task:
+                    return
+                del self._inflight[pending_key]
+                if not task.cancelled() and task.exception() is None:
+                    value = task.result()
+                    cache.set(
+                        key,
+                        value,
+                        ttl=None if value is not None else self._negative_ttl,
+                    )
+
+            pending.add_done_callback(done)
+
+        # Shield so one caller being cancelled doesn't cancel the others' lookup
+        return await asyncio.shield(pending)
+
+    async def _get_membership(
+        self,
+        user_id: UUID,
+        organization_id: UUID,
+    ) -> Optional["VaultMembership"]:
+        return await self._cached(
+            self._memberships,
+            (str(user_id), str(organization_id)),
+            lambda: self.vault.memberships.get_by_user_and_org(
+                user_id=user_id,
+                organization_id=organization_id,
+            ),
+        )
+
+    async def _get_role(self, role_id: UUID) -> Optional[VaultRole]:
+        return await self._cached(
+            self._roles,
+            str(role_id),
+            lambda: self.vault.roles.get(role_id),
+        )
+
+    async def _get_member_role(
+        self,
+        user_id: UUID,
+        organization_id: UUID,
+    ) -> Optional[VaultRole]:
+        """Get the role of a user's active membership, if any."""
+        membership = await self._get_membership(user_id, organization_id)
+
+        if not membership or membership.status != "active":
+            return None
+
+        if not membership.role_id:
+            return None
+
+        return await self._get_role(membership.role_id)
+
     async def get_user_permissions(
         self,
         user_id: UUID,
@@ -76,28 +213,13 @@ class PermissionManager:
             # ["posts:read", "posts:write", "comments:*"]
             ```
         """
-        # Get the user's membership in this organization
-        membership = await self.vault.memberships.get_by_user_and_org(
-            user_id=user_id,
-            organization_id=organization_id,
-        )
-
-        if not membership:
-            return []
-
-        if membership.status != "active":
-            return []
-
-        if not membership.role_id:
-            return []
-
-        # Get the role
-        role = await self.vault.roles.get(membership.role_id)
+        role = await self._get_member_role(user_id, organization_id)
 
         if not role:
             return []
 
-        return role.permissions
+        # Copy so callers can't modify the cached role
+        return list(role.permissions)
 
     async def check(
         self,
@@ -215,20 +337,7 @@ class PermissionManager:
                 pass
             ```
         """
-        # Get the user's membership
-        membership = await self.vault.memberships.get_by_user_and_org(
-            user_id=user_id,
-            organization_id=organization_id,
-        )
-
-        if not membership or membership.status != "active":
-            return False
-
-        if not membership.role_id:
-            return False
-
-        # Get the role
-        role = await self.vault.roles.get(membership.role_id)
+        role = await self._get_member_role(user_id, organization_id)
 
         if not role:
             return False
@@ -262,27 +371,83 @@ class PermissionManager:
                 pass
             ```
         """
-        # Get the user's membership
-        membership = await self.vault.memberships.get_by_user_and_org(
-            user_id=user_id,
-            organization_id=organization_id,
-        )
+        role = await self._get_member_role(user_id, organization_id)
+
+        if not role:
+            return False
+
+        # Case-insensitive comparison
+        role_name_lower = role.name.lower()
+        return any(name.lower() == role_name_lower for name in role_names)
+
+    async def check_access(
+        self,
+        user_id: UUID,
+        organization_id: UUID,
+        *,
+        permissions: Optional[List[str]] = None,
+        require_all: bool = True,
+        roles: Optional[List[str]] = None,
+        all_roles: bool = False,
+    ) -> bool:
+        """
+        Check membership, permissions and roles together.
+
+        Resolves the user's membership and role once for all conditions,
+        instead of once per check_* call.
+
+        Args:
+            user_id: User UUID
+            organization_id: Organization UUID
+            permissions: Permission strings to check (optional)
+            require_all: If True, all permissions required; if False, any one
+            roles: Role names to check (optional, case-insensitive)
+            all_roles: If True, the user must hold every listed role
+
+        Returns:
+            True if the user is an active member and meets every condition
+
+        Example:
+            ```python
+            if await vault.permissions.check_access(
+                user.id, org.id,
+                permissions=["posts:write"],
+                roles=["Owner", "Admin", "Editor"],
+            ):
+                # Active member with posts:write and one of the roles
+                pass
+            ```
+        """
+        membership = await self._get_membership(user_id, organization_id)
 
         if not membership or membership.status != "active":
             return False
 
+        if not permissions and not roles:
+            return True
+
         if not membership.role_id:
             return False
 
-        # Get the role
-        role = await self.vault.roles.get(membership.role_id)
+        role = await self._get_role(membership.role_id)
 
         if not role:
             return False
 
-        # Case-insensitive comparison
-        role_name_lower = role.name.lower()
-        return any(name.lower() == role_name_lower for name in role_names)
+        if permissions and not check_permissions(
+            role.permissions, permissions, require_all=require_all
+        ):
+            return False
+
+        if roles:
+            # A membership has a single role, so "all roles" only holds when
+            # every listed name is that role
+            role_name_lower = role.name.lower()
+            matches = [name.lower() == role_name_lower for name in roles]
+            if not (all(matches) if all_roles else any(matches)):
+                return False
+
+        return True
 
     async def get_role_permissions(self, role_id: UUID) -> List[str]:
         """
@@ -299,12 +464,12 @@ class PermissionManager:
             perms = await vault.permissions.get_role_permissions(role_id)
             ```
         """
-        role = await self.vault.roles.get(role_id)
+        role = await self._get_role(role_id)
 
         if not role:
             return []
 
-        return role.permissions
+        return list(role.permissions)
 
     async def is_member(
         self,
@@ -328,10 +493,7 @@ class PermissionManager:
                 pass
             ```
         """
-        membership = await self.vault.memberships.get_by_user_and_org(
-            user_id=user_id,
-            organization_id=organization_id,
-        )
+        membership = await self._get_membership(user_id, organization_id)
 
         return membership is not None and membership.status == "active"
 
@@ -5,7 +5,7 @@ Handles CRUD operations for roles in the vault_roles table.
 """
 
 from datetime import datetime
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, AsyncIterator, List, Optional
 from uuid import UUID
 
 from .models import (
@@ -264,6 +264,7 @@ class RoleManager:
         limit: int = 50,
         offset: int = 0,
         include_system: bool = True,
+        system_only: bool = False,
     ) -> List[VaultRole]:
         """
         List roles for an organization.
@@ -273,6 +274,7 @@ class RoleManager:
             limit: Maximum number of roles to return
             offset: Number of roles to skip
             include_system: If True, includes system roles (Owner, Admin)
+            system_only: If True, returns only system roles
 
         Returns:
             List of VaultRole instances
@@ -293,7 +295,9 @@ class RoleManager:
             "organization_id", str(organization_id)
         )
 
-        if not include_system:
+        if system_only:
+            query = query.eq("is_system", True)
+        elif not include_system:
             query = query.eq("is_system", False)
 
         query = query.range(offset, offset + limit - 1).order("created_at")
@@ -305,6 +309,53 @@ class RoleManager:
 
         return [self._parse_role(role) for role in result.data]
 
+    async def iter_by_organization(
+        self,
+        organization_id: UUID,
+        limit: int = 50,
+        offset: int = 0,
+        include_system: bool = True,
+        page_size: int = 100,
+    ) -> AsyncIterator[VaultRole]:
+        """
+        Iterate over roles for an organization, fetching them a page at a time.
+
+        Roles are yielded as each page arrives, so callers can start
+        processing before the whole range has been fetched.
+
+        Args:
+            organization_id: Organization UUID
+            limit: Maximum number of roles to yield
+            offset: Number of roles to skip
+            include_system: If True, includes system roles (Owner, Admin)
+            page_size: Number of roles to fetch per request
+
+        Yields:
+            VaultRole instances
+
+        Example:
+            ```python
+            async for role in vault.roles.iter_by_organization(org.id, limit=500):
+                print(role.name)
+            ```
+        """
+        remaining = limit
+        while remaining > 0:
+            batch = min(page_size, remaining)
+            page = await self.list_by_organization(
+                organization_id,
+                limit=batch,
+                offset=offset,
+                include_system=include_system,
+            )
+            for role in page:
+                yield role
+
+            if len(page) < batch:
+                return
+            remaining -= batch
+            offset += batch
+
     async def update(
         self,
         role_id: UUID,
@@ -380,6 +431,7 @@ class RoleManager:
         if not result.data or len(result.data) == 0:
             raise ValueError(f"Role not found: {role_id}")
 
+        self.vault.permissions.invalidate_role(role_id)
         return self._parse_role(result.data[0])
 
     async def delete(self, role_id: UUID) -> None:
@@ -416,6 +468,8 @@ class RoleManager:
         if not result.data or len(result.data) == 0:
             raise ValueError(f"Role not found: {role_id}")
 
+        self.vault.permissions.invalidate_role(role_id)
+
     async def add_permissions(self, role_id: UUID, permissions: List[str]) -> VaultRole:
         """
         Add permissions to a role.
@@ -0,0 +1,100 @@
+"""
+In-process caching helpers.
+
+Provides a small TTL + LRU cache used to avoid repeating Supabase lookups
+(permission checks, token validation) on hot request paths.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Bounded mapping whose entries expire after a time-to-live.
+
+    Least recently used entries are evicted once maxsize is reached. Not
+    thread-safe; meant for use from a single event loop.
+
+    Example:
+        ```python
+        cache = TTLCache(ttl=30)
+        cache.set(("user", "org"), membership)
+        membership = cache.get(("user", "org"))  # None once expired
+        ```
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 4096) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Default seconds an entry stays valid (0 disables caching)
+            maxsize: Maximum number of entries
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+            default: Returned if the key is missing or expired
+
+        Returns:
+            Cached value or default
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return default
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Cache a value.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Seconds until the entry expires (defaults to the cache TTL)
+        """
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """Remove an entry if present."""
+        self._entries.pop(key, None)
+
+    def discard_where(self, predicate: Callable[[Hashable], bool]) -> None:
+        """
+        Remove every entry whose key matches a predicate.
+
+        Args:
+            predicate: Called with each key; entries it returns True for are removed
+        """
+        for key in [key for key in self._entries if predicate(key)]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
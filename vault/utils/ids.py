@@ -0,0 +1,25 @@
+"""
+Identifier helpers.
+"""
+
+import functools
+from uuid import UUID
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_uuid(value: str) -> UUID:
+    """
+    Parse a UUID string, caching the result.
+
+    The same organization IDs arrive on every request, so each is parsed once.
+
+    Args:
+        value: UUID string
+
+    Returns:
+        Parsed UUID
+
+    Raises:
+        ValueError: If the value is not a valid UUID
+    """
+    return UUID(value)
@@ -13,14 +13,27 @@ Source references:
 - supabase_auth._async.gotrue_client: venv/lib/python3.14/site-packages/supabase_auth/_async/gotrue_client.py
 """
 
-from typing import Optional
+import asyncio
+import weakref
+from typing import Dict, Optional
 
+import httpx
 from supabase import AsyncClient, create_client
 from supabase.lib.client_options import AsyncClientOptions
 from supabase_auth import AsyncMemoryStorage
 
 from ..config import VaultConfig
 
+HTTP_TIMEOUT = 120
+HTTP_CONNECT_TIMEOUT = 10
+
+# Clients created per event loop, keyed by serialized config. The httpx
+# connection pool belongs to the loop that opened it, so clients are never
+# shared across loops and are dropped along with their loop.
+_client_pool: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, VaultSupabaseClient]]" = (
+    weakref.WeakKeyDictionary()
+)
+
 
 class VaultSupabaseClient:
     """
@@ -70,6 +83,9 @@ class VaultSupabaseClient:
         Wraps: supabase._async.client.AsyncClient.create
         Source: venv/lib/python3.14/site-packages/supabase/_async/client.py
 
+        Repeat calls with an identical configuration on the same event loop
+        return the same client, so its warm connection pool is reused.
+
         Args:
             config: Vault configuration with Supabase credentials
 
@@ -85,6 +101,16 @@ class VaultSupabaseClient:
             client = await VaultSupabaseClient.create(config)
             ```
         """
+        # Open connections reference their loop, so closed loops are pruned here
+        for closed_loop in [loop for loop in _client_pool if loop.is_closed()]:
+            del _client_pool[closed_loop]
+
+        loop_clients = _client_pool.setdefault(asyncio.get_running_loop(), {})
+        key = config.model_dump_json()
+        pooled = loop_clients.get(key)
+        if pooled is not None:
+            return pooled
+
         # Configure client options
         options = AsyncClientOptions(
             schema=config.db_schema,
@@ -94,6 +120,25 @@ class VaultSupabaseClient:
                 "apikey": config.supabase_key,
                 "Authorization": f"Bearer {config.supabase_key}",
             },
+            # One connection pool shared by the PostgREST, auth, storage and
+            # functions clients. HTTP/2 lets concurrent requests (asyncio.gather)
+            # multiplex over one connection instead of each paying for its own
+            # TCP+TLS handshake. The transport is built explicitly so failed
+            # connection attempts are retried; with a custom transport the
+            # pool settings must be given to it, not to the AsyncClient.
+            httpx_client=httpx.AsyncClient(
+                transport=httpx.AsyncHTTPTransport(
+                    http2=config.http2,
+                    limits=httpx.Limits(
+                        max_connections=config.http_max_connections,
+                        max_keepalive_connections=config.http_max_keepalive_connections,
+                        keepalive_expiry=config.http_keepalive_expiry,
+                    ),
+                    retries=config.http_connect_retries,
+                ),
+                timeout=httpx.Timeout(HTTP_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT),
+                follow_redirects=True,
+            ),
         )
 
         # Create the async client
@@ -105,7 +150,8 @@ class VaultSupabaseClient:
             options=options,
         )
 
-        return cls(config=config, client=client)
+        loop_clients[key] = vault_client = cls(config=config, client=client)
+        return vault_client
 
     @property
     def auth(self):
@@ -179,6 +225,30 @@ class VaultSupabaseClient:
         """
         return self._client.table(table_name)
 
+    def rpc(self, fn: str, params: Optional[dict] = None):
+        """
+        Call a Postgres function through PostgREST.
+
+        Wraps: supabase._async.client.AsyncClient.rpc
+        Source: venv/lib/python3.14/site-packages/supabase/_async/client.py
+
+        Args:
+            fn: Name of the function (e.g., "vault_add_member")
+            params: Named arguments passed to the function
+
+        Returns:
+            AsyncRPCFilterRequestBuilder; call .execute() to run it
+
+        Example:
+            ```python
+            result = await client.rpc(
+                "vault_add_member",
+                {"p_slug": "acme-corp", "p_email": "user@example.com"},
+            ).execute()
+            ```
+        """
+        return self._client.rpc(fn, params or {})
+
     def schema(self, schema: str):
         """
         Select a database schema.